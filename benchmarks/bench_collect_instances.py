@@ -0,0 +1,62 @@
+"""Scaling of the hierarchy expansion used by CollectInstances
+
+Generates synthetic DAG paths for a number of assemblies and times the
+parent expansion and the split of the batched descendant query between
+instances. This runs without Maya, only Pyblish is required.
+
+Usage:
+    $ python benchmarks/bench_collect_instances.py
+
+"""
+
+import lib
+
+from pyblish_magenta.lib import (
+    get_upstream_hierarchy,
+    split_by_assembly
+)
+
+SIZES = (10000, 100000, 1000000)
+
+# The list based expansion is quadratic, only run it where it finishes
+LEGACY_LIMIT = 10000
+
+
+def legacy_upstream_hierarchy(nodes):
+    """Expansion as done before, checking parents against a list"""
+    parents = []
+    for node in nodes:
+        hierarchy = node.split("|")
+        num = len(hierarchy)
+        for x in range(1, num-1):
+            parent = "|".join(hierarchy[:num-x])
+            if parent in parents:
+                break
+            else:
+                parents.append(parent)
+    return parents
+
+
+def run():
+    for size in SIZES:
+        paths = lib.generate_paths(size)
+        members = paths[::10]
+
+        print("%i DAG paths" % size)
+        if size <= LEGACY_LIMIT:
+            with lib.timer("  Upstream hierarchy (list)"):
+                legacy_upstream_hierarchy(members)
+
+        results = dict()
+        with lib.timer("  Upstream hierarchy (set)", results):
+            get_upstream_hierarchy(members)
+
+        with lib.timer("  Split by assembly", results):
+            split_by_assembly(paths)
+
+        total = sum(results.values())
+        print("  %.3f microseconds per path\n" % (total / size * 1e6))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,71 @@
+"""Counting and combining component ranges without flattening
+
+Compares the regular expression search per component, as previously
+used by the mesh validators, with `pyblish_magenta.components` for a
+mesh with a million vertices split over many ranges. Counting costs
+about the same, but comparing coverage of two component lists no longer
+requires flattening them. This runs without Maya.
+
+Usage:
+    $ python benchmarks/bench_components.py
+
+"""
+
+import re
+import random
+
+import lib
+
+from pyblish_magenta import components
+
+
+def len_flattened(components):
+    """Count as previously done by the mesh validators"""
+    n = 0
+    for c in components:
+        match = re.search("\[([0-9]+):([0-9]+)\]", c)
+        if match:
+            start, end = match.groups()
+            n += int(end) - int(start) + 1
+        else:
+            n += 1
+    return n
+
+
+def generate_components(vertices, ranges):
+    """Return `ranges` random non-overlapping vertex ranges"""
+    bounds = sorted(random.sample(range(vertices), ranges * 2))
+    return ["mesh.vtx[%i:%i]" % (start, end)
+            for start, end in zip(bounds[::2], bounds[1::2])]
+
+
+def run():
+    random.seed(0)
+    for ranges in (1000, 10000, 100000):
+        a = generate_components(1000000, ranges)
+        b = generate_components(1000000, ranges)
+
+        print("%i ranges" % ranges)
+        with lib.timer("  regex count"):
+            len_flattened(a)
+
+        with lib.timer("  components.count"):
+            components.count(a)
+
+        a = components.parse(a)[("mesh", "vtx")]
+        b = components.parse(b)[("mesh", "vtx")]
+
+        with lib.timer("  union"):
+            a | b
+        with lib.timer("  intersection"):
+            a & b
+        with lib.timer("  difference"):
+            a - b
+
+        with lib.timer("  flattened set difference"):
+            set(a) - set(b)
+        print("")
+
+
+if __name__ == "__main__":
+    run()
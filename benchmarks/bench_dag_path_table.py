@@ -0,0 +1,85 @@
+"""Memory and set operations of DagPathTable versus plain lists
+
+Simulates a layout scene of `size` DAG paths with overlapping instances
+that each hold a large share of the scene. Every mode runs in its own
+process so the peak resident memory can be compared. This runs without
+Maya, only Pyblish is required.
+
+Usage:
+    $ python benchmarks/bench_dag_path_table.py 1000000
+
+"""
+
+import sys
+import resource
+import subprocess
+
+import lib
+
+from pyblish_magenta.lib import DagPathTable
+
+INSTANCES = 20
+
+
+def fresh(path):
+    """Return a copy of `path`, like strings returned by `maya.cmds`"""
+    return path[:-1] + path[-1]
+
+
+def instance_paths(paths, i):
+    """Return the paths of the i-th instance, half of the scene"""
+    offset = len(paths) // INSTANCES * i
+    return paths[offset:] + paths[:offset - len(paths) // 2]
+
+
+def run_lists(paths):
+    instances = [[fresh(p) for p in instance_paths(paths, i)]
+                 for i in range(INSTANCES)]
+
+    probe = paths[len(paths) // 3]
+    with lib.timer("lists: 100x `in`"):
+        for _ in range(100):
+            probe in instances[0]
+
+    with lib.timer("lists: union"):
+        set(instances[0]) | set(instances[1])
+
+    with lib.timer("lists: difference"):
+        set(instances[0]) - set(instances[1])
+
+
+def run_table(paths):
+    table = DagPathTable()
+    instances = list()
+    for i in range(INSTANCES):
+        members = table.membership(fresh(p) for p in instance_paths(paths, i))
+        instances.append((list(members), members))
+
+    probe = paths[len(paths) // 3]
+    with lib.timer("table: 100x `in`"):
+        for _ in range(100):
+            probe in instances[0][1]
+
+    with lib.timer("table: union"):
+        instances[0][1] | instances[1][1]
+
+    with lib.timer("table: difference"):
+        instances[0][1] - instances[1][1]
+
+
+def run(mode, size):
+    paths = lib.generate_paths(size)
+    {"lists": run_lists, "table": run_table}[mode](paths)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print("%s: peak RSS %.1f MB\n" % (mode, peak / 1024.0))
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    if len(sys.argv) > 2:
+        run(sys.argv[2], size)
+    else:
+        for mode in ("lists", "table"):
+            subprocess.check_call([sys.executable, __file__, str(size), mode])
@@ -0,0 +1,82 @@
+"""Compare Alembic exports across evaluation modes
+
+Builds `count` deformed, animated spheres and exports them over 100
+frames with the evaluation manager in each mode, with and without the
+extraction context (undo disabled, refresh suspended). Requires Maya
+2016 or later.
+
+Usage:
+    $ mayapy benchmarks/bench_evaluation.py 50
+
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+import lib
+
+FRAMES = 100
+
+
+def build_scene(count):
+    from maya import cmds
+
+    for i in range(count):
+        sphere = cmds.polySphere(name="sphere%i" % i,
+                                 subdivisionsX=40,
+                                 subdivisionsY=40)[0]
+        cmds.move(i * 3, 0, 0, sphere)
+
+        bend = cmds.nonLinear(sphere, type="bend")[0]
+        cmds.setKeyframe(bend, attribute="curvature", time=1, value=0)
+        cmds.setKeyframe(bend, attribute="curvature", time=FRAMES,
+                         value=90)
+        cmds.setKeyframe(sphere, attribute="rotateY", time=1, value=0)
+        cmds.setKeyframe(sphere, attribute="rotateY", time=FRAMES,
+                         value=360)
+
+    return cmds.ls("sphere*", type="transform", long=True)
+
+
+def run(count):
+    lib.initialize_maya()
+
+    from maya import cmds
+    from pyblish_magenta import evaluation
+
+    cmds.loadPlugin("AbcExport", quiet=True)
+    roots = build_scene(count)
+
+    directory = tempfile.mkdtemp()
+    job = " ".join("-root %s" % root for root in roots)
+    job += " -frameRange 1 %i -uvWrite -dataFormat ogawa" % FRAMES
+
+    def export(label):
+        path = os.path.join(directory, label + ".abc").replace("\\", "/")
+        cmds.AbcExport(j=job + ' -file "%s"' % path)
+
+    try:
+        original = evaluation.get_mode()
+        for mode in (evaluation.DG, evaluation.SERIAL, evaluation.PARALLEL):
+            evaluation.set_mode(mode)
+            with lib.timer("%s (%i spheres)" % (mode, count)):
+                export(mode)
+
+            with lib.timer("%s, extraction context" % mode):
+                with evaluation.extraction(mode=None):
+                    export(mode + "_context")
+
+        evaluation.set_mode(original)
+        print("Probed mode: %s" % evaluation.probe_mode())
+        with lib.timer("Probed, extraction context"):
+            with evaluation.extraction():
+                export("auto")
+
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
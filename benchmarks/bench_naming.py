@@ -0,0 +1,78 @@
+"""Check naming conventions of 100k nodes, per node versus per rule table
+
+Compares the checks as previously done by ValidateTransformNamingSuffix,
+ValidateShapeDefaultNames, ValidateShapeNoRename and ValidateNoNamespace,
+one node and one freshly built regular expression at a time, with all
+rules of `pyblish_magenta.naming` evaluated in a single pass. The scene
+queries the validators made per node are not included, so this only
+measures the cost of the checks themselves. This runs without Maya.
+
+Usage:
+    $ python benchmarks/bench_naming.py 100000
+
+"""
+
+import re
+import sys
+
+import lib
+
+from pyblish_magenta import naming
+
+
+def build_rows(count):
+    """Return columns of `count` nodes, half transforms and half shapes"""
+    rows = list()
+    for index, path in enumerate(lib.generate_paths(count // 2)):
+        if index % 100 == 0:
+            path = path.rsplit("|", 1)[0] + "|pCube1"
+
+        rows.append(naming.columns(path, "transform", "transform", "mesh"))
+        shape = path + "|" + naming.short_name(path) + "Shape"
+        rows.append(naming.columns(shape, "mesh", "shape"))
+    return rows
+
+
+def check_per_node(rows):
+    """Check names as previously done by the validators"""
+    primitives = re.compile("({0})[0-9]?$".format(
+        "|".join(naming.PRIMITIVE_NAMES)))
+
+    invalid = dict((rule.name, list()) for rule in naming.RULES)
+    for row in rows:
+        node = row["node"]
+        if row["kind"] == "transform":
+            suffixes = naming.SUFFIX_NAMING_TABLE.get(row["shape"] or None)
+            if suffixes and not any(node.endswith(s) for s in suffixes):
+                invalid["suffix"].append(node)
+
+            if primitives.match(naming.short_name(node)):
+                invalid["primitiveName"].append(node)
+
+        elif row["kind"] == "shape":
+            transform = naming.short_name(node.rsplit("|", 1)[0])
+            pattern = "^{0}[0-9]*Shape[0-9]*$".format(
+                transform.rstrip("0123456789"))
+            if not re.compile(pattern).match(naming.short_name(node)):
+                invalid["defaultShapeName"].append(node)
+
+        if node.rsplit("|")[-1].rpartition(":")[0]:
+            invalid["namespace"].append(node)
+
+    return invalid
+
+
+def run(count):
+    rows = build_rows(count)
+
+    with lib.timer("Per node (%i nodes)" % len(rows)):
+        expected = check_per_node(rows)
+
+    with lib.timer("Rule table (%i nodes)" % len(rows)):
+        invalid = naming.check(rows)
+
+    assert invalid == expected, "Results differ"
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,89 @@
+"""Count the `maya.cmds` calls saved by the shared SceneIndex
+
+Builds a model instance of `count` meshes and runs the validators that
+read from the index, once with every plug-in building an index of its
+own and once sharing the index built by CollectSceneIndex.
+
+Usage:
+    $ mayapy benchmarks/bench_scene_index.py 5000
+
+"""
+
+import sys
+
+import lib
+
+VALIDATORS = (
+    "ValidateModelContent",
+    "ValidateMeshHasUVs",
+    "ValidateNoNullTransforms",
+    "ValidateTransformNamingSuffix",
+    "ValidateShapeRenderStats",
+    "ValidateNodeNoGhosting",
+    "ValidateMeshNoNegativeScale",
+    "ValidateShapeDefaultNames",
+    "ValidateTransformZero",
+)
+
+
+def build_scene(count):
+    from maya import cmds
+
+    group = cmds.group(empty=True, name="ben_GRP")
+    for i in range(count):
+        mesh = cmds.polyCube(name="cube%i_GEO" % i,
+                             constructionHistory=False)[0]
+        cmds.parent(mesh, group)
+
+    cmds.sets(group, name="ben_INST")
+    cmds.addAttr("ben_INST", longName="family", dataType="string")
+    cmds.setAttr("ben_INST.family", "model", type="string")
+
+
+def collect():
+    import pyblish.api
+
+    CollectInstances, = lib.discover("CollectInstances")
+    context = pyblish.api.Context()
+    CollectInstances().process(context)
+    return context[0]
+
+
+def run(count):
+    lib.initialize_maya()
+
+    from pyblish_magenta.lib import get_dag_paths
+    build_scene(count)
+
+    CollectSceneIndex, = lib.discover("CollectSceneIndex")
+    validators = lib.discover(*VALIDATORS)
+
+    without = lib.Counter()
+    instance = collect()
+    with lib.timer("Without index (%i meshes)" % count):
+        with lib.counted_commands(without):
+            for validator in validators:
+                instance.data.pop("sceneIndex", None)
+                validator.get_invalid(instance)
+
+    with_index = lib.Counter()
+    instance = collect()
+    with lib.timer("With index (%i meshes)" % count):
+        with lib.counted_commands(with_index):
+            # Indexed on first access otherwise, see CollectSceneIndex
+            get_dag_paths(instance)
+            CollectSceneIndex().process(instance)
+            for validator in validators:
+                validator.get_invalid(instance)
+
+    print("")
+    print("%-30s %10s %10s" % ("Command", "Without", "With"))
+    for name in sorted(set(without) | set(with_index)):
+        print("%-30s %10i %10i" % (name, without[name], with_index[name]))
+    print("%-30s %10i %10i" % ("Total",
+                               sum(without.values()),
+                               sum(with_index.values())))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,58 @@
+"""Compare per-node `xform` queries against the bulk TransformTable
+
+Builds `count` transforms, a few of which are moved or negatively
+scaled, and checks them for identity matrices and negative scale
+both ways.
+
+Usage:
+    $ mayapy benchmarks/bench_transforms.py 80000
+
+"""
+
+import sys
+
+import lib
+
+
+def build_scene(count):
+    from maya import cmds
+
+    nodes = list()
+    for i in range(count):
+        nodes.append(cmds.createNode("transform", name="node%i" % i))
+
+    for node in nodes[::1000]:
+        cmds.setAttr(node + ".translateX", 1)
+        cmds.setAttr(node + ".scaleY", -1)
+
+    return cmds.ls(nodes, long=True)
+
+
+def run(count):
+    lib.initialize_maya()
+    nodes = build_scene(count)
+
+    from maya import cmds
+    from pyblish_magenta import transforms
+
+    with lib.timer("xform per node (%i)" % count):
+        identity = list(transforms.IDENTITY)
+        moved = list()
+        for node in nodes:
+            matrix = cmds.xform(node, query=True, matrix=True,
+                                objectSpace=True)
+            if not all(abs(a - b) < 1e-30 for a, b in zip(identity, matrix)):
+                moved.append(node)
+        negative = [node for node in nodes
+                    if any(x < 0 for x in cmds.getAttr(node + ".scale")[0])]
+
+    with lib.timer("Read TransformTable (%i)" % count):
+        table = transforms.TransformTable(nodes)
+
+    with lib.timer("Check TransformTable (%i)" % count):
+        assert table.deviating("matrix", transforms.IDENTITY, 1e-30) == moved
+        assert table.negative("scale") == negative
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 80000)
@@ -0,0 +1,100 @@
+"""Shared helpers for the benchmarks in this directory
+
+Benchmarks that need Maya are run with `mayapy`, e.g.
+
+    $ mayapy benchmarks/bench_scene_index.py
+
+"""
+
+import os
+import sys
+import time
+import functools
+import contextlib
+import collections
+
+# Expose Pyblish Magenta to PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@contextlib.contextmanager
+def timer(label, results=None):
+    """Print (and optionally store) the time spent within the context"""
+    start = time.time()
+    yield
+    duration = time.time() - start
+    print("%-40s %.4fs" % (label, duration))
+    if results is not None:
+        results[label] = duration
+
+
+@contextlib.contextmanager
+def counted_commands(counter):
+    """Count calls made to `maya.cmds` within the context
+
+    Arguments:
+        counter (collections.Counter): Incremented per command name
+
+    """
+
+    from maya import cmds
+
+    originals = dict()
+    for name in dir(cmds):
+        func = getattr(cmds, name)
+        if name.startswith("_") or not callable(func):
+            continue
+
+        def wrapper(*args, **kwargs):
+            name, func = kwargs.pop("__command")
+            counter[name] += 1
+            return func(*args, **kwargs)
+
+        originals[name] = func
+        setattr(cmds, name, functools.partial(wrapper,
+                                              __command=(name, func)))
+
+    try:
+        yield counter
+    finally:
+        for name, func in originals.items():
+            setattr(cmds, name, func)
+
+
+def generate_paths(count, assemblies=50, depth=6, branches=4):
+    """Return `count` DAG paths spread over `assemblies` root nodes"""
+    paths = list()
+    per_assembly = max(1, count // assemblies)
+    for a in range(assemblies):
+        root = "|asset%i_GRP" % a
+        paths.append(root)
+        for i in range(per_assembly - 1):
+            segments = [root]
+            value = i
+            for level in range(depth):
+                segments.append("node%i_L%i" % (value % branches, level))
+                value //= branches
+            paths.append("|".join(segments) + "_%i_GEO" % i)
+    return paths[:count]
+
+
+def initialize_maya():
+    """Start a standalone Maya session for the benchmark"""
+    import maya.standalone
+    maya.standalone.initialize()
+
+    from maya import cmds
+    cmds.file(new=True, force=True)
+
+
+def discover(*names):
+    """Return Pyblish Magenta plug-ins by name"""
+    import pyblish.api
+    import pyblish_magenta.api
+
+    pyblish_magenta.api.register_plugins()
+    plugins = dict((p.__name__, p) for p in pyblish.api.discover())
+    return [plugins[name] for name in names]
+
+
+Counter = collections.Counter
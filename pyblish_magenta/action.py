@@ -1,6 +1,8 @@
 
 import pyblish.api
 
+from . import lib
+
 
 def _get_errored_instances_from_context(context):
 
@@ -43,6 +45,10 @@ class RepairAction(pyblish.api.Action):
         for instance in instances:
             plugin.repair(instance)
 
+            # The repair may have renamed or deleted nodes, read the
+            # membership and everything computed from it again
+            lib.invalidate_membership(instance)
+
 
 class SelectInvalidAction(pyblish.api.Action):
     """Select invalid nodes in Maya when plug-in failed.
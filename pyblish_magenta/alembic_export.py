@@ -0,0 +1,312 @@
+"""Export several Alembic jobs in a single pass over their frame range
+
+AbcExport accepts several jobs per call, each with its own roots,
+options and output file, and evaluates the scene once per frame for all
+of them. Jobs are grouped by overlapping frame ranges, such that a
+single export never evaluates frames none of its jobs need.
+
+Example:
+    >>> jobs = [Job("hero", "/hero.abc", "-frameRange 1 100", (1, 100)),
+    ...         Job("crowd", "/crowd.abc", "-frameRange 50 120", (50, 120)),
+    ...         Job("insert", "/insert.abc", "-frameRange 500 510",
+    ...             (500, 510)),
+    ...         Job("prop", "/prop.abc", "")]
+    >>> [[job.name for job in group]
+    ...  for group in group_by_frame_range(jobs)]
+    [['hero', 'crowd'], ['insert'], ['prop']]
+    >>> jobs[0].job_string()
+    '-frameRange 1 100 -file "/hero.abc"'
+
+Exports may be monitored, recording the wall time of each frame and the
+size of the output file as it is written, through per-frame and post-job
+callbacks of AbcExport.
+
+"""
+
+import os
+import time
+
+# Monitors of running exports, by key, for the callbacks of AbcExport
+_monitors = dict()
+
+
+class Job(object):
+    """A single Alembic export of an AbcExport call
+
+    Arguments:
+        name (str): Name of the job, e.g. of its instance
+        path (str): Output file, with forward slashes
+        options (str): Job arguments, without the output file
+        frame_range (tuple, optional): Start and end frame, None
+            for the current frame
+        callbacks (dict, optional): Python callbacks of the job, by
+            flag, e.g. "pythonPerFrameCallback"
+
+    """
+
+    def __init__(self, name, path, options, frame_range=None,
+                 callbacks=None):
+        self.name = name
+        self.path = path
+        self.options = options
+        self.frame_range = frame_range
+        self.callbacks = callbacks or dict()
+
+    def __repr__(self):
+        return "Job(%r -> %r)" % (self.name, self.path)
+
+    def job_string(self, callbacks=None):
+        """Return the job argument of AbcExport
+
+        Arguments:
+            callbacks (dict, optional): Python callbacks by flag, run
+                before the callbacks of the job
+
+        Example:
+            >>> job = Job("hero", "/hero.abc", "-uvWrite",
+            ...           callbacks={"pythonPerFrameCallback": "b()"})
+            >>> job.job_string({"pythonPerFrameCallback": "a()"})
+            '-uvWrite -pythonPerFrameCallback a();b() -file "/hero.abc"'
+
+        """
+
+        args = [self.options]
+        for flag in ("pythonPerFrameCallback", "pythonPostJobCallback"):
+            chain = [callback for callback in ((callbacks or {}).get(flag),
+                                               self.callbacks.get(flag))
+                     if callback]
+            if chain:
+                args.append("-{0} {1}".format(flag, ";".join(chain)))
+        args.append('-file "{0}"'.format(self.path))
+
+        return " ".join(arg for arg in args if arg)
+
+
+def group_by_frame_range(jobs):
+    """Return `jobs` grouped by overlapping, or adjacent, frame ranges
+
+    Jobs without a frame range are exported at the current frame,
+    together in a group of their own.
+
+    """
+
+    groups = list()
+    end = None
+
+    ranged = sorted((job for job in jobs if job.frame_range),
+                    key=lambda job: job.frame_range)
+    for job in ranged:
+        start, stop = job.frame_range
+        if groups and start <= end + 1:
+            groups[-1].append(job)
+            end = max(end, stop)
+        else:
+            groups.append([job])
+            end = stop
+
+    current = [job for job in jobs if not job.frame_range]
+    if current:
+        groups.append(current)
+
+    return groups
+
+
+def get_roots(nodes):
+    """Return the topmost of `nodes`, given by long names
+
+    Example:
+        >>> get_roots(["|a", "|a|b", "|a|b|c", "|d|e", "|d|e|f"])
+        ['|a', '|d|e']
+
+    """
+
+    nodes = set(nodes)
+    roots = list()
+    for node in sorted(nodes):
+        parts = node.split("|")
+        if any("|".join(parts[:i]) in nodes for i in range(2, len(parts))):
+            continue
+        roots.append(node)
+    return roots
+
+
+class JobStats(object):
+    """Statistics of a monitored job
+
+    Attributes:
+        frames (list): (frame, seconds, size) per exported frame, with
+            the size of the output file in bytes after the frame
+        stall (tuple): The first (frame, seconds) over the threshold
+            of the monitor, if any
+
+    """
+
+    def __init__(self, job):
+        self.job = job
+        self.frames = list()
+        self.stall = None
+        self.start = None
+        self.end = None
+        self._last = None
+
+    def time(self):
+        """Return the seconds taken by the job"""
+        end = self.end if self.end is not None else self._last
+        if self.start is None or end is None:
+            return 0.0
+        return end - self.start
+
+    def fps(self):
+        """Return the average frames per second"""
+        seconds = self.time()
+        return len(self.frames) / seconds if seconds else 0.0
+
+    def slowest(self, count=5):
+        """Return the `count` slowest (frame, seconds, size)"""
+        return sorted(self.frames, key=lambda frame: -frame[1])[:count]
+
+    def data(self):
+        """Return the statistics as JSON serializable dictionary"""
+        return {
+            "name": self.job.name,
+            "path": self.job.path,
+            "time": self.time(),
+            "fps": self.fps(),
+            "size": self.frames[-1][2] if self.frames else 0,
+            "stall": list(self.stall) if self.stall else None,
+            "frames": [{"frame": frame, "seconds": seconds, "size": size}
+                       for frame, seconds, size in self.frames]
+        }
+
+
+class Monitor(object):
+    """Record per-frame statistics of the jobs of an export
+
+    The wall time of a frame is measured from the last callback of the
+    previous frame of the export, of any job, which includes evaluating
+    the scene and writing the jobs exported before it that frame. Jobs
+    starting halfway the frame range of the export thereby do not count
+    the frames before their range towards their first frame.
+
+    The first frame of the export also includes the time AbcExport takes
+    to prepare the jobs, and is never considered stalled.
+
+    Arguments:
+        jobs (list): Jobs of the export
+        stall_threshold (float, optional): Seconds after which a frame
+            is considered stalled, never when None
+
+    Example:
+        >>> job = Job("hero", os.devnull, "-frameRange 1 2")
+        >>> with Monitor([job], stall_threshold=0) as monitor:
+        ...     _frame(monitor.key, 0, 1.0)
+        ...     _frame(monitor.key, 0, 2.0)
+        ...     _done(monitor.key, 0)
+        >>> stats = monitor.stats[0]
+        >>> [frame for frame, _, _ in stats.frames], stats.stall[0]
+        ([1.0, 2.0], 2.0)
+
+    """
+
+    def __init__(self, jobs, stall_threshold=None):
+        self.jobs = list(jobs)
+        self.stall_threshold = stall_threshold
+        self.stats = [JobStats(job) for job in self.jobs]
+        self.key = id(self)
+
+        self._first = None
+        self._frame = None
+        self._frame_start = None
+        self._last = None
+
+    def __enter__(self):
+        _monitors[self.key] = self
+        now = time.time()
+        self._first = self._frame = None
+        self._last = now
+        for stats in self.stats:
+            stats.start = stats._last = now
+        return self
+
+    def __exit__(self, *args):
+        _monitors.pop(self.key, None)
+
+    def job_strings(self):
+        """Return the job arguments with the callbacks of this monitor"""
+        module = __name__.rsplit(".", 1)[-1]
+        strings = list()
+        for index, job in enumerate(self.jobs):
+            # Without spaces or quotes, as AbcExport splits jobs by spaces
+            call = "__import__('{0}').{1}.{{0}}({2},{3}{{1}})".format(
+                __name__, module, self.key, index)
+            strings.append(job.job_string({
+                "pythonPerFrameCallback": call.format("_frame", ",#FRAME#"),
+                "pythonPostJobCallback": call.format("_done", "")
+            }))
+        return strings
+
+    def frame(self, index, frame):
+        """Record exported `frame` of job at `index`"""
+        now = time.time()
+
+        if frame != self._frame:
+            # The first job of the frame, which was evaluated since the
+            # last callback of the previous frame
+            if self._frame is None:
+                self._first = frame
+            self._frame = frame
+            self._frame_start = self._last
+
+        stats = self.stats[index]
+        seconds = now - self._frame_start
+        stats._last = self._last = now
+
+        try:
+            size = os.path.getsize(stats.job.path)
+        except OSError:
+            size = 0
+
+        stats.frames.append((frame, seconds, size))
+
+        if (stats.stall is None and self.stall_threshold is not None and
+                frame != self._first and seconds > self.stall_threshold):
+            stats.stall = (frame, seconds)
+
+    def done(self, index):
+        """Record the end of job at `index`"""
+        self.stats[index].end = time.time()
+
+
+def _frame(key, index, frame):
+    """Per-frame callback of monitored jobs"""
+    monitor = _monitors.get(key)
+    if monitor is not None:
+        monitor.frame(index, frame)
+
+
+def _done(key, index):
+    """Post-job callback of monitored jobs"""
+    monitor = _monitors.get(key)
+    if monitor is not None:
+        monitor.done(index)
+
+
+def export(jobs, verbose=False, monitor=None):
+    """Export `jobs` in a single AbcExport call
+
+    Arguments:
+        jobs (list): Jobs to export
+        verbose (bool, optional): Print frame numbers while exporting
+        monitor (Monitor, optional): Monitor of `jobs`, recording
+            statistics of each frame
+
+    """
+
+    from maya import cmds
+
+    if monitor is None:
+        cmds.AbcExport(j=[job.job_string() for job in jobs], verbose=verbose)
+        return
+
+    with monitor:
+        cmds.AbcExport(j=monitor.job_strings(), verbose=verbose)
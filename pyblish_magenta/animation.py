@@ -0,0 +1,183 @@
+"""Animation curves of a scene and the nodes they drive
+
+All `animCurve` nodes are read in a single pass, recording the plug each
+curve drives, its amount of keys, whether its keys are all the same and
+whether it is driven by time (keyframes) or by another attribute (driven
+keys). Keyed nodes of an instance are then found by intersecting its
+members with the index, as opposed to a `keyframe` and `listConnections`
+query per instance. Constraints and expressions do not drive through
+animation curves and are not considered animation.
+
+Example:
+    >>> index = AnimationIndex([
+    ...     ("ball_translateY", "|ball_GEO.translateY", 2, False, False),
+    ...     ("ball_scaleX", "|ball_GEO.scaleX", 1, True, False),
+    ...     ("lid_rotateX", "|box_GEO|lid_GEO.rotateX", 3, False, True)])
+    >>> index.keyed_nodes(["|ball_GEO", "|box_GEO|lid_GEO", "|box_GEO"])
+    ['|ball_GEO']
+    >>> index.driven_nodes(["|box_GEO|lid_GEO"])
+    ['|box_GEO|lid_GEO']
+    >>> index.is_animated("|ball_GEO"), index.is_animated("|box_GEO")
+    (True, False)
+
+"""
+
+# Nodes passing on the value of an animation curve to the driven plug,
+# by prefix of their type: conversions, blends of keys and constraints
+# and the blends of animation layers, e.g. "animBlendNodeAdditiveRotation"
+PASSTHROUGH_TYPES = ("unitConversion", "blendWeighted", "pairBlend",
+                     "animBlendNode")
+
+
+class AnimCurve(object):
+    """A single animation curve
+
+    Attributes:
+        name (str): Name of the curve node
+        plug (str): Driven plug, as "{node}.{attribute}"
+        node (str): Driven node, long name for DAG nodes
+        keys (int): Amount of keys
+        static (bool): Whether all keys have the same value
+        driven (bool): Whether the curve is a driven key, as opposed
+            to keyframes in time
+
+    """
+
+    def __init__(self, name, plug, keys, static, driven):
+        self.name = name
+        self.plug = plug
+        self.node = plug.split(".", 1)[0]
+        self.keys = keys
+        self.static = static
+        self.driven = driven
+
+    def __repr__(self):
+        return "AnimCurve(%r -> %r)" % (self.name, self.plug)
+
+
+class AnimationIndex(object):
+    """Animation curves per driven node
+
+    Arguments:
+        curves (list): (name, plug, keys, static, driven) per curve,
+            see AnimCurve
+
+    """
+
+    def __init__(self, curves):
+        self.curves = [AnimCurve(*curve) for curve in curves]
+
+        self._curves = dict()
+        for curve in self.curves:
+            self._curves.setdefault(curve.node, list()).append(curve)
+
+        self.keyed = frozenset(curve.node for curve in self.curves
+                               if not curve.driven)
+        self.driven = frozenset(curve.node for curve in self.curves
+                                if curve.driven)
+        self.animated = frozenset(curve.node for curve in self.curves
+                                  if not curve.driven and not curve.static)
+
+    def __len__(self):
+        return len(self.curves)
+
+    def curves_of(self, node):
+        """Return the curves driving `node`"""
+        return list(self._curves.get(node, []))
+
+    def keyed_nodes(self, nodes):
+        """Return the nodes of `nodes` with keyframes"""
+        return sorted(self.keyed.intersection(nodes))
+
+    def driven_nodes(self, nodes):
+        """Return the nodes of `nodes` with driven keys"""
+        return sorted(self.driven.intersection(nodes))
+
+    def is_animated(self, node):
+        """Return whether the keyframes of `node` change its values
+
+        Nodes keyed with a single key, or keys of the same value,
+        are static.
+
+        """
+
+        return node in self.animated
+
+
+def _node_name(node):
+    """Return the long name of MObject `node`"""
+    from maya.api import OpenMaya as om
+
+    if node.hasFn(om.MFn.kDagNode):
+        return om.MDagPath.getAPathTo(node).fullPathName()
+    return om.MFnDependencyNode(node).name()
+
+
+def _driven_plugs(plug, visited=None):
+    """Return the plugs driven by `plug`, through passthrough nodes
+
+    All outputs of a passthrough node are followed, as the output of
+    e.g. a pairBlend or animation layer depends on the attribute.
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    if visited is None:
+        visited = set()
+
+    plugs = list()
+    for destination in plug.destinations():
+        fn_node = om.MFnDependencyNode(destination.node())
+        if not fn_node.typeName.startswith(PASSTHROUGH_TYPES):
+            plugs.append(destination)
+            continue
+
+        if fn_node.name() in visited:
+            continue
+        visited.add(fn_node.name())
+
+        for output in fn_node.getConnections():
+            if output.isSource:
+                plugs.extend(_driven_plugs(output, visited))
+    return plugs
+
+
+def read_animation_index():
+    """Return the AnimationIndex of the current scene"""
+    from maya.api import OpenMaya as om
+    from maya.api import OpenMayaAnim as oma
+
+    curves = list()
+    iterator = om.MItDependencyNodes(om.MFn.kAnimCurve)
+    while not iterator.isDone():
+        fn_curve = oma.MFnAnimCurve(iterator.thisNode())
+        output = fn_curve.findPlug("output", False)
+
+        for plug in _driven_plugs(output):
+            name = _node_name(plug.node())
+            attribute = plug.partialName(useLongNames=True)
+            curves.append((fn_curve.name(),
+                           "{0}.{1}".format(name, attribute),
+                           fn_curve.numKeys,
+                           fn_curve.isStatic,
+                           fn_curve.isUnitlessInput))
+
+        iterator.next()
+
+    return AnimationIndex(curves)
+
+
+def get_animation_index(context):
+    """Return the AnimationIndex of the scene
+
+    The index is stored in the "animationIndex" data of the context,
+    and read on first access.
+
+    """
+
+    index = context.data.get("animationIndex")
+    if index is None:
+        index = read_animation_index()
+        context.data["animationIndex"] = index
+    return index
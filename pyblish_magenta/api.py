@@ -9,7 +9,16 @@ from .lib import (
     ValidatePipelineOrder,
     ValidateContentsOrder,
     ValidateMeshOrder,
-    ValidateSceneOrder
+    ValidateSceneOrder,
+    SceneIndex,
+    get_scene_index,
+    DagPathTable,
+    DagPathSet,
+    get_dag_path_table,
+    get_dag_paths,
+    AttributeTable,
+    read_attributes,
+    write_attributes
 )
 
 
@@ -35,7 +44,17 @@ __all__ = [
     "ValidatePipelineOrder",
     "ValidateContentsOrder",
     "ValidateMeshOrder",
-    "ValidateSceneOrder"
+    "ValidateSceneOrder",
+
+    "SceneIndex",
+    "get_scene_index",
+    "DagPathTable",
+    "DagPathSet",
+    "get_dag_path_table",
+    "get_dag_paths",
+    "AttributeTable",
+    "read_attributes",
+    "write_attributes",
 
     "Extractor",
     "Integrator",
@@ -0,0 +1,198 @@
+"""World-space bounding boxes of an instance's hierarchy
+
+The local bounding box and world matrix of every shape are read once,
+transformed into world space for all shapes together and combined
+bottom-up through the hierarchy, such that every transform holds the
+world-space box of everything underneath it. This replaces a separate
+`xform(boundingBox=True, worldSpace=True)` query per node.
+
+Boxes are stored as (minX, minY, minZ, maxX, maxY, maxZ).
+
+Example:
+    >> bounds = get_bounds(instance)
+    >> bounds.get("|ben_GRP")
+    (-1.0, 0.0, -1.0, 1.0, 2.0, 1.0)
+    >> bounds.beyond(1e5)
+    []
+
+"""
+
+import functools
+import itertools
+
+from . import lib, hierarchy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Corners of a box as indices into (minX, minY, minZ, maxX, maxY, maxZ)
+_CORNERS = list(itertools.product((0, 3), (1, 4), (2, 5)))
+
+
+class Bounds(object):
+    """World-space bounding boxes of `shapes` and all of their parents
+
+    Arguments:
+        shapes (list): Long names of shapes
+
+    Attributes:
+        nodes (list): Long names of the shapes and their parents
+        boxes (array): (N, 6) world-space box of each node
+
+    """
+
+    def __init__(self, shapes):
+        shapes = list(shapes)
+
+        boxes, matrices = _read(shapes) if shapes else ([], [])
+        boxes = world_boxes(boxes, matrices)
+
+        values = dict((node, None) for node in
+                      lib.get_upstream_hierarchy(shapes))
+        values.update(zip(shapes, boxes))
+        values = hierarchy.propagate_up(values, union)
+
+        # Nodes without shapes underneath them have no bounds
+        self.nodes = sorted(node for node, box in values.items()
+                            if box is not None)
+        self.boxes = [values[node] for node in self.nodes]
+        if numpy is not None:
+            self.boxes = numpy.array(self.boxes,
+                                     dtype="float64").reshape(-1, 6)
+
+        self._rows = dict((node, row) for row, node in enumerate(self.nodes))
+
+    def __contains__(self, node):
+        return node in self._rows
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def get(self, node):
+        """Return the box of `node`, or None if it has no bounds"""
+        row = self._rows.get(node)
+        if row is None:
+            return None
+        return tuple(float(value) for value in self.boxes[row])
+
+    def union(self, nodes=None):
+        """Return the box around `nodes`, defaults to all nodes"""
+        if nodes is None:
+            nodes = self.nodes
+        boxes = (self.get(node) for node in nodes)
+        return functools.reduce(union, boxes, None)
+
+    def beyond(self, distance, nodes=None):
+        """Return nodes with bounds further than `distance` from the origin
+
+        Arguments:
+            distance (float): Distance along any axis
+            nodes (list, optional): Nodes to check, defaults to all
+
+        """
+
+        if nodes is None:
+            nodes = self.nodes
+
+        rows = [self._rows[node] for node in nodes if node in self._rows]
+        if numpy is not None:
+            far = numpy.any(numpy.abs(self.boxes[rows]) > distance, axis=1)
+            return [self.nodes[rows[i]] for i in numpy.flatnonzero(far)]
+
+        return [self.nodes[row] for row in rows
+                if any(abs(value) > distance for value in self.boxes[row])]
+
+
+def union(a, b):
+    """Return the box around boxes `a` and `b`, either may be None"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), min(a[2], b[2]),
+            max(a[3], b[3]), max(a[4], b[4]), max(a[5], b[5]))
+
+
+def world_boxes(boxes, matrices):
+    """Return the world-space boxes of local `boxes` under `matrices`
+
+    Arguments:
+        boxes (sequence): Local box per shape, as 6 values
+        matrices (sequence): World matrix per shape, as 16 values
+
+    Returns:
+        list: World-space box per shape, as tuples of 6 values
+
+    Example:
+        >>> world_boxes([(0, 0, 0, 1, 1, 1)],
+        ...             [(2, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 5, 0, 0, 1)])
+        [(5.0, 0.0, 0.0, 7.0, 1.0, 1.0)]
+
+    """
+
+    if numpy is not None:
+        boxes = numpy.asarray(boxes, dtype="float64").reshape(-1, 6)
+        matrices = numpy.asarray(matrices, dtype="float64").reshape(-1, 4, 4)
+
+        # Transform the 8 corners of all boxes as row vectors, like Maya
+        corners = numpy.ones((len(boxes), 8, 4))
+        corners[:, :, :3] = boxes[:, _CORNERS]
+        corners = numpy.matmul(corners, matrices)[:, :, :3]
+
+        world = numpy.concatenate([corners.min(axis=1),
+                                   corners.max(axis=1)], axis=1)
+        return [tuple(box) for box in world.tolist()]
+
+    world = list()
+    for box, matrix in zip(boxes, matrices):
+        points = list()
+        for corner in _CORNERS:
+            x, y, z = (box[i] for i in corner)
+            points.append([x * matrix[0 + i] + y * matrix[4 + i] +
+                           z * matrix[8 + i] + matrix[12 + i]
+                           for i in range(3)])
+
+        world.append(tuple(float(f(values)) for f in (min, max)
+                           for values in zip(*points)))
+    return world
+
+
+def _read(shapes):
+    """Return the local box and world matrix of each of `shapes`"""
+    from maya.api import OpenMaya as om
+
+    selection = om.MSelectionList()
+    for shape in shapes:
+        selection.add(shape)
+
+    boxes = list()
+    matrices = list()
+    fn_dag = om.MFnDagNode()
+    for i in range(len(shapes)):
+        path = selection.getDagPath(i)
+        fn_dag.setObject(path)
+
+        box = fn_dag.boundingBox
+        boxes.append((box.min.x, box.min.y, box.min.z,
+                      box.max.x, box.max.y, box.max.z))
+        matrices.append(tuple(path.inclusiveMatrix()))
+
+    return boxes, matrices
+
+
+def get_bounds(instance):
+    """Return the Bounds of the shapes of `instance`
+
+    The bounds are stored in the "bounds" data of the instance,
+    and computed on first access.
+
+    """
+
+    bounds = instance.data.get("bounds")
+    if bounds is None:
+        index = lib.get_scene_index(instance)
+        bounds = Bounds(index.ls(type="shape", noIntermediate=True))
+        instance.data["bounds"] = bounds
+    return bounds
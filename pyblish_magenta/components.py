@@ -0,0 +1,242 @@
+"""Compact sets of Maya component indices
+
+Maya returns consecutive components as a single range, e.g.
+"mesh.vtx[0:1023]", unless the result is flattened. Flattening a large
+list (e.g. millions) is slow, so this module parses the ranges into
+sorted, merged intervals which can be counted and combined without
+ever expanding them to the individual components.
+
+This module is pure Python and does not require Maya.
+
+Example:
+    >>> vertices = parse(["mesh.vtx[0:9]", "mesh.vtx[20]"])
+    >>> len(vertices[("mesh", "vtx")])
+    11
+    >>> count(["mesh.map[0:4]", "mesh.map[3:7]"])
+    8
+
+"""
+
+import bisect
+
+
+class IntervalSet(object):
+    """Set of integers stored as sorted, non-overlapping intervals
+
+    Intervals are inclusive (start, end) pairs, like Maya's component
+    ranges. Adjacent intervals are merged.
+
+    Example:
+        >>> a = IntervalSet([(0, 9)])
+        >>> b = IntervalSet([(5, 14)])
+        >>> (a | b).intervals
+        [(0, 14)]
+        >>> (a & b).intervals
+        [(5, 9)]
+        >>> (a - b).intervals
+        [(0, 4)]
+        >>> len(a - b)
+        5
+
+    """
+
+    def __init__(self, intervals=None):
+        self.intervals = self._merge(sorted(intervals or []))
+
+    def __len__(self):
+        return sum(end - start + 1 for start, end in self.intervals)
+
+    def __nonzero__(self):
+        return bool(self.intervals)
+
+    __bool__ = __nonzero__
+
+    def __eq__(self, other):
+        return self.intervals == other.intervals
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "IntervalSet(%r)" % self.intervals
+
+    def __contains__(self, index):
+        position = bisect.bisect_right(self.intervals, (index, float("inf")))
+        return position > 0 and self.intervals[position - 1][1] >= index
+
+    def __iter__(self):
+        for start, end in self.intervals:
+            for index in range(start, end + 1):
+                yield index
+
+    def __or__(self, other):
+        result = IntervalSet()
+        result.intervals = self._merge(
+            _merge_sorted(self.intervals, other.intervals))
+        return result
+
+    def __and__(self, other):
+        intervals = list()
+        a, b = self.intervals, other.intervals
+        i = j = 0
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+            if start <= end:
+                intervals.append((start, end))
+
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        result = IntervalSet()
+        result.intervals = intervals
+        return result
+
+    def __sub__(self, other):
+        intervals = list()
+        b = other.intervals
+        j = 0
+        for start, end in self.intervals:
+            # Skip intervals of `other` that end before this one
+            while j < len(b) and b[j][1] < start:
+                j += 1
+
+            k = j
+            while k < len(b) and b[k][0] <= end:
+                if b[k][0] > start:
+                    intervals.append((start, b[k][0] - 1))
+                start = max(start, b[k][1] + 1)
+                k += 1
+
+            if start <= end:
+                intervals.append((start, end))
+
+        result = IntervalSet()
+        result.intervals = intervals
+        return result
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+
+    def count(self):
+        """Return the amount of indices in the set"""
+        return len(self)
+
+    def components(self, node, component_type):
+        """Return the set as Maya component strings
+
+        Example:
+            >>> IntervalSet([(0, 3), (7, 7)]).components("mesh", "vtx")
+            ['mesh.vtx[0:3]', 'mesh.vtx[7]']
+
+        """
+
+        components = list()
+        for start, end in self.intervals:
+            if start == end:
+                components.append("%s.%s[%i]" % (node, component_type, start))
+            else:
+                components.append("%s.%s[%i:%i]" % (node, component_type,
+                                                    start, end))
+        return components
+
+    @staticmethod
+    def _merge(intervals):
+        """Merge sorted `intervals` that overlap or are adjacent"""
+        merged = list()
+        for start, end in intervals:
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+
+def _merge_sorted(a, b):
+    """Return the sorted combination of sorted lists `a` and `b`"""
+    result = list()
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] <= b[j]:
+            result.append(a[i])
+            i += 1
+        else:
+            result.append(b[j])
+            j += 1
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
+def parse_component(component):
+    """Return node, type and index range of a single component string
+
+    Example:
+        >>> parse_component("|ben_GEO|ben_GEOShape.vtx[0:1023]")
+        ('|ben_GEO|ben_GEOShape', 'vtx', 0, 1023)
+        >>> parse_component("mesh.map[5]")
+        ('mesh', 'map', 5, 5)
+
+    Raises:
+        ValueError: When `component` is not a single indexed component,
+            such as "mesh.vtx[*]" or "mesh.vtxFace[0][1]".
+
+    """
+
+    head, _, index = component.partition("[")
+    node, _, component_type = head.rpartition(".")
+    if not (node and component_type and index.endswith("]")):
+        raise ValueError("Not a component range: %s" % component)
+
+    start, colon, end = index[:-1].partition(":")
+    try:
+        start = int(start)
+        end = int(end) if colon else start
+    except ValueError:
+        raise ValueError("Not a component range: %s" % component)
+
+    return node, component_type, start, end
+
+
+def parse(components):
+    """Parse component strings into an IntervalSet per node and type
+
+    Arguments:
+        components (list): Non-flattened component strings
+
+    Returns:
+        dict: {(node, type): IntervalSet}
+
+    """
+
+    intervals = dict()
+    for component in components:
+        node, component_type, start, end = parse_component(component)
+        try:
+            intervals[node, component_type].append((start, end))
+        except KeyError:
+            intervals[node, component_type] = [(start, end)]
+
+    return dict((key, IntervalSet(value))
+                for key, value in intervals.items())
+
+
+def count(components):
+    """Return the amount of components as if the list was flattened
+
+    Overlapping ranges are only counted once.
+
+    Arguments:
+        components (list): The non-flattened components.
+
+    Returns:
+        int: The amount of entries.
+
+    """
+
+    assert isinstance(components, (list, tuple))
+    return sum(len(intervals) for intervals in parse(components).values())
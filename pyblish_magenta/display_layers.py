@@ -0,0 +1,183 @@
+"""Display layer membership of the whole scene
+
+Display layers drive their members through a connection from the
+layer's `drawInfo` to the member's `drawOverride`. Listing those
+connections for all layers in a single pass gives the members of every
+layer, the layer of every node and whether a layer is referenced,
+without an `editDisplayLayerMembers` and `referenceQuery` per layer or
+reading the overrides of every node.
+
+Example:
+    >>> layers = DisplayLayerIndex({"hidden": ["|grp"], "empty": []},
+    ...                            visible={"hidden": False})
+    >>> layers.layer("|grp|child_GEO")
+    'hidden'
+    >>> layers.is_hidden("|grp|child_GEO"), layers.is_hidden("|other")
+    (True, False)
+    >>> layers.empty()
+    ['empty']
+
+"""
+
+import contextlib
+
+# Layers that exist by default in Maya and are mostly hidden
+DEFAULT_LAYERS = ("defaultLayer",)
+
+
+class DisplayLayerIndex(object):
+    """Members of display layers and the layer of each node
+
+    Arguments:
+        members (dict): Members per layer, long names for DAG nodes
+        visible (dict, optional): Visibility per layer, defaults to True
+        referenced (list, optional): Layers from referenced files
+
+    """
+
+    def __init__(self, members, visible=None, referenced=None):
+        self.members = dict((layer, list(nodes))
+                            for layer, nodes in members.items())
+        self.visible = dict((layer, True) for layer in self.members)
+        self.visible.update(visible or {})
+        self.referenced = set(referenced or [])
+
+        self._layers = dict()
+        for layer, nodes in self.members.items():
+            if layer in DEFAULT_LAYERS:
+                continue
+            for node in nodes:
+                self._layers[node] = layer
+
+    def __contains__(self, layer):
+        return layer in self.members
+
+    def __iter__(self):
+        return iter(sorted(self.members))
+
+    def count(self, layer):
+        """Return the amount of members of `layer`"""
+        return len(self.members.get(layer, []))
+
+    def layer(self, node):
+        """Return the layer overriding `node`, or None
+
+        Members of a layer override their descendants, so the layer
+        of the closest parent in a layer is returned for nodes that
+        are not a member themselves.
+
+        """
+
+        while node:
+            layer = self._layers.get(node)
+            if layer is not None:
+                return layer
+            if "|" not in node:
+                break
+            node = node.rsplit("|", 1)[0]
+        return None
+
+    def is_hidden(self, node):
+        """Return whether the layer overriding `node` is hidden"""
+        layer = self.layer(node)
+        return layer is not None and not self.visible[layer]
+
+    def layers(self, nodes):
+        """Return the members among `nodes` per layer"""
+        result = dict()
+        for node in nodes:
+            layer = self._layers.get(node)
+            if layer is not None:
+                result.setdefault(layer, list()).append(node)
+        return result
+
+    def empty(self, exclude=DEFAULT_LAYERS, referenced=False):
+        """Return layers without members
+
+        Arguments:
+            exclude (list): Layers to ignore
+            referenced (bool): Whether to include referenced layers
+
+        """
+
+        return [layer for layer in self
+                if not self.members[layer] and
+                layer not in exclude and
+                (referenced or layer not in self.referenced)]
+
+
+def read_display_layers():
+    """Return the DisplayLayerIndex of the current scene"""
+    from maya import cmds
+    from maya.api import OpenMaya as om
+
+    layers = cmds.ls(type="displayLayer") or []
+
+    selection = om.MSelectionList()
+    for layer in layers:
+        selection.add(layer)
+
+    members = dict()
+    visible = dict()
+    referenced = list()
+    for i, layer in enumerate(layers):
+        fn_layer = om.MFnDependencyNode(selection.getDependNode(i))
+        if fn_layer.isFromReferencedFile:
+            referenced.append(layer)
+
+        visible[layer] = fn_layer.findPlug("visibility", False).asBool()
+
+        nodes = list()
+        plug = fn_layer.findPlug("drawInfo", False)
+        for destination in plug.connectedTo(False, True):
+            node = destination.node()
+            if node.hasFn(om.MFn.kDagNode):
+                nodes.append(om.MDagPath.getAPathTo(node).fullPathName())
+            else:
+                nodes.append(om.MFnDependencyNode(node).name())
+        members[layer] = nodes
+
+    return DisplayLayerIndex(members, visible, referenced)
+
+
+def get_display_layers(context):
+    """Return the DisplayLayerIndex of the scene
+
+    The index is stored in the "displayLayers" data of the context,
+    and read on first access.
+
+    """
+
+    layers = context.data.get("displayLayers")
+    if layers is None:
+        layers = read_display_layers()
+        context.data["displayLayers"] = layers
+    return layers
+
+
+@contextlib.contextmanager
+def no_display_layers(nodes, layers=None):
+    """Remove `nodes` from their display layers within the context
+
+    Arguments:
+        nodes (list): Long names of nodes
+        layers (DisplayLayerIndex, optional): Index of the scene,
+            read from the scene when not given.
+
+    """
+
+    from maya import cmds
+
+    if layers is None:
+        layers = read_display_layers()
+
+    original = layers.layers(nodes)
+    removed = [node for members in original.values() for node in members]
+
+    if removed:
+        cmds.editDisplayLayerMembers("defaultLayer", removed, noRecurse=True)
+    try:
+        yield
+    finally:
+        for layer, members in original.items():
+            cmds.editDisplayLayerMembers(layer, members, noRecurse=True)
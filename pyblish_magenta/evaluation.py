@@ -0,0 +1,179 @@
+"""Evaluation settings of Maya for the duration of an extraction
+
+Extractors evaluating the scene over a frame range, such as Alembic
+exports and captures, run fastest with the evaluation manager in
+parallel mode. Parallel evaluation is only safe for scenes without
+nodes that may not be evaluated concurrently, such as nodes of Python
+plug-ins, otherwise the scene is evaluated by the dependency graph as it
+would without the evaluation manager. Expressions are scheduled safely
+by the evaluation manager itself, and script nodes are not evaluated at
+all, so neither prevents parallel evaluation. The scene is only probed
+when already evaluated in parallel, any other mode is kept as chosen.
+
+Within `extraction()` undo is disabled, as is cached playback, of which
+the background evaluation would compete with the export, and every
+setting is restored afterwards.
+
+Example:
+    >> with evaluation.extraction():
+    ..     cmds.AbcExport(j=job_str)
+
+"""
+
+import logging
+import contextlib
+
+log = logging.getLogger(__name__)
+
+# Probe the scene for whether parallel evaluation is safe
+AUTO = "auto"
+
+# Evaluation manager modes, "off" evaluates through the dependency graph
+PARALLEL = "parallel"
+SERIAL = "serial"
+DG = "off"
+
+
+def get_mode():
+    """Return the mode of the evaluation manager, None when unsupported"""
+    from maya import cmds
+
+    # Maya 2016+
+    if not hasattr(cmds, "evaluationManager"):
+        return None
+    return cmds.evaluationManager(query=True, mode=True)[0]
+
+
+def set_mode(mode):
+    """Switch the evaluation manager to `mode`"""
+    from maya import cmds
+
+    cmds.evaluationManager(mode=mode)
+
+
+def probe_mode():
+    """Return the fastest safe mode of the evaluation manager for the scene
+
+    Scenes holding nodes of Python plug-ins, or in which the evaluation
+    manager already fell back to safe mode, are evaluated through the
+    dependency graph, the others in parallel.
+
+    """
+
+    from maya import cmds
+
+    if cmds.evaluationManager(query=True, safeMode=True):
+        return DG
+
+    for plugin in cmds.pluginInfo(query=True, listPlugins=True) or []:
+        path = cmds.pluginInfo(plugin, query=True, path=True)
+        if not path.endswith(".py"):
+            continue
+
+        types = cmds.pluginInfo(plugin, query=True, dependNode=True)
+        if types and cmds.ls(type=types):
+            return DG
+
+    return PARALLEL
+
+
+def _cached_playback():
+    """Return whether cached playback is enabled, None when unsupported"""
+    from maya import cmds
+
+    # Maya 2019+
+    try:
+        return cmds.evaluator(name="cache", query=True, enable=True)
+    except (AttributeError, RuntimeError, TypeError):
+        return None
+
+
+def _set_cached_playback(state):
+    from maya import cmds
+
+    cmds.evaluator(name="cache", enable=state)
+
+
+def _smooth_preview(meshes):
+    """Return the meshes of `meshes` displayed with smooth mesh preview"""
+    from maya import cmds
+
+    return [mesh for mesh in meshes
+            if cmds.getAttr(mesh + ".displaySmoothMesh")]
+
+
+def _set_smooth_preview(meshes, value):
+    from maya import cmds
+
+    for mesh in meshes:
+        cmds.setAttr(mesh + ".displaySmoothMesh", value)
+
+
+@contextlib.contextmanager
+def extraction(mode=AUTO, refresh=False, meshes=None):
+    """Evaluate the scene as fast as safely possible within the context
+
+    Arguments:
+        mode (str, optional): Mode of the evaluation manager, AUTO to
+            fall back to the dependency graph when parallel evaluation
+            is not safe for the scene, keeping any other mode, or None
+            to keep the current mode, e.g. for exports of a single
+            frame of which rebuilding the evaluation graph outweighs
+            evaluating
+        refresh (bool, optional): Keep refreshing the viewport, e.g.
+            for captures, otherwise refreshing is suspended
+        meshes (list, optional): Meshes of which to turn off smooth
+            mesh preview, only for exports that do not include it
+
+    """
+
+    from maya import cmds
+
+    original_mode = get_mode()
+    if mode == AUTO:
+        # Serial and off are chosen on purpose, only parallel may be
+        # unsafe for the scene
+        mode = probe_mode() if original_mode == PARALLEL else None
+    elif original_mode is None:
+        # The evaluation manager is not supported
+        mode = None
+
+    cached_playback = _cached_playback()
+    undo = cmds.undoInfo(query=True, state=True)
+    smoothed = _smooth_preview(meshes or [])
+
+    try:
+        if mode is not None and mode != original_mode:
+            log.info("Evaluating in %s mode" % mode)
+            set_mode(mode)
+
+        if cached_playback:
+            _set_cached_playback(False)
+
+        if undo:
+            # Keep the queue, such that prior changes may still be undone
+            cmds.undoInfo(stateWithoutFlush=False)
+
+        if smoothed:
+            _set_smooth_preview(smoothed, False)
+
+        if not refresh:
+            cmds.refresh(suspend=True)
+
+        yield
+
+    finally:
+        if not refresh:
+            cmds.refresh(suspend=False)
+
+        if smoothed:
+            _set_smooth_preview(smoothed, True)
+
+        if undo:
+            cmds.undoInfo(stateWithoutFlush=True)
+
+        if cached_playback:
+            _set_cached_playback(True)
+
+        if mode is not None and mode != original_mode:
+            set_mode(original_mode)
@@ -0,0 +1,391 @@
+"""Extraction cache, skipping exports of unchanged instances
+
+Each extraction is given a fingerprint of the content of the instance,
+the upstream history of its members included, along with the options of
+the exporter, e.g. the Alembic job string with its frame range. When a
+file was extracted before with the same fingerprint, it is linked (or
+copied, where linking is not supported) from the cache into the
+extraction directory rather than exported again.
+
+The content of a node is hashed from its type, the values of its
+attributes that differ from their defaults, as Maya would write them to
+a Maya Ascii file, and its incoming connections. Files read by nodes,
+such as textures or caches, are hashed by path only. Extractors of
+which `includes_shading` is set, such as exports with construction
+history, also hash the shading engines of the instance's shapes along
+with their shading networks, which are not upstream of the shapes.
+
+The cache is enabled by setting the environment variable
+PYBLISH_MAGENTA_EXTRACTION_CACHE to the path of a directory, otherwise
+all instances are extracted as usual. Files least recently used are
+evicted once the size of the directory exceeds a maximum.
+
+Example:
+    >> def export():
+    ..     cmds.file(path, exportSelected=True)
+    >> extraction.extract(self, instance, path, export, options)
+
+"""
+
+import os
+import errno
+import shutil
+import hashlib
+
+from . import lib, history
+from .incremental import _hash_code
+
+# Path to the directory of an ExtractionCache, disabled when not set
+CACHE_ENVIRONMENT = "PYBLISH_MAGENTA_EXTRACTION_CACHE"
+
+# Maximum size of the cache, in bytes
+MAX_SIZE = 50 * 1024 ** 3
+
+
+class ExtractionCache(object):
+    """Extracted files by fingerprint, stored in a directory on disk
+
+    Arguments:
+        path (str): Directory of the cache
+        max_size (int, optional): Size in bytes to keep, the least
+            recently used files are evicted first
+
+    Attributes:
+        hits (int): Amount of files fetched from the cache
+        misses (int): Amount of files not in the cache
+
+    Example:
+        >>> import tempfile
+        >>> root = tempfile.mkdtemp()
+        >>> source = os.path.join(root, "source.abc")
+        >>> with open(source, "w") as f:
+        ...     f.write("abc")
+        >>> cache = ExtractionCache(os.path.join(root, "cache"))
+        >>> cache.fetch("key", os.path.join(root, "a.abc"))
+        False
+        >>> cache.store("key", source)
+        >>> cache.fetch("key", os.path.join(root, "b.abc"))
+        True
+        >>> cache.hits, cache.misses, cache.size()
+        (1, 1, 3)
+        >>> shutil.rmtree(root)
+
+    """
+
+    def __init__(self, path, max_size=MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.path, key)
+
+    def fetch(self, key, destination):
+        """Place the file of `key` at `destination`, if cached
+
+        Returns:
+            bool: Whether the file was cached
+
+        """
+
+        path = self._path(key)
+        if not os.path.isfile(path):
+            self.misses += 1
+            return False
+
+        # Mark as most recently used
+        os.utime(path, None)
+
+        if os.path.exists(destination):
+            os.remove(destination)
+        _link(path, destination)
+
+        self.hits += 1
+        return True
+
+    def store(self, key, source):
+        """Store the extracted file `source` as `key`"""
+        if not os.path.isdir(self.path):
+            try:
+                os.makedirs(self.path)
+            except OSError as e:
+                # Created by a concurrent publish
+                if e.errno != errno.EEXIST:
+                    raise
+
+        # Written under a temporary name, such that a concurrent publish
+        # never fetches a partially written file
+        path = self._path(key)
+        temp = "{0}.{1}.tmp".format(path, os.getpid())
+        _link(source, temp)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(temp, path)
+
+        self.evict()
+
+    def _entries(self):
+        """Return (mtime, size, path) of cached files"""
+        entries = list()
+        for name in os.listdir(self.path):
+            # Being written by a concurrent publish
+            if name.endswith(".tmp"):
+                continue
+
+            path = os.path.join(self.path, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # Evicted by a concurrent publish
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self):
+        """Return the size of all cached files, in bytes"""
+        if not os.path.isdir(self.path):
+            return 0
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove the least recently used files beyond the maximum size"""
+        entries = sorted(self._entries())
+        size = sum(entry[1] for entry in entries)
+
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Evicted by a concurrent publish
+                pass
+            size -= entry_size
+
+
+def _link(source, destination):
+    """Hard link `source` to `destination`, copy where not supported"""
+    try:
+        os.link(source, destination)
+    except (AttributeError, OSError):
+        # Not supported on Windows with Python 2, nor across devices
+        shutil.copyfile(source, destination)
+
+
+def get_extraction_cache(context):
+    """Return the ExtractionCache of the environment, if enabled
+
+    The cache is stored in the "extractionCache" data of the context.
+
+    """
+
+    if "extractionCache" not in context.data:
+        path = os.environ.get(CACHE_ENVIRONMENT)
+        cache = ExtractionCache(path) if path else None
+        context.data["extractionCache"] = cache
+    return context.data["extractionCache"]
+
+
+def hash_node(node):
+    """Return a hash of the content of `node` in the current scene"""
+    from maya.api import OpenMaya as om
+
+    selection = om.MSelectionList()
+    selection.add(node)
+    obj = selection.getDependNode(0)
+    fn_node = om.MFnDependencyNode(obj)
+
+    md5 = hashlib.md5(fn_node.typeName)
+
+    for i in range(fn_node.attributeCount()):
+        attribute = fn_node.attribute(i)
+
+        # Children are included with their parent
+        if not om.MFnAttribute(attribute).parent.isNull():
+            continue
+
+        plug = om.MPlug(obj, attribute)
+        for cmd in plug.getSetAttrCmds(om.MPlug.kNonDefault, True):
+            md5.update(cmd)
+
+    for plug in fn_node.getConnections():
+        if plug.isDestination:
+            md5.update(plug.source().name())
+            md5.update(plug.partialName(useLongNames=True))
+
+    return md5.hexdigest()
+
+
+def get_content_hashes(context, nodes):
+    """Return the hash of each of `nodes`
+
+    Hashes are stored in the "contentHashes" data of the context, and
+    computed on first access per node. Extraction does not change the
+    scene, so instances sharing nodes only hash these once.
+
+    """
+
+    hashes = context.data.get("contentHashes")
+    if hashes is None:
+        hashes = context.data["contentHashes"] = dict()
+
+    for node in nodes:
+        if node not in hashes:
+            hashes[node] = hash_node(node)
+
+    return [hashes[node] for node in nodes]
+
+
+def get_shading_nodes(context, nodes):
+    """Return the shading engines of `nodes` and their shading networks
+
+    The shapes assigned to the shading engines are not followed, such
+    that the shading engines do not draw in the history of other shapes.
+
+    """
+
+    from maya import cmds
+
+    # An empty list would list all shapes of the scene
+    shapes = cmds.ls(nodes, shapes=True, long=True) if nodes else []
+    if not shapes:
+        return list()
+
+    engines = set(cmds.listConnections(shapes,
+                                       type="shadingEngine",
+                                       source=False,
+                                       destination=True) or [])
+    if not engines:
+        return list()
+
+    # Shaders, leaving out the assigned shapes
+    inputs = cmds.listConnections(list(engines),
+                                  source=True,
+                                  destination=False) or []
+    shaders = set()
+    if inputs:
+        shaders = set(cmds.ls(inputs)) - set(cmds.ls(inputs, dag=True))
+
+    graph = history.get_history_graph(context)
+    return sorted(engines | set(graph.history(shaders)))
+
+
+def fingerprint(plugin, instance, path, *options):
+    """Return the fingerprint of extracting `instance` to `path`
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Extractor, its name, version and
+            the code of its methods are part of the fingerprint, as are
+            the shading networks of the instance when its
+            `includes_shading` is set
+        instance (pyblish.api.Instance): Instance to extract
+        path (str): Destination of the extracted file, only its
+            file name is part of the fingerprint
+        *options: Options of the exporter, e.g. the job string of
+            an Alembic export holding its frame range
+
+    """
+
+    from maya import cmds
+
+    members = lib.get_dag_paths(instance)
+    graph = history.get_history_graph(instance.context)
+    nodes = set(graph.history(members))
+    if getattr(plugin, "includes_shading", False):
+        nodes.update(get_shading_nodes(instance.context, list(members)))
+    nodes = sorted(nodes)
+
+    md5 = hashlib.md5(str(cmds.about(apiVersion=True)))
+    md5.update(type(plugin).__name__)
+    md5.update(".".join(str(v) for v in plugin.version))
+    for name, method in sorted(vars(type(plugin)).items()):
+        # Unwrap class methods and properties
+        method = getattr(method, "__func__", method)
+        method = getattr(method, "fget", method)
+        if hasattr(method, "__code__"):
+            _hash_code(md5, method.__code__)
+    md5.update(os.path.basename(path))
+
+    for option in options:
+        md5.update(repr(option))
+
+    for node, digest in zip(nodes,
+                            get_content_hashes(instance.context, nodes)):
+        md5.update(node)
+        md5.update(digest)
+
+    return md5.hexdigest() + os.path.splitext(path)[-1]
+
+
+def extract_all(plugin, extractions, export):
+    """Extract several instances through a single `export`, unless cached
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Extractor of the instances
+        extractions (list): (instance, path, options) per instance, with
+            `options` a tuple of exporter options, see `fingerprint()`
+        export (callable): Write the files of the given extractions,
+            those not in the cache, returning the paths of files not to
+            store in the cache, e.g. of failed exports, if any
+
+    Returns:
+        list: Whether each extraction was taken from the cache
+
+    """
+
+    if not extractions:
+        return list()
+
+    cache = get_extraction_cache(extractions[0][0].context)
+    if cache is None:
+        export(extractions)
+        return [False] * len(extractions)
+
+    keys = [fingerprint(plugin, instance, path, *options)
+            for instance, path, options in extractions]
+
+    cached = list()
+    for key, (instance, path, _) in zip(keys, extractions):
+        cached.append(cache.fetch(key, path))
+        if cached[-1]:
+            plugin.log.info("{0} is unchanged since a previous extraction, "
+                            "taken from {1}".format(instance, cache.path))
+
+    missing = [(key, extraction)
+               for key, extraction, hit in zip(keys, extractions, cached)
+               if not hit]
+    if missing:
+        rejected = export([extraction for _, extraction in missing]) or []
+        for key, (_, path, _) in missing:
+            if path not in rejected:
+                cache.store(key, path)
+
+    plugin.log.info("Extraction cache: {0} hits, {1} misses".format(
+        cache.hits, cache.misses))
+
+    return cached
+
+
+def extract(plugin, instance, path, export, *options):
+    """Extract `instance` to `path` through `export`, unless cached
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Extractor of `instance`
+        instance (pyblish.api.Instance): Instance to extract
+        path (str): Destination of the extracted file
+        export (callable): Write the extracted file to `path`, returning
+            whether the file is not to be stored in the cache, e.g. when
+            it failed, see `extract_all()`
+        *options: Options of the exporter, see `fingerprint()`
+
+    Returns:
+        bool: Whether the file was taken from the cache
+
+    """
+
+    def export_instance(extractions):
+        return [path] if export() else []
+
+    return extract_all(plugin, [(instance, path, options)],
+                       export_instance)[0]
@@ -0,0 +1,135 @@
+"""Propagate values through DAG hierarchies in a single pass
+
+Long names sort their parents before their children, so sorting the
+paths of a hierarchy once gives an order in which every node can be
+computed from its parent (top-down), and reversing it an order in which
+every node can be computed from its children (bottom-up). Each node is
+then visited exactly once, as opposed to walking up or down the
+hierarchy separately for every node.
+
+Example:
+    >>> hidden = {"|a": True, "|a|b": False, "|c": False}
+    >>> sorted(propagate_down(hidden, lambda parent, node: parent or node)
+    ...        .items())
+    [('|a', True), ('|a|b', True), ('|c', False)]
+
+"""
+
+from . import lib
+
+
+def _parent(path, values):
+    """Return the closest ancestor of `path` present in `values`"""
+    parent = path.rsplit("|", 1)[0]
+    while parent and parent not in values:
+        parent = parent.rsplit("|", 1)[0]
+    return parent or None
+
+
+def propagate_down(values, combine):
+    """Combine the value of each path with that of its parent, top-down
+
+    Arguments:
+        values (dict): Value per long name
+        combine (callable): Called with the computed value of the parent
+            and the value of the path, returns the value of the path.
+            Paths whose parents are not in `values` keep their value.
+
+    Returns:
+        dict: Computed value per long name
+
+    """
+
+    result = dict()
+    for path in sorted(values):
+        parent = _parent(path, result)
+        if parent is None:
+            result[path] = values[path]
+        else:
+            result[path] = combine(result[parent], values[path])
+
+    return result
+
+
+def propagate_up(values, combine):
+    """Combine the value of each path with those of its children, bottom-up
+
+    Arguments:
+        values (dict): Value per long name
+        combine (callable): Called with the value of a parent and the
+            computed value of one of its children, returns the new
+            value of the parent.
+
+    Returns:
+        dict: Computed value per long name
+
+    Example:
+        >>> shapes = {"|a": False, "|a|b": False, "|a|b|bShape": True}
+        >>> sorted(propagate_up(shapes, lambda parent, child: parent or child)
+        ...        .items())
+        [('|a', True), ('|a|b', True), ('|a|b|bShape', True)]
+
+    """
+
+    result = dict(values)
+    for path in sorted(values, reverse=True):
+        parent = _parent(path, result)
+        if parent is not None:
+            result[parent] = combine(result[parent], result[path])
+
+    return result
+
+
+def get_visibility(nodes, layers=None):
+    """Return whether each of `nodes` is visible in the scene
+
+    A node is hidden when its visibility is off, when it is an
+    intermediate object, when a hidden display layer overrides it or
+    when any of its parents is hidden. The attributes of the nodes and
+    all of their parents are read in a single pass.
+
+    Arguments:
+        nodes (list): Long names of DAG nodes
+        layers (DisplayLayerIndex, optional): Display layers of the
+            scene, display layers are ignored when not given.
+
+    Returns:
+        dict: {node: bool}
+
+    """
+
+    nodes = list(nodes)
+    members = set(nodes)
+    parents = [parent for parent in lib.get_upstream_hierarchy(nodes)
+               if parent not in members]
+    table = lib.read_attributes(nodes + parents,
+                                ("visibility", "intermediateObject"))
+
+    hidden = dict()
+    for node in table.nodes:
+        hidden[node] = (
+            not table.get(node, "visibility", True) or
+            table.get(node, "intermediateObject", False) or
+            (layers is not None and layers.is_hidden(node))
+        )
+
+    hidden = propagate_down(hidden, lambda parent, node: parent or node)
+    return dict((node, not hidden.get(node, True)) for node in nodes)
+
+
+def get_shape_descendants(index):
+    """Return whether each node of `index` has a non-intermediate shape
+
+    Arguments:
+        index (SceneIndex): Index of an instance
+
+    Returns:
+        dict: {node: bool}, True for nodes that are, or have any
+            descendant that is, a non-intermediate shape.
+
+    """
+
+    shapes = dict((node, (index.is_a(node, "shape") and
+                          not index.is_intermediate(node)))
+                  for node in index.types)
+    return propagate_up(shapes, lambda parent, child: parent or child)
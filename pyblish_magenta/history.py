@@ -0,0 +1,233 @@
+"""Upstream history of nodes, walked once for all instances of a context
+
+The history matches that of `cmds.listHistory`: the dependency graph is
+walked upstream at the level of plugs. From a node, all of its incoming
+connections are followed. From the source plug of a connection, only
+the incoming connections of the attributes affecting that plug are
+followed, along with the incoming connection of the plug itself. Inputs
+of an upstream node that only affect its other outputs, such as those
+of a control driving another rig, are left out.
+
+Nodes of excluded types are skipped, along with everything only
+reachable through them. The connections of each node and the inputs
+affecting each plug are read from the scene once and memoized, so
+instances sharing deformer networks or referenced components read the
+shared part of the graph only once, and only walk the memoized plugs
+again. Only these are memoized, not the history of each node, which for
+a long chain of deformers would hold the history of every node of the
+chain again for each node upstream of it.
+
+Histories are returned as a DagPathSet of a DagPathTable.
+
+Example:
+    >>> from pyblish_magenta.lib import DagPathTable
+    >>> connections = {
+    ...     "|a|aShape": [(("inMesh",), "skin", "outputGeometry")],
+    ...     "|b|bShape": [(("inMesh",), "skin", "outputGeometry")],
+    ...     "skin": [(("matrix",), "|root|joint", "worldMatrix"),
+    ...              (("envelope",), "rig", "envelope")],
+    ...     "|root|joint": [(("drawStyle",), "layer", "visibility"),
+    ...                     (("visibility",), "skin_layer", "out")]}
+    >>> affected_by = {("skin", "outputGeometry"): ["matrix"],
+    ...                ("|root|joint", "worldMatrix"): ["visibility"]}
+    >>> types = {"skin_layer": "renderLayer"}
+    >>> history = HistoryGraph(
+    ...     DagPathTable(),
+    ...     lambda node: [(attrs, src, types.get(src, "node"), attr)
+    ...                   for attrs, src, attr in connections.get(node, [])],
+    ...     lambda node, attribute: affected_by.get((node, attribute), []))
+    >>> sorted(history.history(["|a|aShape"]))
+    ['skin', '|a|aShape', '|root|joint']
+    >>> sorted(history.history(["|b|bShape"]))
+    ['skin', '|b|bShape', '|root|joint']
+    >>> history.visited, history.reused, history.excluded
+    (4, 2, 1)
+
+"""
+
+from .lib import get_dag_path_table
+
+# Node types left out of the history, along with their upstream nodes
+EXCLUDE_TYPES = ("renderLayer", "time")
+
+
+class HistoryGraph(object):
+    """Upstream history of nodes, reading each node and plug once
+
+    Arguments:
+        table (DagPathTable): Table interning the nodes
+        inputs (callable): Return the incoming connections of a node as
+            (attributes, node, type, attribute), the names of the
+            destination attribute and its parents along with the
+            upstream node, its type and the name of its attribute
+        affects (callable): Return the names of the attributes of a
+            node affecting the given attribute
+        exclude (list, optional): Node types to leave out
+
+    Attributes:
+        visited (int): Amount of nodes of which the inputs were read
+        reused (int): Amount of times memoized inputs of a plug were
+            reused
+        excluded (int): Amount of connections to excluded nodes
+
+    """
+
+    def __init__(self, table, inputs, affects, exclude=EXCLUDE_TYPES):
+        self.table = table
+        self.exclude = frozenset(exclude)
+        self.visited = 0
+        self.reused = 0
+        self.excluded = 0
+
+        self._inputs = inputs
+        self._affects = affects
+        self._connections = dict()
+        self._plugs = dict()
+
+    def _incoming(self, index):
+        """Return the incoming (attributes, plug) of node at `index`"""
+        connections = self._connections.get(index)
+        if connections is None:
+            self.visited += 1
+            connections = list()
+            for attributes, node, node_type, attribute in self._inputs(
+                    self.table[index]):
+                if node_type in self.exclude:
+                    self.excluded += 1
+                    continue
+                connections.append((frozenset(attributes),
+                                    (self.table.add(node), attribute)))
+            self._connections[index] = connections
+        return connections
+
+    def _upstream(self, plug):
+        """Return the upstream plugs of source `plug` as (index, name)"""
+        upstream = self._plugs.get(plug)
+        if upstream is not None:
+            self.reused += 1
+            return upstream
+
+        index, attribute = plug
+        affecting = set(self._affects(self.table[index], attribute))
+        affecting.add(attribute)
+
+        upstream = [source for attributes, source in self._incoming(index)
+                    if not affecting.isdisjoint(attributes)]
+        self._plugs[plug] = upstream
+        return upstream
+
+    def history(self, nodes):
+        """Return `nodes` and their upstream history as a DagPathSet"""
+        indices = set(self.table.add(node) for node in nodes)
+
+        # All incoming connections of the nodes themselves are followed
+        queue = list()
+        for index in indices:
+            queue.extend(source for _, source in self._incoming(index))
+
+        seen = set()
+        while queue:
+            plug = queue.pop()
+            if plug in seen:
+                continue
+            seen.add(plug)
+            indices.add(plug[0])
+            queue.extend(self._upstream(plug))
+
+        return self.table.subset(indices)
+
+
+def _attribute_names(plug):
+    """Return the names of the attribute of `plug` and of its parents"""
+    from maya.api import OpenMaya as om
+
+    names = list()
+    attribute = plug.attribute()
+    while not attribute.isNull():
+        fn_attribute = om.MFnAttribute(attribute)
+        names.append(fn_attribute.name)
+        attribute = fn_attribute.parent
+    return names
+
+
+def _get_node(node):
+    from maya.api import OpenMaya as om
+
+    selection = om.MSelectionList()
+    selection.add(node)
+    return selection.getDependNode(0)
+
+
+def read_inputs(node):
+    """Return the incoming connections of `node` in the current scene
+
+    Message connections only relate nodes, as opposed to passing on
+    data, and are not part of the history.
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    fn_node = om.MFnDependencyNode(_get_node(node))
+
+    inputs = list()
+    for plug in fn_node.getConnections():
+        if not plug.isDestination:
+            continue
+        if plug.attribute().hasFn(om.MFn.kMessageAttribute):
+            continue
+
+        source = plug.source()
+        obj = source.node()
+        if obj.hasFn(om.MFn.kDagNode):
+            name = om.MDagPath.getAPathTo(obj).fullPathName()
+        else:
+            name = om.MFnDependencyNode(obj).name()
+
+        inputs.append((_attribute_names(plug),
+                       name,
+                       om.MFnDependencyNode(obj).typeName,
+                       om.MFnAttribute(source.attribute()).name))
+
+    return inputs
+
+
+def read_affects(node, attribute):
+    """Return the names of the attributes of `node` affecting `attribute`
+
+    The parents of `attribute`, e.g. "translate" for "translateX", are
+    included along with the attributes affecting them, as connections
+    to a parent pass on the values of its children.
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    fn_node = om.MFnDependencyNode(_get_node(node))
+
+    names = set()
+    obj = fn_node.attribute(attribute)
+    while not obj.isNull():
+        fn_attribute = om.MFnAttribute(obj)
+        names.add(fn_attribute.name)
+        for affecting in fn_node.getAffectedByAttributes(obj):
+            names.add(om.MFnAttribute(affecting).name)
+        obj = fn_attribute.parent
+    return sorted(names)
+
+
+def get_history_graph(context):
+    """Return the HistoryGraph shared by the instances of `context`
+
+    The graph is stored in the "historyGraph" data of the context and
+    interns its nodes in the context's DagPathTable.
+
+    """
+
+    graph = context.data.get("historyGraph")
+    if graph is None:
+        graph = HistoryGraph(get_dag_path_table(context),
+                             read_inputs,
+                             read_affects)
+        context.data["historyGraph"] = graph
+    return graph
@@ -0,0 +1,314 @@
+"""Incremental validation of meshes, skipping those that passed unchanged
+
+Each mesh is given a fingerprint of its content, a hash of its topology
+and the layout of its UV sets. Meshes that passed a validator before,
+with the same fingerprint and the same version and code of the
+validator, are not validated again. Passing results are stored in an
+on-disk cache shared across sessions, of which the least recently used
+entries are evicted beyond a maximum size.
+
+Incremental validation is enabled by setting the environment variable
+PYBLISH_MAGENTA_VALIDATION_CACHE to the path of the cache, otherwise
+all meshes are validated as usual.
+
+Only validators that read their meshes from the scene index and mesh
+statistics of the instance support incremental validation. These are
+marked `incremental = True` for watch mode, e.g.
+
+    >> incremental = True
+    >> def process(self, instance):
+    ..     invalid = incremental.get_invalid(self, instance)
+
+"""
+
+import os
+import json
+import array
+import hashlib
+import collections
+
+from . import lib, mesh
+
+# Path to an on-disk ValidationCache, disabled when not set
+CACHE_ENVIRONMENT = "PYBLISH_MAGENTA_VALIDATION_CACHE"
+
+# Maximum amount of passing results kept in the cache
+MAX_ENTRIES = 200000
+
+# Modules the mesh validators rely on, changes invalidate the cache
+DEPENDENCIES = ("lib", "mesh", "topology", "components")
+
+
+class ValidationCache(object):
+    """Passing results of validators, stored on disk across sessions
+
+    Looking up a result moves it to the most recently used in memory
+    only, the cache is written when results were added or evicted and
+    the recency of results is kept along with those.
+
+    Arguments:
+        path (str): Path to JSON file of cache
+        max_entries (int, optional): Amount of results to keep, the
+            least recently used results are evicted first
+
+    Example:
+        >>> cache = ValidationCache(os.devnull, max_entries=2)
+        >>> cache.add("a")
+        >>> cache.add("b")
+        >>> "a" in cache
+        True
+        >>> cache.add("c")
+        >>> "a" in cache, "b" in cache, "c" in cache
+        (True, False, True)
+
+    """
+
+    def __init__(self, path, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._changed = False
+
+        if os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    keys = json.load(f)
+            except ValueError:
+                # A corrupt cache is rebuilt
+                keys = list()
+
+            # Stored from least to most recently used
+            for key in keys[-max_entries:]:
+                self._entries[key] = None
+
+    def __contains__(self, key):
+        if key not in self._entries:
+            return False
+
+        # Mark as most recently used, this alone is not saved
+        del self._entries[key]
+        self._entries[key] = None
+        return True
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, key):
+        """Store `key` as a passing result"""
+        if self._entries.pop(key, True):
+            self._changed = True
+        self._entries[key] = None
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self):
+        """Write the cache to disk, if results were added or evicted"""
+        if not self._changed:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(self.path, "w") as f:
+            json.dump(list(self._entries), f)
+        self._changed = False
+
+
+def get_validation_cache(context):
+    """Return the ValidationCache of the environment, if enabled
+
+    The cache is stored in the "validationCache" data of the context,
+    and read on first access.
+
+    """
+
+    if "validationCache" not in context.data:
+        path = os.environ.get(CACHE_ENVIRONMENT)
+        cache = ValidationCache(path) if path else None
+        context.data["validationCache"] = cache
+    return context.data["validationCache"]
+
+
+def _hash_code(md5, code):
+    """Add the byte code and constants of `code` to `md5`"""
+    md5.update(code.co_code)
+    md5.update(repr(code.co_names))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(md5, const)
+        else:
+            md5.update(repr(const))
+
+
+def _hash_modules(modules):
+    """Return a hash of the source files of `modules` of this package"""
+    md5 = hashlib.md5()
+    for module in modules:
+        path = os.path.join(os.path.dirname(__file__), module + ".py")
+        with open(path, "rb") as f:
+            md5.update(f.read())
+    return md5.hexdigest()
+
+
+_dependency_hash = None
+
+
+def plugin_key(plugin):
+    """Return the key of `plugin` results, changing with its code
+
+    Example:
+        >>> class ValidateMesh(object):
+        ...     version = (0, 1, 0)
+        ...     @staticmethod
+        ...     def get_invalid(instance):
+        ...         return []
+        >>> plugin_key(ValidateMesh()).split(":")[:2]
+        ['ValidateMesh', '0.1.0']
+
+    """
+
+    global _dependency_hash
+    if _dependency_hash is None:
+        _dependency_hash = _hash_modules(DEPENDENCIES)
+
+    get_invalid = plugin.get_invalid
+    get_invalid = getattr(get_invalid, "__func__", get_invalid)
+
+    md5 = hashlib.md5(_dependency_hash)
+    _hash_code(md5, get_invalid.__code__)
+
+    return "{0}:{1}:{2}".format(type(plugin).__name__,
+                                ".".join(str(v) for v in plugin.version),
+                                md5.hexdigest())
+
+
+def fingerprint_mesh(fn_mesh):
+    """Return the fingerprint of the topology and UV layout of a mesh
+
+    The UV layout includes which of the UV sets is current.
+
+    Arguments:
+        fn_mesh (MFnMesh): Function set of mesh
+
+    """
+
+    md5 = hashlib.md5(str(fn_mesh.numVertices))
+
+    counts, indices = fn_mesh.getVertices()
+    md5.update(array.array("i", counts).tostring())
+    md5.update(array.array("i", indices).tostring())
+
+    # Validators of UVs may only check the current set
+    md5.update(fn_mesh.currentUVSetName())
+
+    for uv_set in fn_mesh.getUVSetNames():
+        md5.update(uv_set)
+        md5.update(str(fn_mesh.numUVs(uv_set)))
+
+        uv_counts, uv_ids = fn_mesh.getAssignedUVs(uv_set)
+        md5.update(array.array("i", uv_counts).tostring())
+        md5.update(array.array("i", uv_ids).tostring())
+
+    return md5.hexdigest()
+
+
+def get_fingerprints(instance, meshes):
+    """Return the fingerprint of each of `meshes`
+
+    Fingerprints are stored in the "fingerprints" data of the instance,
+    and computed on first access per mesh.
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    fingerprints = instance.data.get("fingerprints")
+    if fingerprints is None:
+        fingerprints = instance.data["fingerprints"] = dict()
+
+    missing = [node for node in meshes if node not in fingerprints]
+    if missing:
+        selection = om.MSelectionList()
+        for node in missing:
+            selection.add(node)
+
+        fn_mesh = om.MFnMesh()
+        for i, node in enumerate(missing):
+            fn_mesh.setObject(selection.getDagPath(i))
+            fingerprints[node] = fingerprint_mesh(fn_mesh)
+
+    return dict((node, fingerprints[node]) for node in meshes)
+
+
+class Subset(list):
+    """The meshes of an instance that are to be validated
+
+    Holds the instance's scene index limited to these meshes and
+    its mesh statistics, for use by `get_invalid(instance)`.
+
+    """
+
+    def __init__(self, instance, nodes):
+        super(Subset, self).__init__(nodes)
+        self.name = instance.name
+        self.context = instance.context
+        self.data = {
+            "sceneIndex": lib.get_scene_index(instance).subset(nodes),
+            "meshStats": mesh.get_mesh_stats(instance)
+        }
+
+
+def validate(plugin, instance, meshes, cache):
+    """Validate those of `meshes` that did not pass `plugin` before
+
+    Arguments:
+        plugin (pyblish.api.Plugin): Plug-in with `get_invalid(instance)`
+        instance (pyblish.api.Instance): Instance holding `meshes`
+        meshes (list): Long names of meshes of `instance`
+        cache (ValidationCache): Cache of passing results, updated
+            with the meshes that pass
+
+    Returns:
+        tuple: The invalid nodes and the meshes that were validated
+
+    """
+
+    fingerprints = get_fingerprints(instance, meshes)
+
+    key = plugin_key(plugin)
+    keys = dict((node, "|".join([key, node, fingerprints[node]]))
+                for node in meshes)
+
+    changed = [node for node in meshes if keys[node] not in cache]
+    invalid = plugin.get_invalid(Subset(instance, changed)) if changed else []
+
+    # Results may be components, e.g. "|mesh.f[0]"
+    failed = set(node.split(".", 1)[0] for node in invalid)
+    for node in changed:
+        if node not in failed:
+            cache.add(keys[node])
+
+    return invalid, changed
+
+
+def get_invalid(plugin, instance):
+    """Return the invalid meshes of `instance` according to `plugin`
+
+    Only meshes that did not pass `plugin` before with their current
+    fingerprint are validated, when incremental validation is enabled.
+
+    """
+
+    cache = get_validation_cache(instance.context)
+    if cache is None:
+        return plugin.get_invalid(instance)
+
+    meshes = lib.get_scene_index(instance).ls(type="mesh")
+    invalid, changed = validate(plugin, instance, meshes, cache)
+
+    plugin.log.info("Validated {0} of {1} meshes, others passed "
+                    "before unchanged".format(len(changed), len(meshes)))
+
+    return invalid
@@ -1,5 +1,7 @@
 import os
 import re
+import copy
+import array
 
 import pyblish.api
 
@@ -109,3 +111,907 @@ def compute_publish_directory(path):
     """
     # TODO: Implement compute publish directory
     return ""
+
+
+class SceneIndex(object):
+    """Lookup tables for the nodes of an instance
+
+    Queries the Maya scene once for the long names, node types and
+    intermediate state of an instance's members and their DAG descendants.
+    Validators can then answer the usual `cmds.ls(instance, type=...)` and
+    `cmds.listRelatives` questions from memory instead of querying the
+    scene again for every plug-in.
+
+    The index covers the instance's members plus all of their DAG
+    descendants so relatives are resolved even when the instance
+    itself does not hold the full hierarchy. Only members are returned
+    from `ls()`.
+
+    Arguments:
+        nodes (list): Nodes of the instance
+
+    Example:
+        >> index = SceneIndex(instance)
+        >> meshes = index.ls(type="mesh")
+        >> transform = index.parent(meshes[0])
+
+    """
+
+    def __init__(self, nodes):
+        from maya import cmds
+
+        nodes = list(nodes)
+
+        self.nodes = list()
+        self.types = dict()
+        self.intermediates = set()
+        self.calls = 0
+
+        self._members = set()
+        self._children = dict()
+        self._inherited = dict()
+        self._partitions = dict()
+        self._type_cache = dict()
+
+        if not nodes:
+            return
+
+        # Members, listed with their type as [node, type, node, type, ..]
+        listed = cmds.ls(nodes, long=True, showType=True) or []
+        self.calls += 1
+        for node, node_type in zip(listed[::2], listed[1::2]):
+            if node in self._members:
+                continue
+            self._members.add(node)
+            self.nodes.append(node)
+            self.types[node] = node_type
+            self._partitions.setdefault(node_type, list()).append(node)
+
+        # All DAG descendants, to resolve relatives outside of the instance
+        listed = cmds.ls(nodes, dag=True, long=True, showType=True) or []
+        self.calls += 1
+        for node, node_type in zip(listed[::2], listed[1::2]):
+            self.types.setdefault(node, node_type)
+
+        self.intermediates.update(cmds.ls(nodes,
+                                          dag=True,
+                                          intermediateObjects=True,
+                                          long=True) or [])
+        self.calls += 1
+
+        for node in self.types:
+            parent = self.parent(node)
+            if parent is not None:
+                self._children.setdefault(parent, list()).append(node)
+
+        for node_type in set(self.types.values()):
+            inherited = cmds.nodeType(node_type,
+                                      inherited=True,
+                                      isTypeName=True) or [node_type]
+            self._inherited[node_type] = frozenset(inherited)
+            self.calls += 1
+
+    def __contains__(self, node):
+        return node in self._members
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def node_type(self, node):
+        """Return the exact type of `node`, or None if not indexed"""
+        return self.types.get(node)
+
+    def is_a(self, node, node_type):
+        """Return whether `node` is of, or inherits from, `node_type`"""
+        exact = self.types.get(node)
+        if exact is None:
+            return False
+        return node_type in self._inherited.get(exact, (exact,))
+
+    def is_intermediate(self, node):
+        return node in self.intermediates
+
+    def ls(self, type=None, noIntermediate=False):
+        """Return members of the instance, similar to `cmds.ls`
+
+        Arguments:
+            type (str or tuple): Only return nodes of, or inheriting
+                from, any of these types.
+            noIntermediate (bool): Exclude intermediate objects
+
+        """
+
+        if type is None:
+            nodes = self.nodes
+        else:
+            nodes = self._partition(type)
+
+        if noIntermediate:
+            nodes = [node for node in nodes if node not in self.intermediates]
+
+        return list(nodes)
+
+    def subset(self, nodes):
+        """Return an index of only the members among `nodes`
+
+        The subset shares the lookup tables of this index and is
+        built without querying the scene.
+
+        """
+
+        nodes = set(nodes)
+
+        subset = copy.copy(self)
+        subset.nodes = [node for node in self.nodes if node in nodes]
+        subset._members = set(subset.nodes)
+        subset._partitions = dict()
+        subset._type_cache = dict()
+        for node in subset.nodes:
+            subset._partitions.setdefault(
+                self.types[node], list()).append(node)
+
+        return subset
+
+    def parent(self, node):
+        """Return the long name of the parent of `node`, if any"""
+        if "|" not in node:
+            return None
+        return node.rsplit("|", 1)[0] or None
+
+    def children(self, node, type=None, noIntermediate=False):
+        """Return the direct children of `node`
+
+        Arguments:
+            node (str): Long name of DAG node
+            type (str or tuple): Only return children of, or inheriting
+                from, any of these types.
+            noIntermediate (bool): Exclude intermediate objects
+
+        """
+
+        children = self._children.get(node, [])
+
+        if type is not None:
+            types = (type,) if isinstance(type, basestring) else type
+            children = [child for child in children
+                        if any(self.is_a(child, t) for t in types)]
+
+        if noIntermediate:
+            children = [child for child in children
+                        if child not in self.intermediates]
+
+        return list(children)
+
+    def descendants(self, node):
+        """Return all DAG descendants of `node`"""
+        descendants = list()
+        queue = list(self._children.get(node, []))
+        while queue:
+            child = queue.pop()
+            descendants.append(child)
+            queue.extend(self._children.get(child, []))
+        return descendants
+
+    def shapes(self, transform, noIntermediate=True):
+        """Return the shapes directly parented under `transform`"""
+        return self.children(transform,
+                             type="shape",
+                             noIntermediate=noIntermediate)
+
+    def transform(self, shape):
+        """Return the transform of `shape`"""
+        return self.parent(shape)
+
+    def assemblies(self):
+        """Return the members that live at the root of the DAG"""
+        return [node for node in self.nodes if node.count("|") == 1]
+
+    def _partition(self, types):
+        if isinstance(types, basestring):
+            types = (types,)
+
+        key = tuple(types)
+        if key not in self._type_cache:
+            nodes = list()
+            for exact, partition in self._partitions.iteritems():
+                inherited = self._inherited.get(exact, (exact,))
+                if any(t in inherited for t in types):
+                    nodes.extend(partition)
+
+            # Maintain the order of the members
+            members = set(nodes)
+            self._type_cache[key] = [node for node in self.nodes
+                                     if node in members]
+
+        return self._type_cache[key]
+
+
+def get_scene_index(instance):
+    """Return the SceneIndex of `instance`
+
+    The index is built by CollectSceneIndex, but is built here
+    on first access whenever that collector did not run.
+
+    """
+
+    index = instance.data.get("sceneIndex")
+    if index is None:
+        get_dag_paths(instance)  # Expand the membership, if not yet
+        index = SceneIndex(instance)
+        instance.data["sceneIndex"] = index
+    return index
+
+
+def get_upstream_hierarchy(nodes):
+    """Return the unique parents of `nodes`
+
+    Passed in nodes must be long names! Parents are found by splitting
+    the DAG paths so no scene queries are made.
+
+    Example:
+        >>> get_upstream_hierarchy(["|a|b|c", "|a|b|d", "set1"])
+        ['|a|b', '|a']
+
+    """
+
+    parents = list()
+    visited = set()
+
+    for node in nodes:
+        if "|" not in node:
+            continue  # Not a DAG node
+
+        parent = node.rsplit("|", 1)[0]
+        while parent and parent not in visited:
+            visited.add(parent)
+            parents.append(parent)
+            parent = parent.rsplit("|", 1)[0]
+
+    return parents
+
+
+def split_by_assembly(paths):
+    """Group DAG paths by their assembly (root node)
+
+    This is the first level of a path-prefix trie and is all that is
+    needed to split the descendants of one batched query between
+    instances that expand from their root nodes.
+
+    Example:
+        >>> groups = split_by_assembly(["|a", "|a|b", "|c|d"])
+        >>> sorted(groups.items())
+        [('|a', ['|a', '|a|b']), ('|c', ['|c|d'])]
+
+    Returns:
+        dict: {assembly: [path, ..]}
+
+    """
+
+    groups = dict()
+    for path in paths:
+        # A long name starts with "|", the assembly is the first entry
+        assembly = "|" + path.split("|", 2)[1]
+        try:
+            groups[assembly].append(path)
+        except KeyError:
+            groups[assembly] = [path]
+    return groups
+
+
+def read_user_attributes(nodes):
+    """Return the user-defined attributes of `nodes` and their values
+
+    All nodes are read in a single pass through the Maya API, as opposed
+    to one `cmds.getAttr` per attribute. Attributes whose value cannot be
+    read (e.g. message attributes) are skipped.
+
+    Arguments:
+        nodes (list): Names of nodes
+
+    Returns:
+        dict: {node: [(attribute, value), ..]}
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    selection = om.MSelectionList()
+    for node in nodes:
+        selection.add(node)
+
+    result = dict()
+    for i, node in enumerate(nodes):
+        fn_node = om.MFnDependencyNode(selection.getDependNode(i))
+
+        user_data = list()
+        for j in range(fn_node.attributeCount()):
+            attr = fn_node.attribute(j)
+            fn_attr = om.MFnAttribute(attr)
+            if not fn_attr.dynamic or not fn_attr.parent.isNull():
+                continue
+
+            plug = om.MPlug(fn_node.object(), attr)
+            try:
+                value = _plug_value(plug, node + "." + fn_attr.name)
+            except RuntimeError:
+                continue
+
+            user_data.append((fn_attr.name, value))
+
+        result[node] = user_data
+
+    return result
+
+
+def get_user_attributes(context, nodes):
+    """Return the user-defined attributes of `nodes` and their values
+
+    The attributes are read once per context, nodes not read before are
+    read in a single pass and stored in its "userAttributes" data.
+
+    Returns:
+        dict: {node: [(attribute, value), ..]}
+
+    """
+
+    snapshot = context.data.get("userAttributes")
+    if snapshot is None:
+        snapshot = context.data["userAttributes"] = dict()
+
+    missing = [node for node in nodes if node not in snapshot]
+    if missing:
+        snapshot.update(read_user_attributes(missing))
+
+    return dict((node, snapshot[node]) for node in nodes)
+
+
+def _plug_value(plug, path):
+    """Return the value of `plug` as `cmds.getAttr` would
+
+    Simple numeric, enum and string attributes are read through the
+    API directly. Any other attribute falls back to `cmds.getAttr`
+    using `path`, the "node.attribute" name of the plug.
+
+    Raises:
+        RuntimeError: When the value of the plug can not be read.
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    attr = plug.attribute()
+
+    if not plug.isArray and not plug.isCompound:
+        if attr.hasFn(om.MFn.kEnumAttribute):
+            return plug.asShort()
+
+        if attr.hasFn(om.MFn.kNumericAttribute):
+            numeric_type = om.MFnNumericAttribute(attr).numericType()
+            if numeric_type == om.MFnNumericData.kBoolean:
+                return plug.asBool()
+            if numeric_type in (om.MFnNumericData.kByte,
+                                om.MFnNumericData.kChar,
+                                om.MFnNumericData.kShort,
+                                om.MFnNumericData.kInt,
+                                om.MFnNumericData.kLong):
+                return plug.asInt()
+            if numeric_type in (om.MFnNumericData.kFloat,
+                                om.MFnNumericData.kDouble):
+                return plug.asDouble()
+
+        if attr.hasFn(om.MFn.kTypedAttribute):
+            data_type = om.MFnTypedAttribute(attr).attrType()
+            if data_type == om.MFnData.kString:
+                return plug.asString()
+
+    from maya import cmds
+    return cmds.getAttr(path)
+
+
+class AttributeTable(object):
+    """Values of the same attributes for many nodes, stored per column
+
+    Each attribute holds a column of values, one per node, in the order
+    of `nodes`. Attributes that do not exist on a node are masked: their
+    value is None and their entry in `mask` is False.
+
+    """
+
+    def __init__(self, nodes, attributes):
+        self.nodes = list(nodes)
+        self.attributes = list(attributes)
+        self.columns = dict((attr, [None] * len(self.nodes))
+                            for attr in self.attributes)
+        self.mask = dict((attr, [False] * len(self.nodes))
+                         for attr in self.attributes)
+        self._rows = dict((node, row) for row, node in enumerate(self.nodes))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def column(self, attribute):
+        """Return the values of `attribute` for all nodes"""
+        return self.columns[attribute]
+
+    def get(self, node, attribute, default=None):
+        """Return the value of `attribute` of `node`, or `default`"""
+        row = self._rows[node]
+        if not self.mask[attribute][row]:
+            return default
+        return self.columns[attribute][row]
+
+    def mismatches(self, values):
+        """Return existing attributes that differ from `values`
+
+        Arguments:
+            values (dict): Required value per attribute
+
+        Returns:
+            list: (node, attribute, required value) for each mismatch
+
+        """
+
+        mismatches = list()
+        for attr, required in values.iteritems():
+            column = self.columns[attr]
+            mask = self.mask[attr]
+            for row, node in enumerate(self.nodes):
+                if mask[row] and column[row] != required:
+                    mismatches.append((node, attr, required))
+        return mismatches
+
+    def differs(self, values):
+        """Return the nodes with any attribute that differs from `values`"""
+        invalid = set(node for node, _, _ in self.mismatches(values))
+        return [node for node in self.nodes if node in invalid]
+
+
+def read_attributes(nodes, attributes):
+    """Read `attributes` of all `nodes` in a single pass
+
+    As opposed to an `attributeQuery` and `getAttr` per node and
+    attribute the nodes are looked up once in an MSelectionList and
+    their plugs are read through the API.
+
+    Arguments:
+        nodes (list): Names of nodes
+        attributes (list): Names of attributes to read
+
+    Returns:
+        AttributeTable: Values per attribute, masked where missing
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    table = AttributeTable(nodes, attributes)
+    if not table.nodes:
+        return table
+
+    # The selection list merges duplicates, nodes given more than
+    # once are looked up by their first index
+    unique = dict()
+    selection = om.MSelectionList()
+    for node in table.nodes:
+        if node not in unique:
+            unique[node] = len(unique)
+            selection.add(node)
+
+    for row, node in enumerate(table.nodes):
+        fn_node = om.MFnDependencyNode(selection.getDependNode(unique[node]))
+        for attr in table.attributes:
+            if not fn_node.hasAttribute(attr):
+                continue
+
+            plug = fn_node.findPlug(attr, False)
+            try:
+                value = _plug_value(plug, node + "." + attr)
+            except RuntimeError:
+                continue
+
+            table.columns[attr][row] = value
+            table.mask[attr][row] = True
+
+    return table
+
+
+def write_attributes(edits):
+    """Set many attribute values as a single undoable step
+
+    Only the given values are set, e.g. the mismatches of a table, and
+    all of them are undone at once.
+
+    Arguments:
+        edits (list): (node, attribute, value) per attribute to set,
+            e.g. as returned by `AttributeTable.mismatches()`
+
+    """
+
+    from maya import cmds
+
+    edits = list(edits)
+    if not edits:
+        return
+
+    cmds.undoInfo(openChunk=True, chunkName="write_attributes")
+    try:
+        for node, attr, value in edits:
+            plug = "{0}.{1}".format(node, attr)
+            if isinstance(value, basestring):
+                cmds.setAttr(plug, value, type="string")
+            else:
+                cmds.setAttr(plug, value)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+class DagPathTable(object):
+    """Table of interned node paths shared by all instances of a context
+
+    Every path is stored once and identified by its index in the table.
+    The parent of each DAG path is stored as an index too, so the
+    hierarchy can be walked without splitting strings. Instances hold
+    their membership as a DagPathSet, a bitset over these indices.
+
+    Example:
+        >>> table = DagPathTable()
+        >>> members = table.membership(["|a|b", "|a|c", "set1"])
+        >>> "|a|b" in members
+        True
+        >>> table.parent("|a|b")
+        '|a'
+        >>> table.find("b")
+        ['|a|b']
+
+    """
+
+    def __init__(self):
+        self.paths = list()
+        self.parents = array.array("l")
+
+        self._indices = dict()
+        self._names = dict()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, path):
+        return path in self._indices
+
+    def __getitem__(self, index):
+        return self.paths[index]
+
+    def add(self, path):
+        """Intern `path` (and its parents), returning its index"""
+        try:
+            return self._indices[path]
+        except KeyError:
+            pass
+
+        parent = -1
+        if "|" in path:
+            head, name = path.rsplit("|", 1)
+            if head:
+                parent = self.add(head)
+        else:
+            name = path
+
+        # Maya returns unicode, of which node names are ASCII only
+        path = intern(str(path))
+        index = len(self.paths)
+        self.paths.append(path)
+        self.parents.append(parent)
+        self._indices[path] = index
+        self._names.setdefault(name, list()).append(index)
+
+        return index
+
+    def index(self, path):
+        """Return the index of `path`, raises KeyError if not present"""
+        return self._indices[path]
+
+    def parent(self, path):
+        """Return the parent path of `path`, or None"""
+        parent = self.parents[self._indices[path]]
+        return self.paths[parent] if parent >= 0 else None
+
+    def find(self, suffix):
+        """Return all paths that end with `suffix`
+
+        The suffix must consist of whole names, e.g. "b" or "a|b"
+        match "|a|b" but "b" does not match "|a|xb".
+
+        """
+
+        name = suffix.rsplit("|", 1)[-1]
+        matches = list()
+        for index in self._names.get(name, []):
+            path = self.paths[index]
+            if (path == suffix or
+                    path.endswith("|" + suffix.lstrip("|"))):
+                matches.append(path)
+        return matches
+
+    def membership(self, paths):
+        """Intern `paths` and return them as a DagPathSet"""
+        return self.subset([self.add(path) for path in paths])
+
+    def subset(self, indices):
+        """Return the paths at `indices` as a DagPathSet"""
+        if not indices:
+            return DagPathSet(self)
+
+        # Build the bitset as a binary string, setting bits one by one
+        # on a large integer would copy the integer for every path.
+        binary = bytearray(b"0") * (max(indices) + 1)
+        for index in indices:
+            binary[index] = ord("1")
+
+        paths = DagPathSet(self, int(binary[::-1].decode("ascii"), 2))
+        paths._indices = frozenset(indices)
+        return paths
+
+
+class DagPathSet(object):
+    """A set of paths in a DagPathTable, stored as a bitset
+
+    Supports fast membership tests, union (|), intersection (&) and
+    difference (-) with other sets of the same table.
+
+    Sets are immutable. Membership tests and the length are answered by
+    the indices of the set, collected from the bitset on first use, as
+    shifting the bitset would copy all of it per test.
+
+    """
+
+    def __init__(self, table, bits=0):
+        self.table = table
+        self.bits = bits
+        self._indices = None
+
+    def __contains__(self, path):
+        try:
+            index = self.table.index(path)
+        except KeyError:
+            return False
+        return index in self._index_set()
+
+    def __iter__(self):
+        for index in self.indices():
+            yield self.table.paths[index]
+
+    def __len__(self):
+        return len(self._index_set())
+
+    def __nonzero__(self):
+        return bool(self.bits)
+
+    __bool__ = __nonzero__
+
+    def __eq__(self, other):
+        return self.table is other.table and self.bits == other.bits
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __or__(self, other):
+        return DagPathSet(self.table, self.bits | self._bits(other))
+
+    def __and__(self, other):
+        return DagPathSet(self.table, self.bits & self._bits(other))
+
+    def __sub__(self, other):
+        return DagPathSet(self.table, self.bits & ~self._bits(other))
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+
+    def indices(self):
+        """Yield the indices of the paths in this set, in table order"""
+        binary = bin(self.bits)[:1:-1]  # Lowest bit first
+        index = binary.find("1")
+        while index != -1:
+            yield index
+            index = binary.find("1", index + 1)
+
+    def find(self, suffix):
+        """Return the paths in this set that end with `suffix`"""
+        return [path for path in self.table.find(suffix) if path in self]
+
+    def _index_set(self):
+        if self._indices is None:
+            self._indices = frozenset(self.indices())
+        return self._indices
+
+    def _bits(self, other):
+        assert other.table is self.table, "Sets are of different tables"
+        return other.bits
+
+
+def get_dag_path_table(context):
+    """Return the DagPathTable shared by the instances of `context`"""
+    table = context.data.get("dagPathTable")
+    if table is None:
+        table = DagPathTable()
+        context.data["dagPathTable"] = table
+    return table
+
+
+def get_dag_paths(instance):
+    """Return the membership of `instance` as a DagPathSet
+
+    Instances collected by CollectInstances carry their object set
+    members as "setMembers" and are expanded to the members' parents and
+    all descendants of their assemblies here, on first access. Other
+    instances are built from their contents.
+
+    Instances of which "withHistory" is set, see CollectMayaHistory,
+    include the upstream history of their members.
+
+    The result is stored as "dagPaths" and the contents of the instance
+    are updated to match.
+
+    """
+
+    paths = instance.data.get("dagPaths")
+    if paths is None:
+        if instance.data.get("setMembersChanged"):
+            from maya import cmds
+            objset = instance.data["objSetName"]
+            members = cmds.sets(objset, query=True) or []
+            instance.data["setMembers"] = cmds.ls(members, long=True)
+            instance.data["setMembersChanged"] = False
+
+        members = instance.data.get("setMembers")
+        if members is not None:
+            paths = expand_members(instance.context, members)
+        else:
+            table = get_dag_path_table(instance.context)
+            paths = table.membership(instance)
+
+        if instance.data.get("withHistory"):
+            from . import history
+            graph = history.get_history_graph(instance.context)
+            paths |= graph.history(paths)
+
+        if members is not None or instance.data.get("withHistory"):
+            instance[:] = list(paths)
+        instance.data["dagPaths"] = paths
+    return paths
+
+
+def get_assembly_roots(nodes):
+    """Return the unique assemblies (root nodes) of `nodes`
+
+    Example:
+        >>> sorted(get_assembly_roots(["|a|b", "|a", "|c|d", "set1"]))
+        ['|a', '|c']
+
+    """
+
+    return set("|" + node.split("|", 2)[1]
+               for node in nodes if node.startswith("|"))
+
+
+def get_assemblies(context, roots):
+    """Return all descendants of `roots`, excluding intermediate objects
+
+    Roots not listed before within `context` are listed in a single
+    query and stored as DagPathSets in its "assemblies" data.
+
+    Returns:
+        dict: {root: DagPathSet}
+
+    """
+
+    cache = context.data.get("assemblies")
+    if cache is None:
+        cache = context.data["assemblies"] = dict()
+
+    missing = [root for root in roots if root not in cache]
+    if missing:
+        from maya import cmds
+
+        table = get_dag_path_table(context)
+        descendants = cmds.ls(missing,
+                              dag=True,
+                              noIntermediate=True,
+                              long=True)
+        for root, paths in split_by_assembly(descendants).iteritems():
+            cache[root] = table.membership(paths)
+        for root in missing:
+            cache.setdefault(root, DagPathSet(table))
+
+    return dict((root, cache[root]) for root in roots)
+
+
+def expand_members(context, members):
+    """Return `members`, their parents and all their assemblies' descendants
+
+    Arguments:
+        context (pyblish.api.Context): Context holding the DagPathTable
+            and previously listed assemblies
+        members (list): Long names of nodes
+
+    """
+
+    parents = get_upstream_hierarchy(members)
+
+    table = get_dag_path_table(context)
+    paths = table.membership(members + parents)
+    roots = get_assembly_roots(members)
+    for descendants in get_assemblies(context, roots).values():
+        paths |= descendants
+    return paths
+
+
+# Data computed from the membership of an instance
+MEMBERSHIP_DATA = ("dagPaths", "sceneIndex", "meshStats", "fingerprints",
+                   "transformTable", "bounds", "naming")
+
+def invalidate_membership(instance):
+    """Drop the membership of `instance` and all data computed from it
+
+    The members of its object set are read again, and expanded, on the
+    next call to `get_dag_paths()`, e.g. after nodes were renamed or
+    deleted.
+
+    """
+
+    if "objSetName" in instance.data:
+        instance.data["setMembersChanged"] = True
+    for key in MEMBERSHIP_DATA:
+        instance.data.pop(key, None)
+
+    # The hierarchy and connections may have changed along with the
+    # members
+    instance.context.data.pop("assemblies", None)
+    instance.context.data.pop("historyGraph", None)
+
+
+# Callbacks of the most recent collection, see watch_set_members()
+_set_callbacks = list()
+
+
+def unwatch_set_members():
+    """Remove all callbacks registered by `watch_set_members()`"""
+    from maya.api import OpenMaya as om
+
+    while _set_callbacks:
+        om.MMessage.removeCallback(_set_callbacks.pop())
+
+
+def watch_set_members(instance):
+    """Invalidate the membership of `instance` when its object set changes
+
+    The members are read again and expanded on the next call to
+    `get_dag_paths()`.
+
+    The callbacks hold on to their instances, and through these to the
+    context, so they are removed as a whole on a new or opened scene, or
+    through `unwatch_set_members()` before collecting again.
+
+    """
+
+    from maya.api import OpenMaya as om
+
+    if not _set_callbacks:
+        for message in (om.MSceneMessage.kBeforeNew,
+                        om.MSceneMessage.kBeforeOpen):
+            _set_callbacks.append(om.MSceneMessage.addCallback(
+                message, lambda *args: unwatch_set_members()))
+
+    objset = instance.data["objSetName"]
+
+    def invalidate(*args):
+        invalidate_membership(instance)
+
+    selection = om.MSelectionList()
+    selection.add(objset)
+    callback = om.MObjectSetMessage.addSetMembersModifiedCallback(
+        selection.getDependNode(0), invalidate)
+    _set_callbacks.append(callback)
@@ -0,0 +1,337 @@
+"""Array access to per-component mesh data
+
+Reads per-component mesh data through MFnMesh into contiguous arrays,
+NumPy arrays when NumPy is available and `array.array` otherwise, so
+mesh validators can check millions of components with a handful of
+calls as opposed to one command per component.
+
+Example:
+    >> counts = face_vertex_counts("|ben_GEO|ben_GEOShape")
+    >> any_nonzero(point_tweaks("|ben_GEO|ben_GEOShape"))
+
+"""
+
+import array
+import itertools
+
+from . import components
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Meshes with fewer vertices than this are cheap enough to check with
+# maya.cmds; the arrays are only worth it for heavier meshes.
+CMDS_THRESHOLD = 10000
+
+_DTYPES = {
+    "B": "bool",
+    "i": "int32",
+    "f": "float32",
+    "d": "float64"
+}
+
+
+def as_array(values, typecode):
+    """Return sequence `values` as a contiguous array
+
+    Arguments:
+        values (sequence): Values to convert, must support `len()`
+        typecode (str): Type of the values as used by `array.array`,
+            one of "B" (flags), "i", "f" or "d"
+
+    """
+
+    if numpy is not None:
+        return numpy.fromiter(values,
+                              dtype=_DTYPES[typecode],
+                              count=len(values))
+    return array.array(typecode, values)
+
+
+def any_nonzero(values, tolerance=0.0):
+    """Return whether any of `values` deviates more than `tolerance` from 0"""
+    if numpy is not None:
+        return bool(numpy.any(numpy.abs(values) > tolerance))
+    return any(abs(value) > tolerance for value in values)
+
+
+def get_mesh_fn(mesh):
+    """Return an MFnMesh for `mesh`"""
+    from maya.api import OpenMaya as om
+
+    selection = om.MSelectionList()
+    selection.add(mesh)
+    return om.MFnMesh(selection.getDagPath(0))
+
+
+def vertex_count(mesh):
+    """Return the amount of vertices of `mesh`"""
+    return get_mesh_fn(mesh).numVertices
+
+
+def face_vertex_counts(mesh):
+    """Return the amount of vertices of each face of `mesh`"""
+    counts, _ = get_mesh_fn(mesh).getVertices()
+    return as_array(counts, "i")
+
+
+def uv_counts(mesh, uv_set=None):
+    """Return the amount of UVs assigned to each face of `mesh`
+
+    Arguments:
+        mesh (str): Name of mesh
+        uv_set (str, optional): UV set to read, defaults to current
+
+    """
+
+    fn_mesh = get_mesh_fn(mesh)
+    if uv_set is None:
+        uv_set = fn_mesh.currentUVSetName()
+    counts, _ = fn_mesh.getAssignedUVs(uv_set)
+    return as_array(counts, "i")
+
+
+# Value of the user normals of a mesh that are not set, i.e. unlocked
+UNSET_NORMAL = 1e20
+
+
+def locked_normals(mesh):
+    """Return the locked state of each user normal of `mesh`
+
+    Locked normals are stored per face-vertex in the "normals" attribute
+    of the mesh, with UNSET_NORMAL for face-vertices that are not locked.
+    Only the entries that exist are read, in contiguous ranges like
+    `point_tweaks()`, and meshes of which no normal was ever locked are
+    checked with a single query.
+
+    """
+
+    from maya import cmds
+    from maya.api import OpenMaya as om
+
+    fn_node = om.MFnDependencyNode(get_mesh_fn(mesh).object())
+    plug = fn_node.findPlug("normals", False)
+    indices = plug.getExistingArrayAttributeIndices()
+
+    flags = list()
+    for start, end in _runs(indices):
+        normals = cmds.getAttr("{0}.normals[{1}:{2}]".format(mesh,
+                                                             start,
+                                                             end))
+        flags.extend(abs(normal[0]) < UNSET_NORMAL / 10
+                     for normal in normals)
+
+    return as_array(flags, "B")
+
+
+def point_tweaks(mesh):
+    """Return the internal point offsets (tweaks) of `mesh`
+
+    Only tweaks that exist on the mesh are returned, as a flat array
+    of x, y, z values. The existing indices are read in contiguous
+    ranges, usually resulting in a single query for the whole mesh.
+
+    """
+
+    from maya import cmds
+    from maya.api import OpenMaya as om
+
+    fn_node = om.MFnDependencyNode(get_mesh_fn(mesh).object())
+    indices = fn_node.findPlug("pnts", False).getExistingArrayAttributeIndices()
+
+    values = list()
+    for start, end in _runs(indices):
+        points = cmds.getAttr("{0}.pnts[{1}:{2}]".format(mesh, start, end))
+        values.extend(itertools.chain.from_iterable(points))
+
+    return as_array(values, "f")
+
+
+def _runs(indices):
+    """Yield (start, end) of consecutive runs in sorted `indices`"""
+    start = end = None
+    for index in indices:
+        if start is None:
+            start = end = index
+        elif index == end + 1:
+            end = index
+        else:
+            yield start, end
+            start = end = index
+
+    if start is not None:
+        yield start, end
+
+
+class MeshStats(object):
+    """Statistics of a single mesh as used by the mesh validators
+
+    Attributes:
+        vertices (int): Amount of vertices
+        edges (int): Amount of edges
+        faces (int): Amount of faces
+        uvs (int): Amount of UVs in the current UV set
+        uv_vertices (int): Amount of vertices with UVs, only computed
+            when there are less UVs than vertices, otherwise None.
+        edge_vertices (int): Amount of vertices connected to edges
+        uv_sets (list): Unique names of all UV sets
+        non_manifold_vertices (list): Non-manifold vertex components
+        non_manifold_edges (list): Non-manifold edge components
+        lamina_faces (list): Lamina face components
+
+    Meshes of CMDS_THRESHOLD vertices or more are analyzed from their
+    arrays by the topology module when NumPy is available.
+
+    """
+
+    def __init__(self, mesh):
+        from maya import cmds
+
+        self.mesh = mesh
+
+        fn_mesh = get_mesh_fn(mesh)
+        self.vertices = fn_mesh.numVertices
+        self.edges = fn_mesh.numEdges
+        self.faces = fn_mesh.numPolygons
+        self.uvs = cmds.polyEvaluate(mesh, uv=True)
+
+        # Ensure unique (sometimes maya will list 'map1' twice)
+        uv_sets = cmds.polyUVSet(mesh, query=True, allUVSets=True) or []
+        self.uv_sets = sorted(set(uv_sets))
+
+        if numpy is not None and self.vertices >= CMDS_THRESHOLD:
+            self._from_topology(fn_mesh)
+        else:
+            self._from_commands()
+
+    def _from_commands(self):
+        """Compute the topology statistics with maya.cmds"""
+        from maya import cmds
+
+        mesh = self.mesh
+
+        self.uv_vertices = None
+        if 0 < self.uvs < self.vertices:
+            self.uv_vertices = components.count(
+                cmds.polyListComponentConversion(mesh + ".map[*]",
+                                                 toVertex=True) or [])
+
+        self.edge_vertices = components.count(
+            cmds.polyListComponentConversion(mesh + ".e[*]",
+                                             toVertex=True) or [])
+
+        self.non_manifold_vertices = cmds.polyInfo(
+            mesh, nonManifoldVertices=True) or []
+        self.non_manifold_edges = cmds.polyInfo(
+            mesh, nonManifoldEdges=True) or []
+        self.lamina_faces = cmds.polyInfo(mesh, laminaFaces=True) or []
+
+    def _from_topology(self, fn_mesh):
+        """Compute the topology statistics from the arrays of the mesh"""
+        from . import topology
+
+        counts, indices = fn_mesh.getVertices()
+        uv_counts, _ = fn_mesh.getAssignedUVs(fn_mesh.currentUVSetName())
+        result = topology.analyze(as_array(counts, "i"),
+                                  as_array(indices, "i"),
+                                  vertex_count=self.vertices,
+                                  uv_counts=as_array(uv_counts, "i"))
+
+        self.uv_vertices = None
+        if 0 < self.uvs < self.vertices:
+            self.uv_vertices = (self.vertices -
+                                len(result.vertices_without_uvs))
+
+        self.edge_vertices = self.vertices - len(result.isolated_vertices)
+
+        self.non_manifold_vertices = _as_components(
+            self.mesh, "vtx", result.non_manifold_vertices)
+        self.non_manifold_edges = _as_components(
+            self.mesh, "e", _edge_indices(
+                fn_mesh, result.edges[result.non_manifold_edges]))
+        self.lamina_faces = _as_components(
+            self.mesh, "f", result.lamina_faces)
+
+
+def _as_components(mesh, component_type, indices):
+    """Return sorted `indices` as a list of Maya component ranges"""
+    intervals = components.IntervalSet(_runs(indices))
+    return intervals.components(mesh, component_type)
+
+
+def _edge_indices(fn_mesh, pairs):
+    """Return the indices of the edges between vertex `pairs` of a mesh"""
+    from maya.api import OpenMaya as om
+
+    iterator = om.MItMeshVertex(fn_mesh.dagPath())
+
+    indices = set()
+    for low, high in pairs:
+        iterator.setIndex(int(low))
+        for edge in iterator.getConnectedEdges():
+            if int(high) in fn_mesh.getEdgeVertices(edge):
+                indices.add(edge)
+
+    return sorted(indices)
+
+
+class MeshStatsCache(object):
+    """MeshStats of many meshes, computed on first access
+
+    Each mesh has a dirty counter that is part of the key of its cached
+    statistics. Marking a mesh dirty, e.g. after it was repaired, bumps
+    its counter so the statistics are computed again on next access.
+
+    """
+
+    def __init__(self):
+        self._stats = dict()
+        self._counters = dict()
+
+    def __contains__(self, mesh):
+        return (mesh, self.counter(mesh)) in self._stats
+
+    def counter(self, mesh):
+        """Return the dirty counter of `mesh`"""
+        return self._counters.get(mesh, 0)
+
+    def get(self, mesh):
+        """Return the MeshStats of `mesh`"""
+        key = (mesh, self.counter(mesh))
+        try:
+            return self._stats[key]
+        except KeyError:
+            stats = MeshStats(mesh)
+            self._stats[key] = stats
+            return stats
+
+    def update(self, meshes):
+        """Compute the statistics of all `meshes` that are not cached"""
+        for mesh in meshes:
+            self.get(mesh)
+
+    def dirty(self, meshes=None):
+        """Mark `meshes`, or all meshes when None, as dirty"""
+        if meshes is None:
+            meshes = set(mesh for mesh, _ in self._stats)
+
+        for mesh in meshes:
+            self._stats.pop((mesh, self.counter(mesh)), None)
+            self._counters[mesh] = self.counter(mesh) + 1
+
+
+def get_mesh_stats(instance):
+    """Return the MeshStatsCache of `instance`
+
+    The cache is filled by CollectMeshStats, but is created here
+    on first access whenever that plug-in did not run.
+
+    """
+
+    cache = instance.data.get("meshStats")
+    if cache is None:
+        cache = MeshStatsCache()
+        instance.data["meshStats"] = cache
+    return cache
@@ -0,0 +1,123 @@
+"""Metadata of instances, layered over metadata shared by the context
+
+Each instance holds its own layer of metadata on top of the metadata
+of the context, which is shared by all instances rather than copied
+into each of them. Writes go to the layer of the instance, such that
+the shared metadata is never changed through an instance. Mutable
+values (dictionaries and lists) of the shared metadata are copied into
+the layer of an instance on first access, as opposed to copying all
+metadata up front.
+
+Example:
+    >>> shared = {"author": "marcus", "tags": ["model"]}
+    >>> a, b = LayeredMetadata(shared), LayeredMetadata(shared)
+    >>> a["author"] = "roy"
+    >>> a["tags"].append("ben")
+    >>> del b["author"]
+    >>> sorted(a.items())
+    [('author', 'roy'), ('tags', ['model', 'ben'])]
+    >>> sorted(b.items())
+    [('tags', ['model'])]
+    >>> sorted(shared.items())
+    [('author', 'marcus'), ('tags', ['model'])]
+
+"""
+
+import copy
+import json
+import collections
+
+# Marks a shared key as deleted in a layer
+_DELETED = object()
+
+
+class LayeredMetadata(collections.MutableMapping):
+    """Dictionary of metadata on top of shared metadata
+
+    Arguments:
+        shared (dict): Metadata shared with other instances, not
+            altered by this layer
+        layer (dict, optional): Initial metadata of this layer
+
+    """
+
+    def __init__(self, shared, layer=None):
+        self.shared = shared
+        self.layer = dict(layer or {})
+
+    def __getitem__(self, key):
+        try:
+            value = self.layer[key]
+        except KeyError:
+            value = self.shared[key]
+
+            # Copied on first access, the caller may alter it in place
+            if isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
+                self.layer[key] = value
+
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.layer[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        if key in self.shared:
+            self.layer[key] = _DELETED
+        else:
+            del self.layer[key]
+
+    def __contains__(self, key):
+        if key in self.layer:
+            return self.layer[key] is not _DELETED
+        return key in self.shared
+
+    def __iter__(self):
+        for key in self.layer:
+            if self.layer[key] is not _DELETED:
+                yield key
+        for key in self.shared:
+            if key not in self.layer:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(self.view())
+
+    def view(self):
+        """Return the metadata as a single dictionary
+
+        Values are not copied, and shared values may not be altered
+        through the returned dictionary.
+
+        """
+
+        view = dict(self.shared)
+        view.update(self.layer)
+        for key, value in self.layer.items():
+            if value is _DELETED:
+                del view[key]
+        return view
+
+
+def _encode(obj):
+    """Encode LayeredMetadata, nested or not, as its view"""
+    if isinstance(obj, LayeredMetadata):
+        return obj.view()
+    raise TypeError("%r is not JSON serializable" % obj)
+
+
+def dump(metadata, f):
+    """Write `metadata` as JSON to file object `f`
+
+    Layered metadata is written without copying any of its values.
+
+    """
+
+    json.dump(metadata, f, indent=2, sort_keys=True, default=_encode)
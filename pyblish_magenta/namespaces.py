@@ -0,0 +1,145 @@
+"""Tree of the namespaces in a scene and the amount of nodes in each
+
+Built from a single listing of all namespaces and all nodes, as opposed
+to a recursive `namespaceInfo(listNamespace=True)` per namespace. Node
+counts are rolled up from nested namespaces into their parents such
+that a namespace holding only empty namespaces is empty itself.
+
+Example:
+    >>> tree = NamespaceTree(["a", "a:b", "c", "c:d"],
+    ...                      ["persp", "a:b:node_GEO", "|grp|c:node"])
+    >>> tree.total("a"), tree.count("a")
+    (1, 0)
+    >>> tree.empty()
+    ['c:d']
+    >>> tree = NamespaceTree(["a", "a:b"], [])
+    >>> tree.empty()
+    ['a', 'a:b']
+
+"""
+
+ROOT = ""
+
+# Namespaces that exist by default in Maya and are mostly hidden
+INTERNAL = ("UI", "shared")
+
+
+def split_namespace(node):
+    """Return the namespace and name of `node`
+
+    Example:
+        >>> split_namespace("|grp|ns:sub:node_GEO")
+        ('ns:sub', 'node_GEO')
+        >>> split_namespace("node_GEO")
+        ('', 'node_GEO')
+
+    """
+
+    namespace, _, name = node.rsplit("|", 1)[-1].rpartition(":")
+    return namespace.lstrip(":"), name
+
+
+def parent_namespace(namespace):
+    """Return the parent of `namespace`, ROOT at the top"""
+    return namespace.rpartition(":")[0]
+
+
+class NamespaceTree(object):
+    """Namespaces and the amount of nodes in each
+
+    Arguments:
+        namespaces (list): All namespaces, e.g. from
+            `namespaceInfo(":", listOnlyNamespaces=True, recurse=True)`
+        nodes (list): All nodes, e.g. from `ls()`
+
+    """
+
+    def __init__(self, namespaces, nodes):
+        self._counts = dict()
+        self._children = dict()
+
+        self._add(ROOT)
+        for namespace in namespaces:
+            self._add(namespace.lstrip(":"))
+
+        for node in nodes:
+            namespace = split_namespace(node)[0]
+            if namespace not in self._counts:
+                self._add(namespace)
+            self._counts[namespace] += 1
+
+        # Roll up the counts, deepest namespaces first
+        self._totals = dict(self._counts)
+        for namespace in sorted(self._counts,
+                                key=lambda ns: ns.count(":"),
+                                reverse=True):
+            if namespace != ROOT:
+                parent = parent_namespace(namespace)
+                self._totals[parent] += self._totals[namespace]
+
+    def __contains__(self, namespace):
+        return namespace in self._counts
+
+    def __iter__(self):
+        return (ns for ns in sorted(self._counts) if ns != ROOT)
+
+    def _add(self, namespace):
+        """Add `namespace` and its parents, if not added already"""
+        while namespace not in self._counts:
+            self._counts[namespace] = 0
+            self._children.setdefault(namespace, list())
+            if namespace == ROOT:
+                break
+
+            parent = parent_namespace(namespace)
+            self._children.setdefault(parent, list()).append(namespace)
+            namespace = parent
+
+    def children(self, namespace):
+        """Return the namespaces directly within `namespace`"""
+        return sorted(self._children.get(namespace, []))
+
+    def count(self, namespace):
+        """Return the amount of nodes directly in `namespace`"""
+        return self._counts.get(namespace, 0)
+
+    def total(self, namespace):
+        """Return the amount of nodes in `namespace` and its children"""
+        return self._totals.get(namespace, 0)
+
+    def is_empty(self, namespace):
+        """Return whether `namespace`, including its children, has no nodes"""
+        return self.total(namespace) == 0
+
+    def empty(self, exclude=INTERNAL):
+        """Return all empty namespaces
+
+        Arguments:
+            exclude (list): Namespaces to ignore, including their children
+
+        """
+
+        excluded = tuple(exclude)
+        return [namespace for namespace in self
+                if self.is_empty(namespace) and
+                namespace.split(":", 1)[0] not in excluded]
+
+
+def get_namespace_tree(context):
+    """Return the NamespaceTree of the current scene
+
+    The tree is stored in the "namespaceTree" data of the context,
+    and built on first access.
+
+    """
+
+    tree = context.data.get("namespaceTree")
+    if tree is None:
+        from maya import cmds
+
+        namespaces = cmds.namespaceInfo(":",
+                                        listOnlyNamespaces=True,
+                                        recurse=True) or []
+        tree = NamespaceTree(namespaces, cmds.ls() or [])
+        context.data["namespaceTree"] = tree
+    return tree
@@ -0,0 +1,220 @@
+"""Naming conventions as a table of rules checked in a single pass
+
+Each rule formats a subject from the columns of a node, such as its
+short name, type, parent and the type of its first shape, and matches
+it against a regular expression compiled once for the whole table.
+All rules are evaluated in one pass over the nodes of an instance and
+the naming validators only look up the result of their rule.
+
+Columns:
+    node: Long name of the node
+    name: Name of the node, including namespace
+    short: Name of the node, excluding namespace
+    namespace: Namespace of the node, if any
+    type: Exact type of the node
+    parent: Short name of the parent, if any
+    shape: Type of the first non-intermediate shape of a transform
+
+Example:
+    >>> rows = [columns("|box_GEO", "transform", "transform", "mesh"),
+    ...         columns("|box_GEO|box_GEOShape", "mesh", "shape"),
+    ...         columns("|pCube1", "transform", "transform", "mesh")]
+    >>> invalid = check(rows)
+    >>> invalid["suffix"]
+    ['|pCube1']
+    >>> invalid["primitiveName"]
+    ['|pCube1']
+    >>> invalid["defaultShapeName"]
+    []
+
+"""
+
+import re
+
+from . import lib
+from .namespaces import split_namespace
+
+SUFFIX_NAMING_TABLE = {'mesh': ["_GEO", "_GES", "_GEP"],
+                       'nurbsCurve': ["_CRV"],
+                       'nurbsSurface': ["_NRB"],
+                       None: ['_GRP']}
+
+ALLOW_IF_NOT_IN_SUFFIX_TABLE = True
+
+PRIMITIVE_NAMES = ['pSphere', 'pCube', 'pCylinder', 'pCone', 'pPlane',
+                   'pTorus', 'pPrism', 'pPyramid', 'pPipe', 'pHelix',
+                   'pSolid', 'nurbsSphere', 'nurbsCube', 'nurbsCylinder',
+                   'nurbsCone', 'nurbsPlane', 'nurbsTorus', 'nurbsCircle',
+                   'nurbsSquare']
+
+
+class Rule(object):
+    """A naming convention for nodes of a kind
+
+    Arguments:
+        name (str): Name of rule, the key of its results
+        kind (str): "transform", "shape" or None for all nodes
+        subject (str): Format string of the columns to match
+        pattern (str): Regular expression matched against the subject
+        valid (bool): Whether a match means the name is valid (True),
+            or invalid (False)
+
+    """
+
+    def __init__(self, name, kind, subject, pattern, valid=True):
+        self.name = name
+        self.kind = kind
+        self.subject = subject
+        self.regex = re.compile(pattern)
+        self.valid = valid
+
+    def __repr__(self):
+        return "Rule(%r)" % self.name
+
+    def is_valid(self, row):
+        """Return whether the node of `row` adheres to this rule"""
+        match = self.regex.match(self.subject.format(**row))
+        return bool(match) == self.valid
+
+
+def suffix_pattern(table, allow_unknown=True):
+    """Return a regular expression for "{shape}|{short}" of transforms
+
+    Arguments:
+        table (dict): Suffixes per shape type, None for transforms
+            without shapes
+        allow_unknown (bool): Whether types not in the table are valid
+
+    Example:
+        >>> regex = re.compile(suffix_pattern({"mesh": ["_GEO"]}))
+        >>> bool(regex.match("mesh|box_GEO")), bool(regex.match("mesh|box"))
+        (True, False)
+        >>> bool(regex.match("camera|cam"))
+        True
+
+    """
+
+    alternatives = list()
+    for shape_type in sorted(table, key=lambda key: key or ""):
+        suffixes = table[shape_type]
+        alternatives.append("{0}\\|.*(?:{1})".format(
+            re.escape(shape_type or ""),
+            "|".join(re.escape(suffix) for suffix in suffixes)))
+
+    if allow_unknown:
+        known = "|".join(re.escape(shape_type or "") for shape_type in table)
+        alternatives.append("(?!(?:{0})\\|).*".format(known))
+
+    return "^(?:{0})$".format("|".join(alternatives))
+
+
+RULES = (
+    # Suffix of transforms by the type of their first shape
+    Rule("suffix", "transform", "{shape}|{short}",
+         suffix_pattern(SUFFIX_NAMING_TABLE, ALLOW_IF_NOT_IN_SUFFIX_TABLE)),
+
+    # Shapes are named {transform}{numSuffix}Shape{numSuffix}, where
+    # the transform's name may end with a number of its own.
+    Rule("defaultShapeName", "shape", "{parent}|{short}",
+         r"^([^|]*?)[0-9]*\|\1[0-9]*Shape[0-9]*$"),
+
+    # Names of newly created primitives, e.g. pCube1
+    Rule("primitiveName", "transform", "{short}",
+         "({0})[0-9]?$".format("|".join(PRIMITIVE_NAMES)),
+         valid=False),
+
+    Rule("namespace", None, "{namespace}", "^$"),
+)
+
+
+def short_name(node):
+    """Return the name of `node` without parents and namespace"""
+    return node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+
+
+def columns(node, node_type, kind=None, shape_type=None):
+    """Return the columns of a single node
+
+    Arguments:
+        node (str): Long name of node
+        node_type (str): Exact type of node
+        kind (str, optional): "transform", "shape" or None for any
+            other node
+        shape_type (str, optional): Type of the first shape of a transform
+
+    """
+
+    name = node.rsplit("|", 1)[-1]
+    namespace, short = split_namespace(node)
+    parent = node.rsplit("|", 1)[0] if "|" in node else ""
+
+    return {
+        "node": node,
+        "name": name,
+        "short": short,
+        "namespace": namespace,
+        "type": node_type,
+        "parent": short_name(parent) if parent else "",
+        "shape": shape_type or "",
+        "kind": kind
+    }
+
+
+def check(rows, rules=RULES):
+    """Return the invalid nodes of `rows` per rule
+
+    Arguments:
+        rows (list): Columns per node, see `columns()`
+        rules (list, optional): Rules to check, defaults to RULES
+
+    Returns:
+        dict: {rule name: [node, ..]}
+
+    """
+
+    invalid = dict((rule.name, list()) for rule in rules)
+    by_kind = dict()
+    for rule in rules:
+        by_kind.setdefault(rule.kind, list()).append(rule)
+
+    for row in rows:
+        rules = by_kind.get(None, []) + by_kind.get(row["kind"], [])
+        for rule in rules:
+            if not rule.is_valid(row):
+                invalid[rule.name].append(row["node"])
+
+    return invalid
+
+
+def index_columns(index):
+    """Return the columns of all members of a SceneIndex"""
+    rows = list()
+    for node in index:
+        kind = None
+        shape_type = None
+        if index.is_a(node, "transform"):
+            kind = "transform"
+            shapes = index.shapes(node, noIntermediate=True)
+            shape_type = index.node_type(shapes[0]) if shapes else None
+        elif index.is_a(node, "shape"):
+            kind = "shape"
+
+        rows.append(columns(node, index.node_type(node), kind, shape_type))
+
+    return rows
+
+
+def get_invalid(instance, rule):
+    """Return the nodes of `instance` that do not adhere to `rule`
+
+    All rules are checked on first access and their results are
+    stored in the "naming" data of the instance.
+
+    """
+
+    invalid = instance.data.get("naming")
+    if invalid is None:
+        index = lib.get_scene_index(instance)
+        invalid = check(index_columns(index))
+        instance.data["naming"] = invalid
+    return invalid[rule]
@@ -1,15 +1,26 @@
 import pyblish.api
+import pyblish_magenta.api
+
+from pyblish_magenta import history
 
 
 class CollectMayaHistory(pyblish.api.InstancePlugin):
     """Collect history for instances from the Maya scene
 
     Note:
-        This removes render layers collected in the history
+        This removes render layers collected in the history. The membership
+        of rig instances is expanded here, rather than on first access
+        during validation, so that the history is part of it. It is added
+        again whenever the membership is read again, e.g. after a repair.
 
     This is separate from Collect Instances so we can target it towards only
     specific family types.
 
+    The history matches that of listHistory. The connections of each node
+    are read once for all instances of the context, such that rigs sharing
+    deformer networks or referenced components only read the shared part
+    once, see pyblish_magenta.history.
+
     """
 
     order = pyblish.api.CollectorOrder + 0.1
@@ -19,22 +30,24 @@ class CollectMayaHistory(pyblish.api.InstancePlugin):
     verbose = False
 
     def process(self, instance):
-        from maya import cmds
-
-        # Collect the history with long names
-        history = cmds.listHistory(instance,
-                                   leaf=False) or []
-        history = cmds.ls(history, long=True)
-
-        # Remove invalid node types (like renderlayers)
-        invalid = cmds.ls(history, type="renderLayer", long=True)
-        if invalid:
-            invalid = set(invalid)  # optimize lookup
-            history = [x for x in history if x not in invalid]
-
-        # Combine members with history
-        members = instance[:] + history
-        members = list(set(members))    # ensure unique
-
-        # Update the instance
-        instance[:] = members
+        # The graph is shared by all instances, history already walked
+        # for another rig is not walked again.
+        graph = history.get_history_graph(instance.context)
+        visited = graph.visited
+
+        # Collect the history with long names, excluding
+        # invalid node types (like renderlayers)
+        expanded = "dagPaths" in instance.data
+        instance.data["withHistory"] = True
+        paths = pyblish_magenta.api.get_dag_paths(instance)
+
+        if expanded:
+            # Expanded during collection, without its history
+            paths |= graph.history(paths)
+            instance[:] = list(paths)
+            instance.data["dagPaths"] = paths
+
+        self.log.info("Read {0} new nodes, {1} in total, reusing "
+                      "{2} memoized inputs".format(graph.visited - visited,
+                                                   graph.visited,
+                                                   graph.reused))
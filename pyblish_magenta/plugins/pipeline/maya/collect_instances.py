@@ -1,25 +1,14 @@
 import pyblish.api
 import pyblish_maya
 
-
-def get_upstream_hierarchy_fast(nodes):
-    """Passed in nodes must be long names!"""
-
-    matched = set()
-    parents = []
-
-    for node in nodes:
-        hierarchy = node.split("|")
-        num = len(hierarchy)
-        for x in range(1, num-1):
-            parent = "|".join(hierarchy[:num-x])
-            if parent in parents:
-                break
-            else:
-                parents.append(parent)
-                matched.add(parent)
-
-    return parents
+from pyblish_magenta.lib import (
+    get_assembly_roots,
+    get_assemblies,
+    get_dag_paths,
+    watch_set_members,
+    unwatch_set_members,
+    get_user_attributes
+)
 
 
 class CollectInstances(pyblish.api.ContextPlugin):
@@ -31,27 +20,60 @@ class CollectInstances(pyblish.api.ContextPlugin):
     All other user-defined attributes of the object set
     is accessible within each instance's data.
 
+    The nodes of all instances are interned in a DagPathTable on the
+    context and the membership of each instance is stored as a
+    DagPathSet in its "dagPaths" data.
+
+    Collection happens in three batched steps, regardless of
+    the amount of instances in the scene:
+        1. List all _INST object sets and their user-defined attributes
+        2. Expand the hierarchy of all sets with a single query and
+           split the result between the instances
+        3. Assign the user-defined attributes to the instances
+
+    When `lazy`, only the members of the object sets are collected and
+    step 2 is left to the first call to `get_dag_paths()`, which every
+    plug-in reading the contents of an instance makes rather than
+    iterating the instance itself. Instances toggled off are never
+    expanded. The expanded membership is dropped
+    whenever the members of the object set change, until the scene is
+    replaced or collected again.
+
     """
 
     order = pyblish.api.CollectorOrder
     hosts = ["maya"]
     label = "Maya Instances"
     verbose = False
+    lazy = True
 
     _ignore_families = ["look"]
 
     def process(self, context):
         from maya import cmds
 
-        for objset in cmds.ls("*_INST",
-                              objectsOnly=True,
-                              type='objectSet',
-                              long=True,
-                              recursive=True):  # Include namespace
+        # Instances of a previous collection are no longer published
+        unwatch_set_members()
+
+        objsets = cmds.ls("*_INST",
+                          objectsOnly=True,
+                          type='objectSet',
+                          long=True,
+                          recursive=True)  # Include namespace
+
+        if not objsets:
+            return
 
-            try:
-                family = cmds.getAttr(objset + ".family")
-            except ValueError:
+        # ignore referenced sets
+        referenced = set(cmds.ls(objsets, referencedNodes=True, long=True))
+        user_attributes = get_user_attributes(context, objsets)
+
+        collected = list()
+        for objset in objsets:
+            user_data = user_attributes[objset]
+            family = dict(user_data).get("family")
+
+            if family is None:
                 self.log.error("Found: %s found, but no family." % objset)
                 continue
 
@@ -60,10 +82,27 @@ class CollectInstances(pyblish.api.ContextPlugin):
                               "of family {1}".format(objset, family))
                 continue
 
-            # ignore referenced sets
-            if cmds.referenceQuery(objset, isNodeReferenced=True):
+            if objset in referenced:
                 continue
 
+            self.log.info("Collecting: %s" % objset)
+
+            # Maintain nested object sets
+            members = cmds.sets(objset, query=True) or []
+            members = cmds.ls(members, long=True)
+
+            collected.append((objset, members, user_data))
+
+        # Expand all instances at once when not lazy. The children of
+        # the parents are all descendants of the members' assemblies,
+        # so list those in one go and share them between instances.
+        if not self.lazy:
+            roots = set()
+            for objset, members, user_data in collected:
+                roots.update(get_assembly_roots(members))
+            get_assemblies(context, roots)
+
+        for objset, members, user_data in collected:
             instance = context.create_instance(objset)
             short_name = objset.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
             for key, default in {
@@ -73,42 +112,18 @@ class CollectInstances(pyblish.api.ContextPlugin):
                     }.iteritems():
                 instance.data[key] = default
 
-            self.log.info("Collecting: %s" % objset)
-
-            # Maintain nested object sets
-            members = cmds.sets(objset, query=True)
-            members = cmds.ls(members, long=True)
-
-            # Include all parents and children
-            parents = get_upstream_hierarchy_fast(members)
-
-            children = cmds.listRelatives(members + parents,
-                                          allDescendents=True,
-                                          fullPath=True) or []
-
-            # Exclude intermediate objects
-            children = cmds.ls(children, noIntermediate=True, long=True)
-
-            nodes = members + parents + children
-
-            # Ensure unique
-            nodes = list(set(nodes))
-
-            if self.verbose:
-                self.log.debug("Collecting nodes: %s" % nodes)
-            instance[:] = nodes
-
-            # Maintain original contents of object set
+            # Maintain original contents of object set, expanded to
+            # its hierarchy on first access of the membership
+            instance[:] = members
             instance.data["setMembers"] = members
 
-            # Get user data from user defined attributes
-            user_data = []
-            for attr in cmds.listAttr(objset, userDefined=True):
-                try:
-                    value = cmds.getAttr(objset + "." + attr)
-                    user_data.append((attr, value))
-                except RuntimeError:
-                    continue
+            if self.lazy:
+                watch_set_members(instance)
+            else:
+                nodes = list(get_dag_paths(instance))
+
+                if self.verbose:
+                    self.log.debug("Collecting nodes: %s" % nodes)
 
             if self.verbose:
                 self.log.debug("Collected user data: {0}".format(user_data))
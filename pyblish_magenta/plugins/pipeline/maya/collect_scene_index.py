@@ -0,0 +1,40 @@
+import pyblish.api
+import pyblish_magenta.api
+
+
+class CollectSceneIndex(pyblish.api.InstancePlugin):
+    """Collect a SceneIndex of the nodes of each instance
+
+    The index holds the long names, node types, parents, children and
+    shapes of the instance's nodes so validators can look these up
+    without querying the scene again.
+
+    Note:
+        This runs after Collect History so the history that is added to
+        rig instances is included in the index. Instances of which the
+        membership is expanded lazily, see CollectInstances, are left to
+        be indexed on first access through `get_scene_index()`, such that
+        instances that are toggled off are never expanded.
+
+    """
+
+    order = pyblish.api.CollectorOrder + 0.15
+    hosts = ["maya"]
+    label = "Maya Scene Index"
+    verbose = False
+
+    def process(self, instance):
+        if "dagPaths" not in instance.data:
+            self.log.info("Membership not expanded yet, "
+                          "indexed on first access")
+            return
+
+        index = pyblish_magenta.api.SceneIndex(instance)
+        instance.data["sceneIndex"] = index
+
+        self.log.info("Indexed {0} nodes using {1} queries".format(
+            len(index), index.calls))
+
+        if self.verbose:
+            self.log.debug("Indexed types: {0}".format(
+                sorted(set(index.types.values()))))
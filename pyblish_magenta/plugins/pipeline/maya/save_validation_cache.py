@@ -0,0 +1,27 @@
+import pyblish.api
+
+from pyblish_magenta import incremental
+
+
+class SaveValidationCache(pyblish.api.ContextPlugin):
+    """Store the passing results of incremental validation on disk
+
+    Runs once validation passed, ahead of all extractors, such that
+    meshes that passed are not validated again on the next publish.
+    Plug-ins after validation do not run when it fails, the results
+    of a failed publish are therefore not stored.
+
+    """
+
+    order = pyblish.api.ExtractorOrder - 0.49
+    hosts = ["maya"]
+    label = "Validation Cache"
+
+    def process(self, context):
+        cache = context.data.get("validationCache")
+        if cache is None:
+            return
+
+        cache.save()
+        self.log.info("Stored {0} passing results in {1}".format(
+            len(cache), cache.path))
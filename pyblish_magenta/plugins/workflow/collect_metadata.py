@@ -1,12 +1,14 @@
 import pyblish.api
-import copy
+
+from pyblish_magenta.metadata import LayeredMetadata
 
 
 class CollectMetadata(pyblish.api.ContextPlugin):
     """Transfer context metadata to the instance.
     
-    This applies a copy of the `context.data['metadata']` to the
-    `instance.data['metadata']` for the following metadata:
+    This layers the `instance.data['metadata']` of each instance over
+    metadata shared by all instances, as opposed to a copy per instance,
+    for the following metadata:
     
     Provides:
         {
@@ -36,7 +38,6 @@ class CollectMetadata(pyblish.api.ContextPlugin):
                 metadata[key] = context.data.get(source)
 
         for instance in context:
-            instance_metadata = copy.deepcopy(metadata)
-            instance.data["metadata"] = instance_metadata
+            instance.data["metadata"] = LayeredMetadata(metadata)
 
         self.log.info("Collected {0}".format(metadata))
@@ -1,7 +1,8 @@
 import os
-import json
 import pyblish_magenta.api
 
+from pyblish_magenta.metadata import dump
+
 
 class ExtractMetadata(pyblish_magenta.api.Extractor):
     """Extract origin metadata from scene"""
@@ -16,6 +17,6 @@ class ExtractMetadata(pyblish_magenta.api.Extractor):
         metadata = instance.data("metadata")
         self.log.info("Extracting %s" % metadata)
         with open(temp_file, "w") as f:
-            json.dump(metadata, f, indent=2, sort_keys=True)
+            dump(metadata, f)
 
         self.log.info("Written to %s" % temp_file)
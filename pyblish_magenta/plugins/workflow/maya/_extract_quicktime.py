@@ -1,7 +1,10 @@
 import os
+import math
 
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.bounds
+from pyblish_magenta import evaluation
 from pyblish_magenta.vendor import capture
 
 from maya import cmds
@@ -24,6 +27,8 @@ class ExtractReview(pyblish_magenta.api.Extractor):
             in order to preserve the current aspect ratio.
         show (str): Space-separated list of which node-types to show,
             e.g. "nurbsCurves polymeshes"
+        frame (bool): Move the camera(s) to frame the shapes of the
+            instance for the capture, defaults to False
 
     """
 
@@ -50,6 +55,7 @@ class ExtractReview(pyblish_magenta.api.Extractor):
         compression = instance.data('compression') or 'h264'
         off_screen = instance.data('offScreen', False)
         maintain_aspect_ratio = instance.data('maintainAspectRatio', True)
+        frame = instance.data('frame', False)
 
         # Set viewport settings
         view_opts = capture.ViewportOptions.copy()
@@ -59,7 +65,8 @@ class ExtractReview(pyblish_magenta.api.Extractor):
             "nurbsSurfaces": True
         })
 
-        cameras = [c for c in instance if cmds.nodeType(c) == "camera"]
+        index = pyblish_magenta.api.get_scene_index(instance)
+        cameras = index.ls(type="camera")
         cameras = [cmds.listRelatives(c, parent=True)[0] for c in cameras]
 
         path = self.temp_dir(instance)
@@ -76,19 +83,60 @@ class ExtractReview(pyblish_magenta.api.Extractor):
 
             self.log.info("Outputting to %s" % path)
 
-            output = capture.capture(
-                filename=path,
-                camera=camera,
-                width=width,
-                height=height,
-                start_frame=start_frame,
-                end_frame=end_frame,
-                format=format,
-                viewer=False,
-                compression=compression,
-                off_screen=off_screen,
-                maintain_aspect_ratio=maintain_aspect_ratio,
-                viewport_options=view_opts)
+            if frame:
+                original = cmds.xform(camera, query=True,
+                                      worldSpace=True, translation=True)
+                self.frame(camera, instance)
+
+            try:
+                # Captures draw each frame, the viewport keeps refreshing
+                with evaluation.extraction(refresh=True):
+                    output = capture.capture(
+                        filename=path,
+                        camera=camera,
+                        width=width,
+                        height=height,
+                        start_frame=start_frame,
+                        end_frame=end_frame,
+                        format=format,
+                        viewer=False,
+                        compression=compression,
+                        off_screen=off_screen,
+                        maintain_aspect_ratio=maintain_aspect_ratio,
+                        viewport_options=view_opts)
+            finally:
+                if frame:
+                    cmds.xform(camera, worldSpace=True, translation=original)
 
             self.log.info("Outputted to: %s" % output)
             instance.set_data("reviewOutput", output)
+
+    def frame(self, camera, instance):
+        """Move `camera` along its view axis to frame the instance's shapes
+
+        The camera keeps its orientation and is moved such that the
+        sphere around the world-space bounds of the instance fits
+        within its narrowest field of view.
+
+        """
+
+        box = pyblish_magenta.bounds.get_bounds(instance).union()
+        if box is None:
+            self.log.warning("Nothing to frame for camera: %s" % camera)
+            return
+
+        center = [(box[i] + box[i + 3]) / 2.0 for i in range(3)]
+        radius = math.sqrt(sum((box[i + 3] - box[i]) ** 2
+                               for i in range(3))) / 2.0
+
+        fov = min(cmds.camera(camera, query=True, horizontalFieldOfView=True),
+                  cmds.camera(camera, query=True, verticalFieldOfView=True))
+        distance = radius / math.sin(math.radians(fov) / 2.0)
+
+        # The camera looks down its negative Z-axis
+        matrix = cmds.xform(camera, query=True, worldSpace=True, matrix=True)
+        length = math.sqrt(sum(value ** 2 for value in matrix[8:11]))
+        backward = [value / length for value in matrix[8:11]]
+
+        position = [c + b * distance for c, b in zip(center, backward)]
+        cmds.xform(camera, worldSpace=True, translation=position)
@@ -1,5 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.display_layers
 from maya import cmds
 
 
@@ -25,34 +26,21 @@ class ValidateDisplayLayerEmpty(pyblish.api.ContextPlugin):
 
     __skip_layers = ['defaultLayer']
 
-    def _get_empty_layers(self):
+    def _get_empty_layers(self, context):
+        layers = pyblish_magenta.display_layers.get_display_layers(context)
 
-        layers = cmds.ls(type='displayLayer')
-        empty = []
-
-        for layer in layers:
-            if layer in self.__skip_layers:
-                continue
-
-            # Skip those that are referenced
-            # TODO: Do we really want to skip those that are referened?
-            if cmds.referenceQuery(layer, isNodeReferenced=True):
-                continue
-
-            members = cmds.editDisplayLayerMembers(layer, q=1)
-            if not members:
-                empty.append(layer)
-
-        return empty
+        # Skip those that are referenced
+        # TODO: Do we really want to skip those that are referened?
+        return layers.empty(exclude=self.__skip_layers, referenced=False)
 
     def process(self, context):
         """Process the Context"""
-        invalid = self._get_empty_layers()
+        invalid = self._get_empty_layers(context)
 
         if invalid:
             raise ValueError("Empty displayLayers found: {0}".format(invalid))
 
     def repair(self, context):
         """Repair by deleting the empty layers"""
-        invalid = self._get_empty_layers()
+        invalid = self._get_empty_layers(context)
         cmds.delete(invalid)
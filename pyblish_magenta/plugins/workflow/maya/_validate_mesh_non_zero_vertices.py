@@ -1,5 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
 import pyblish_maya
 
 from pyblish_magenta.action import SelectInvalidAction, RepairAction
@@ -14,6 +15,9 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
     deformers and are difficult to track down. The offset values can be seen
     in the channelBox when selecting the vertices, all values there should be
     zero.
+
+    Meshes with many vertices are checked on an array of all offsets
+    read at once, smaller meshes are checked point by point.
     """
 
     order = pyblish_magenta.api.ValidateMeshOrder
@@ -36,6 +40,11 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
 
     @classmethod
     def is_invalid(cls, mesh):
+        if (pyblish_magenta.mesh.vertex_count(mesh) >=
+                pyblish_magenta.mesh.CMDS_THRESHOLD):
+            tweaks = pyblish_magenta.mesh.point_tweaks(mesh)
+            return pyblish_magenta.mesh.any_nonzero(tweaks, cls._tolerance)
+
         pts = cls._iter_internal_pts(mesh)
         for pt in pts:
             if any(abs(v) > cls._tolerance for v in pt):
@@ -45,7 +54,8 @@ class ValidateMeshNonZeroVertices(pyblish.api.Validator):
     @classmethod
     def get_invalid(cls, instance):
 
-        meshes = cmds.ls(instance, type='mesh', long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        meshes = index.ls(type='mesh')
         return [mesh for mesh in meshes if cls.is_invalid(mesh)]
 
     def process(self, instance):
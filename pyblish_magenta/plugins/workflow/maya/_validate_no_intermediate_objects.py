@@ -19,19 +19,12 @@ class ValidateNoIntermediateObjects(pyblish.api.InstancePlugin):
 
     @staticmethod
     def get_invalid(instance):
-
-        intermediates = cmds.ls(instance,
-                                shapes=True,
-                                intermediateObjects=True,
-                                long=True)
-        return intermediates
+        index = pyblish_magenta.api.get_scene_index(instance)
+        return sorted(index.intermediates)
 
     def process(self, instance):
         """Process all the intermediateObject nodes in the instance"""
-        intermediate_objects = cmds.ls(instance,
-                                       shapes=True,
-                                       intermediateObjects=True,
-                                       long=True)
+        intermediate_objects = self.get_invalid(instance)
         if intermediate_objects:
             raise ValueError("Intermediate objects found: "
                              "{0}".format(intermediate_objects))
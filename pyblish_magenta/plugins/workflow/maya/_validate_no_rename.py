@@ -1,12 +1,6 @@
-import re
-
 import pyblish.api
 import pyblish_magenta.api
-from maya import cmds
-
-
-def short_name(node):
-    return node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+import pyblish_magenta.naming
 
 
 class ValidateShapeNoRename(pyblish.api.InstancePlugin):
@@ -25,23 +19,10 @@ class ValidateShapeNoRename(pyblish.api.InstancePlugin):
     version = (0, 1, 0)
     label = 'Shape No Default Names'
 
-    # set
-    __simpleNames = ['pSphere', 'pCube', 'pCylinder', 'pCone', 'pPlane', 'pTorus',
-                     'pPrism', 'pPyramid', 'pPipe', 'pHelix', 'pSolid',
-                     'nurbsSphere', 'nurbsCube', 'nurbsCylinder', 'nurbsCone',
-                     'nurbsPlane', 'nurbsTorus', 'nurbsCircle', 'nurbsSquare']
-    __regex = re.compile('({0})[0-9]?$'.format("|".join(__simpleNames)))
-
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
-        transforms = cmds.ls(instance, type='transform')
+        invalid = pyblish_magenta.naming.get_invalid(instance,
+                                                     "primitiveName")
 
-        regex = self.__regex
-        
-        invalid = []
-        for t in transforms:
-            if regex.match(short_name(t)):
-                invalid.append(t)
-            
         if invalid:
             raise ValueError("Non-renamed objects found: {0}".format(invalid))
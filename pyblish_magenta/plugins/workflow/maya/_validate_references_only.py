@@ -2,6 +2,8 @@ import pyblish.api
 import pyblish_magenta.api
 from maya import cmds
 
+from pyblish_magenta import references
+
 
 class ValidateReferencesOnly(pyblish.api.InstancePlugin):
     """Validate that all nodes are referenced nodes."""
@@ -16,23 +18,11 @@ class ValidateReferencesOnly(pyblish.api.InstancePlugin):
 
     def process(self, instance):
         """Process all the nodes in the instance"""
-        referenced_nodes = cmds.ls(instance, referencedNodes=True, long=True)
-
-        if len(referenced_nodes) != len(instance):
-            # Now we know some nodes are not referenced
-            # Let's compare by long names
-            member_nodes = cmds.ls(instance, long=True)
-            referenced_nodes_lookup = frozenset(referenced_nodes)
-
-            non_referenced_nodes = [node for node in member_nodes if
-                                    node not in referenced_nodes_lookup]
-            if non_referenced_nodes:
-                raise ValueError("Non-referenced nodes found: "
-                                 "{0}".format(non_referenced_nodes))
-
-        # Another way of doing it (which might be slower (untested))
-        # invalid = []
-        # for node in member_nodes:
-        #    if not cmds.referenceQuery(isNodeReferenced=node):
-        #        invalid.append(node)
-
+        refmap = references.get_reference_map(instance.context)
+
+        member_nodes = list(pyblish_magenta.api.get_dag_paths(instance))
+        non_referenced_nodes = [node for node in member_nodes if
+                                not refmap.is_referenced(node)]
+        if non_referenced_nodes:
+            raise ValueError("Non-referenced nodes found: "
+                             "{0}".format(non_referenced_nodes))
@@ -1,6 +1,8 @@
 import pyblish
 import pyblish_magenta.api
 
+from pyblish_magenta import animation
+
 
 class ValidateRigControlsNoAnimation(pyblish.api.InstancePlugin):
     """Ensure no keyframes on controls in the rig Instance.
@@ -16,12 +18,12 @@ class ValidateRigControlsNoAnimation(pyblish.api.InstancePlugin):
     def process(self, instance):
         from maya import cmds
 
-        # TODO: Check incoming connections (parent constraints, etc.) instead of animCurves
         # TODO: Check only keyable attributes?
         # TODO: Check only unlocked attributes?
 
         # Get the controls set from the instance
-        sets = cmds.ls(instance, type='objectSet')
+        nodes = list(pyblish_magenta.api.get_dag_paths(instance))
+        sets = cmds.ls(nodes, type='objectSet') if nodes else []
         controls_sets = []
         for s in sets:
             if s.endswith("controls_SET"):
@@ -32,8 +34,10 @@ class ValidateRigControlsNoAnimation(pyblish.api.InstancePlugin):
 
         controls_set = controls_sets[0]
 
-        members = cmds.sets(controls_set, q=1)
-        curves = cmds.keyframe(members, q=1, name=True)
-        if curves:
-            invalid = list(set(cmds.listConnections(curves)))
+        members = cmds.ls(cmds.sets(controls_set, q=1), long=True)
+
+        # Constraints and driven keys are not keyframes
+        index = animation.get_animation_index(instance.context)
+        invalid = index.keyed_nodes(members)
+        if invalid:
             raise RuntimeError("Keyframes found: {0}".format(invalid))
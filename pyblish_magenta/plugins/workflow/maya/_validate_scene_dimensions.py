@@ -1,6 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
-from maya import cmds
+import pyblish_magenta.bounds
 
 
 class ValidateSceneDimensions(pyblish.api.InstancePlugin):
@@ -24,18 +24,13 @@ class ValidateSceneDimensions(pyblish.api.InstancePlugin):
 
     def process(self, instance):
         """Process all the nodes in the instance"""
-        shapes = cmds.ls(instance, shapes=True, long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        shapes = index.ls(type="shape", noIntermediate=True)
         if not shapes: return
-        transforms = cmds.listRelatives(shapes, parent=True, fullPath=True)
-
-        invalid = []
-        for node in transforms:
-            bounding_box = cmds.xform(node,
-                                      query=True,
-                                      worldSpace=True,
-                                      boundingBox=True)
-            if any(abs(x) > self.__far for x in bounding_box):
-                invalid.append(node)
+        transforms = sorted(set(index.transform(shape) for shape in shapes))
+
+        bounds = pyblish_magenta.bounds.get_bounds(instance)
+        invalid = bounds.beyond(self.__far, nodes=transforms)
 
         if invalid:
             raise ValueError("Nodes found far away or of big size "
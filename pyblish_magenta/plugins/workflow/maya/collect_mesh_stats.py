@@ -0,0 +1,27 @@
+import pyblish.api
+import pyblish_magenta.api
+import pyblish_magenta.mesh
+
+
+class CollectMeshStats(pyblish.api.InstancePlugin):
+    """Compute the statistics of all meshes used by the mesh validators
+
+    Each mesh is queried once, right before the mesh validators run, and
+    the statistics are stored in the "meshStats" data of the instance.
+
+    """
+
+    order = pyblish_magenta.api.ValidateMeshOrder - 0.01
+    families = ['model', 'pointcache']
+    hosts = ['maya']
+    label = 'Mesh Stats'
+
+    def process(self, instance):
+        index = pyblish_magenta.api.get_scene_index(instance)
+        meshes = index.ls(type='mesh')
+
+        cache = pyblish_magenta.mesh.get_mesh_stats(instance)
+        cache.update(meshes)
+
+        self.log.info("Computed statistics of {0} meshes".format(
+            len(meshes)))
@@ -1,9 +1,19 @@
 import os
 import pyblish.api
 
+from pyblish_magenta import references
+from pyblish_magenta.lib import get_user_attributes
+
 
 class CollectMetadataMaya(pyblish.api.ContextPlugin):
-    """Collect metadata about referenced files in the scene"""
+    """Collect metadata about referenced files in the scene
+
+    Each referenced file is recorded with its resolved path and the
+    source of the file, as published alongside it. These are read through
+    the on-disk cache of the references module, when enabled, such that
+    only files that changed since a previous publish are read.
+
+    """
     order = pyblish.api.CollectorOrder + 0.21
     label = "Maya Metadata"
     hosts = ["maya"]
@@ -14,54 +24,47 @@ class CollectMetadataMaya(pyblish.api.ContextPlugin):
 
         self.log.info("Collecting references..")
 
-        # Get only valid top level reference nodes
-        # This makes it easier than using `cmds.ls` since it lists only
-        # top level references, and skips sharedReferenceNode.
-        ref_files = cmds.file(q=1, reference=1)
-        ref_nodes = [cmds.file(x, q=1, referenceNode=True) for x in ref_files]
-
-        references = dict()
-        for reference in ref_nodes:
-
-            # Ensure only top-level references
-            assert cmds.referenceQuery(reference,
-                                       referenceNode=True,
-                                       topReference=True) == reference
+        # Only top level references, skipping sharedReferenceNode
+        refmap = references.get_reference_map(context)
+        cache = references.get_file_cache(context)
+        read = references.read_file_metadata
+        if cache is not None:
+            read = cache.get
 
-            filename = cmds.referenceQuery(
-                reference,
-                filename=True,
-                withoutCopyNumber=True  # Exclude suffix {1}
-                ).replace("\\", "/")
+        collected = dict()
+        for reference in refmap.top_level():
+            filename = refmap.files[reference]
 
-            if filename in references:
+            if filename in collected:
                 continue
 
-            references[filename] = {
+            collected[filename] = {
                 "node": reference,
                 "filename": filename
             }
+            collected[filename].update(read(filename))
 
-            self.log.info("Collecting %s" % references[filename])
+            self.log.info("Collecting %s" % collected[filename])
+
+        if cache is not None:
+            cache.save()
+            self.log.info("Reference file cache: {0} hits, {1} misses".format(
+                cache.hits, cache.misses))
+
+        # Reuse the attributes as read by Collect Instances
+        objsets = [instance.data['objSetName'] for instance in context
+                   if cmds.objExists(instance.data['objSetName'])]
+        user_attributes = get_user_attributes(context, objsets)
 
         for instance in context:
 
             object_set = instance.data['objSetName']
 
-            if not cmds.objExists(object_set):
+            if object_set not in user_attributes:
                 self.log.info("{0} is not a Maya node".format(object_set))
                 continue
 
-            userattrs = dict()
-            for attr in cmds.listAttr(object_set, userDefined=True):
-                try:
-                    value = cmds.getAttr(object_set + "." + attr)
-                except RuntimeError:
-                    continue
-
-                userattrs[attr] = value
-
             metadata = instance.data("metadata")
             assert metadata
-            metadata["references"] = references.values()
-            metadata["userattrs"] = userattrs
+            metadata["references"] = collected.values()
+            metadata["userattrs"] = dict(user_attributes[object_set])
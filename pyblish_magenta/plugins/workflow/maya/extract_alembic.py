@@ -1,27 +1,26 @@
 import os
 import json
-import contextlib
 
+import pyblish.api
 import pyblish_maya
 import pyblish_magenta.api
+import pyblish_magenta.extraction
+from pyblish_magenta import alembic_export, evaluation
 
 from maya import cmds
 
 
-@contextlib.contextmanager
-def suspension():
-    try:
-        cmds.refresh(suspend=True)
-        yield
-    finally:
-        cmds.refresh(suspend=False)
-
-
 class ExtractAlembic(pyblish_magenta.api.Extractor):
     """Extract Alembic Cache
 
-    This extracts an Alembic cache using the `-selection` flag to minimize
-    the extracted content to solely what was Collected into the instance.
+    This extracts an Alembic cache using the `-root` flag for the topmost
+    members of the instance, to minimize the extracted content to solely
+    what was Collected into the instance. All instances are extracted in
+    a single pass per overlapping frame range, such that each frame is
+    evaluated once for all of them.
+
+    With `batch` turned off each instance is extracted on its own, using
+    the `-selection` flag instead.
 
     Arguments:
         startFrame (float): Start frame of output. Ignored if `frameRange`
@@ -60,6 +59,13 @@ class ExtractAlembic(pyblish_magenta.api.Extractor):
     families = ["model", "pointcache", "proxy"]
     optional = True
 
+    # Export all instances at once, see `process_batch()`
+    batch = True
+
+    # Seconds after which an exported frame is considered stalled,
+    # failing the extraction. None to never fail.
+    stall_threshold = 60.0
+
     @property
     def options(self):
         """Overridable options for Alembic export
@@ -128,42 +134,283 @@ class ExtractAlembic(pyblish_magenta.api.Extractor):
         # Ensure alembic exporter is loaded
         cmds.loadPlugin('AbcExport', quiet=True)
 
-        # Define extract output file path
+        if self.batch:
+            self.process_batch(instance)
+        else:
+            self.process_single(instance)
+
+    def output_path(self, instance):
+        """Return the output file of `instance`, creating its directory"""
         temp_dir = self.temp_dir(instance)
         # parent_dir = os.path.join(temp_dir, instance.data("name"))
         parent_dir = temp_dir
         filename = "{0}.abc".format(instance.name)
         path = os.path.join(parent_dir, filename)
 
+        if not os.path.exists(parent_dir):
+            os.makedirs(parent_dir)
+
         # Alembic Exporter requires forward slashes
-        path = path.replace('\\', '/')
+        return path.replace('\\', '/')
+
+    def job(self, instance):
+        """Return the Alembic export of `instance` and its options
+
+        The output file and the callbacks are left out of the options
+        string of the job, as well as out of the fingerprint of the
+        extraction.
+
+        """
 
         options = self.default_options
         options["userAttr"] = ("uuid",)
         options = self.parse_overrides(instance, options)
 
-        job_str = self.parse_options(options)
-        job_str += ' -file "{0}"'.format(path)
+        if self.batch:
+            # Exported by root, rather than by selection
+            options.pop("selection", None)
+            if "root" not in options:
+                options["root"] = self.get_roots(instance)
+
+        # Chained with the callbacks monitoring the export
+        callbacks = dict((flag, options.pop(flag))
+                         for flag in ("pythonPerFrameCallback",
+                                      "pythonPostJobCallback")
+                         if flag in options)
+
+        options_str = self.parse_options(options)
+
+        frame_range = options.get("frameRange")
+        if frame_range is not None:
+            frame_range = tuple(float(frame)
+                                for frame in frame_range.split())
+
+        job = alembic_export.Job(instance.name,
+                                 self.output_path(instance),
+                                 options_str,
+                                 frame_range,
+                                 callbacks)
+
+        return job, options
+
+    @staticmethod
+    def get_roots(instance):
+        """Return the topmost transforms of the members of `instance`"""
+        members = instance.data("setMembers")
+        transforms = set(cmds.ls(members, type="transform", long=True))
+        shapes = cmds.ls(members, shapes=True, long=True)
+        if shapes:
+            transforms.update(cmds.listRelatives(shapes,
+                                                 parent=True,
+                                                 fullPath=True))
+        return alembic_export.get_roots(transforms)
+
+    @staticmethod
+    def get_meshes(instances):
+        """Return the meshes of `instances`
+
+        Smooth mesh preview is not exported, and is turned off for
+        these meshes during export.
+
+        """
+
+        members = list()
+        for instance in instances:
+            members.extend(instance.data("setMembers"))
+        return cmds.ls(members, dag=True, type="mesh", long=True)
+
+    def process_single(self, instance):
+        """Export `instance` on its own, by selection"""
+        job, options = self.job(instance)
 
-        self.log.info("Extracting alembic to: {0}".format(path))
+        self.log.info("Extracting alembic to: {0}".format(job.path))
 
         verbose = instance.data('verbose', False)
         if verbose:
-            self.log.debug('Alembic job string: "{0}"'.format(job_str))
+            self.log.debug('Alembic job string: "{0}"'.format(
+                job.job_string()))
 
-        if not os.path.exists(parent_dir):
-            os.makedirs(parent_dir)
+        monitor = alembic_export.Monitor([job], self.stall_threshold)
+
+        meshes = self.get_meshes([instance])
+
+        def export():
+            with evaluation.extraction(meshes=meshes):
+                with pyblish_maya.maintained_selection():
+                    self.log.debug(
+                        "Preparing %s for export using the following "
+                        "options: %s\nand the following string: %s"
+                        % (list(instance),
+                           json.dumps(options, indent=4),
+                           job.job_string()))
+                    cmds.select(instance.data("setMembers"), hierarchy=True)
+                    alembic_export.export([job], verbose, monitor)
+
+            # A stalled export fails in `report()`, and is not cached
+            return monitor.stats[0].stall is not None
+
+        cached = pyblish_magenta.extraction.extract(self, instance, job.path,
+                                                    export, job.options)
+        if not cached:
+            self.report(instance, monitor.stats[0], [])
+
+    def process_batch(self, instance):
+        """Report the export of `instance`, exporting all on first process
+
+        All instances of this plug-in are exported when the first of
+        them is processed, such that each frame is evaluated once for
+        all of them. Each instance reports its own export here.
+
+        """
+
+        exports = instance.context.data.get("alembicExports")
+        if exports is None:
+            exports = instance.context.data["alembicExports"] = dict()
+
+        # By identity, names are not unique across namespaces
+        if id(instance) not in exports:
+            self.export_batch(instance, exports)
+
+        export = exports[id(instance)]
+        if export["error"]:
+            raise RuntimeError("Alembic export of {0} with {1} failed: "
+                               "{2}".format(instance,
+                                            ", ".join(export["batch"]),
+                                            export["error"]))
+
+        self.log.info('Alembic job string: "{0}"'.format(export["job"]))
+        if export["cached"]:
+            self.log.info("Taken from the extraction cache: {0}".format(
+                export["path"]))
+        else:
+            self.log.info("Extracted alembic to: {0}, together with "
+                          "{1}".format(export["path"],
+                                       ", ".join(export["batch"]) or
+                                       "no others"))
+            self.report(instance, export["stats"], export["batch"])
+
+    def export_batch(self, instance, exports):
+        """Export all instances of this plug-in not yet in `exports`
+
+        Instances of overlapping frame ranges are exported in a single
+        AbcExport call, with a job per instance. The export of each
+        instance is stored in `exports` by the id of the instance, as
+        instances in different namespaces may share their name.
+
+        """
+
+        context = instance.context
+        instances = [other for other in
+                     pyblish.api.instances_by_plugin(context, type(self))
+                     if other.data.get("publish", True) and
+                     id(other) not in exports]
+        if not any(other is instance for other in instances):
+            instances.append(instance)
+
+        # The instance of each job
+        owners = dict()
+        jobs = list()
+        for other in sorted(instances, key=lambda other: other.name):
+            job = self.job(other)[0]
+            owners[job] = other
+            jobs.append(job)
+
+        verbose = any(other.data.get("verbose", False)
+                      for other in instances)
+
+        for group in alembic_export.group_by_frame_range(jobs):
+            names = [job.name for job in group]
+            self.log.info("Extracting alembic of {0} in a single "
+                          "pass".format(", ".join(names)))
+
+            stats = dict()
+
+            def export(extractions):
+                paths = set(path for _, path, _ in extractions)
+                exported = [job for job in group if job.path in paths]
+                monitor = alembic_export.Monitor(exported,
+                                                 self.stall_threshold)
+                meshes = self.get_meshes([owners[job] for job in exported])
+                with evaluation.extraction(meshes=meshes):
+                    alembic_export.export(exported, verbose, monitor)
+                for job_stats in monitor.stats:
+                    stats[job_stats.job] = job_stats
+
+                # Stalled exports fail in `report()`, and are not cached
+                return [job_stats.job.path for job_stats in monitor.stats
+                        if job_stats.stall is not None]
+
+            error = None
+            cached = [False] * len(group)
+            try:
+                cached = pyblish_magenta.extraction.extract_all(
+                    self,
+                    [(owners[job], job.path, (job.options,))
+                     for job in group],
+                    export)
+            except Exception as e:
+                self.log.error("Alembic export of {0} failed".format(
+                    ", ".join(names)))
+                error = str(e)
+
+            exported = [job for job, hit in zip(group, cached) if not hit]
+            for job, hit in zip(group, cached):
+                exports[id(owners[job])] = {
+                    "path": job.path,
+                    "job": job.job_string(),
+                    "cached": hit,
+                    "stats": stats.get(job),
+                    "batch": [other.name for other in exported
+                              if other is not job],
+                    "error": error
+                }
+
+    def report(self, instance, stats, batch):
+        """Store the statistics of the export of `instance`
+
+        The statistics are stored in the "alembicStats" data of the
+        instance and written to a JSON report next to the exported
+        file, of which the path is stored as "alembicReport".
+
+        Raises:
+            RuntimeError: When a frame took longer than the stall
+                threshold
+
+        """
 
-        with suspension():
-            with pyblish_maya.maintained_selection():
-                self.log.debug(
-                    "Preparing %s for export using the following options: %s\n"
-                    "and the following string: %s"
-                    % (list(instance),
-                       json.dumps(options, indent=4),
-                       job_str))
-                cmds.select(instance.data("setMembers"), hierarchy=True)
-                cmds.AbcExport(j=job_str, verbose=verbose)
+        data = stats.data()
+        data["batch"] = batch
+
+        path = os.path.splitext(stats.job.path)[0] + ".stats.json"
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+        instance.set_data("alembicStats", data)
+        instance.set_data("alembicReport", path)
+
+        self.log.info("Exported {0} frames in {1:.2f}s ({2:.2f} fps), "
+                      "{3} bytes, report: {4}".format(len(stats.frames),
+                                                      stats.time(),
+                                                      stats.fps(),
+                                                      data["size"],
+                                                      path))
+
+        if stats.stall is None:
+            return
+
+        frame, seconds = stats.stall
+        slowest = ", ".join("{0:g} ({1:.2f}s)".format(slow[0], slow[1])
+                            for slow in stats.slowest())
+        raise RuntimeError(
+            "Alembic export of {0} stalled at frame {1:g}, taking {2:.2f}s "
+            "over the threshold of {3:.2f}s.\n"
+            "Slowest frames: {4}\n"
+            "Average: {5:.2f} fps over {6} frames\n"
+            "Evaluated together with: {7}\n"
+            "Report: {8}".format(instance, frame, seconds,
+                                 self.stall_threshold, slowest,
+                                 stats.fps(), len(stats.frames),
+                                 ", ".join(batch) or "no others", path))
 
     def parse_overrides(self, instance, options):
         """Inspect data of instance to determine overridden options
@@ -2,6 +2,8 @@ import os
 
 import pyblish_maya
 import pyblish_magenta.api
+import pyblish_magenta.extraction
+from pyblish_magenta import evaluation
 
 
 class ExtractMayaAscii(pyblish_magenta.api.Extractor):
@@ -12,6 +14,9 @@ class ExtractMayaAscii(pyblish_magenta.api.Extractor):
     families = ["rig"]
     optional = True
 
+    # Shading engines of the shapes are exported along with the history
+    includes_shading = True
+
     def process(self, instance):
         from maya import cmds
 
@@ -20,16 +25,24 @@ class ExtractMayaAscii(pyblish_magenta.api.Extractor):
         filename = "{0}.ma".format(instance.name)
         path = os.path.join(dir_path, filename)
 
+        nodes = list(pyblish_magenta.api.get_dag_paths(instance))
+
+        def export():
+            # A single frame is exported, the evaluation mode is kept
+            with evaluation.extraction(mode=None):
+                with pyblish_maya.maintained_selection():
+                    cmds.select(nodes, noExpand=True)
+                    cmds.file(path,
+                              force=True,
+                              typ="mayaAscii",
+                              exportSelected=True,
+                              preserveReferences=False,
+                              constructionHistory=True)
+
         # Perform extraction
         self.log.info("Performing extraction..")
-        with pyblish_maya.maintained_selection():
-            cmds.select(instance, noExpand=True)
-            cmds.file(path,
-                      force=True,
-                      typ="mayaAscii",
-                      exportSelected=True,
-                      preserveReferences=False,
-                      constructionHistory=True)
+        pyblish_magenta.extraction.extract(self, instance, path, export,
+                                           cmds.currentTime(query=True))
 
         self.log.info("Extracted instance '{0}' to: {1}".format(
             instance.name, path))
@@ -2,6 +2,9 @@ import os
 
 import pyblish_maya
 import pyblish_magenta.api
+import pyblish_magenta.display_layers
+import pyblish_magenta.extraction
+from pyblish_magenta import evaluation
 
 
 class ExtractModel(pyblish_magenta.api.Extractor):
@@ -16,6 +19,7 @@ class ExtractModel(pyblish_magenta.api.Extractor):
         - Smooth preview is turned off for the geometry
         - Default shader is assigned (no materials are exported)
         - Remove display layers
+        - Undo is disabled and the viewport is not refreshed
 
     """
 
@@ -32,9 +36,6 @@ class ExtractModel(pyblish_magenta.api.Extractor):
         filename = "{0}.ma".format(instance.name)
         path = os.path.join(dir_path, filename)
 
-        # Perform extraction
-        self.log.info("Performing extraction..")
-
         # Get only the shape contents we need in such a way that we avoid
         # taking along intermediateObjects
         members = instance.data("setMembers")
@@ -45,27 +46,43 @@ class ExtractModel(pyblish_magenta.api.Extractor):
                           noIntermediate=True,
                           long=True)
 
+        layers = pyblish_magenta.display_layers.get_display_layers(
+            instance.context)
+
+        nodes = list(pyblish_magenta.api.get_dag_paths(instance))
+
         from cb.utils.maya import context
-        with context.no_display_layers(instance):
-            with context.displaySmoothness(members,
-                                           divisionsU=0,
-                                           divisionsV=0,
-                                           pointsWire=4,
-                                           pointsShaded=1,
-                                           polygonObject=1):
-                with context.shader(members,
-                                    shadingEngine="initialShadingGroup"):
-                    with pyblish_maya.maintained_selection():
-                        cmds.select(members, noExpand=True)
-                        cmds.file(path,
-                                  force=True,
-                                  typ="mayaAscii",
-                                  exportSelected=True,
-                                  preserveReferences=False,
-                                  channels=False,
-                                  constraints=False,
-                                  expressions=False,
-                                  constructionHistory=False)
+
+        def export():
+            # A single frame is exported, the evaluation mode is kept
+            with evaluation.extraction(mode=None):
+                with pyblish_magenta.display_layers.no_display_layers(
+                        nodes, layers):
+                    with context.displaySmoothness(members,
+                                                   divisionsU=0,
+                                                   divisionsV=0,
+                                                   pointsWire=4,
+                                                   pointsShaded=1,
+                                                   polygonObject=1):
+                        with context.shader(
+                                members,
+                                shadingEngine="initialShadingGroup"):
+                            with pyblish_maya.maintained_selection():
+                                cmds.select(members, noExpand=True)
+                                cmds.file(path,
+                                          force=True,
+                                          typ="mayaAscii",
+                                          exportSelected=True,
+                                          preserveReferences=False,
+                                          channels=False,
+                                          constraints=False,
+                                          expressions=False,
+                                          constructionHistory=False)
+
+        # Perform extraction
+        self.log.info("Performing extraction..")
+        pyblish_magenta.extraction.extract(self, instance, path, export,
+                                           cmds.currentTime(query=True))
 
         self.log.info("Extracted instance '{0}' to: {1}".format(
             instance.name, path))
@@ -1,66 +1,8 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.display_layers
+import pyblish_magenta.hierarchy
 from pyblish_magenta.action import SelectInvalidAction
-from maya import cmds
-
-
-def is_visible(node,
-               displayLayer=True,
-               intermediateObject=True,
-               parentHidden=True,
-               visibility=True):
-    """Is `node` visible?
-
-    Returns whether a node is hidden by one of the following methods:
-    - The node exists (always checked)
-    - The node must be a dagNode (always checked)
-    - The node's visibility is off.
-    - The node is set as intermediate Object.
-    - The node is in a disabled displayLayer.
-    - Whether any of its parent nodes is hidden.
-
-    Roughly based on: http://ewertb.soundlinker.com/mel/mel.098.php
-
-    Returns:
-        bool: Whether the node is visible in the scene
-
-    """
-
-    # Only existing objects can be visible
-    if not cmds.objExists(node):
-        return False
-
-    # Only dagNodes can be visible
-    if not cmds.objectType(node, isAType='dagNode'):
-        return False
-
-    if visibility:
-        if not cmds.getAttr('{0}.visibility'.format(node)):
-            return False
-
-    if intermediateObject and cmds.objectType(node, isAType='shape'):
-        if cmds.getAttr('{0}.intermediateObject'.format(node)):
-            return False
-
-    if displayLayer:
-        # Display layers set overrideEnabled and overrideVisibility on members
-        if cmds.attributeQuery('overrideEnabled', node=node, exists=True):
-            if cmds.getAttr('{0}.overrideEnabled'.format(node)) and \
-               cmds.getAttr('{0}.overrideVisibility'.format(node)):
-                return False
-
-    if parentHidden:
-        parents = cmds.listRelatives(node, parent=True, fullPath=True)
-        if parents:
-            parent = parents[0]
-            if not is_visible(parent,
-                              displayLayer=displayLayer,
-                              intermediateObject=False,
-                              parentHidden=parentHidden,
-                              visibility=visibility):
-                return False
-
-    return True
 
 
 class ValidateJointsHidden(pyblish.api.InstancePlugin):
@@ -84,8 +26,12 @@ class ValidateJointsHidden(pyblish.api.InstancePlugin):
 
     @staticmethod
     def get_invalid(instance):
-        joints = cmds.ls(instance, type='joint', long=True)
-        return [joint for joint in joints if is_visible(joint, displayLayer=True)]
+        index = pyblish_magenta.api.get_scene_index(instance)
+        joints = index.ls(type='joint')
+        layers = pyblish_magenta.display_layers.get_display_layers(
+            instance.context)
+        visibility = pyblish_magenta.hierarchy.get_visibility(joints, layers)
+        return [joint for joint in joints if visibility[joint]]
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
@@ -1,40 +1,11 @@
-import re
-from maya import cmds
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
+import pyblish_magenta.incremental
 
 from pyblish_magenta.action import SelectInvalidAction
 
 
-def len_flattened(components):
-    """Return the length of the list as if it was flattened.
-
-    Maya will return consecutive components as a single entry
-    when requesting with `maya.cmds.ls` without the `flatten`
-    flag. Though enabling `flatten` on a large list (e.g. millions)
-    will result in a slow result. This command will return the amount
-    of entries in a non-flattened list by parsing the result with 
-    regex.
-
-    Args:
-        components (list): The non-flattened components.
-
-    Returns:
-        int: The amount of entries.
-
-    """
-    assert isinstance(components, (list, tuple))
-    n = 0
-    for c in components:
-        match = re.search("\[([0-9]+):([0-9]+)\]", c)
-        if match:
-            start, end = match.groups()
-            n += int(end) - int(start) + 1
-        else:
-            n += 1
-    return n
-
-
 class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
     """Validate the current mesh has UVs.
 
@@ -50,21 +21,23 @@ class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
     category = 'geometry'
     label = 'Mesh Has UVs'
     actions = [SelectInvalidAction]
+    incremental = True
     optional = True
 
     @classmethod
     def get_invalid(cls, instance):
         invalid = []
 
-        for node in cmds.ls(instance, type='mesh'):
-            uv = cmds.polyEvaluate(node, uv=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        mesh_stats = pyblish_magenta.mesh.get_mesh_stats(instance)
+        for node in index.ls(type='mesh'):
+            stats = mesh_stats.get(node)
 
-            if uv == 0:
+            if stats.uvs == 0:
                 invalid.append(node)
                 continue
 
-            vertex = cmds.polyEvaluate(node, vertex=True)
-            if uv < vertex:
+            if stats.uvs < stats.vertices:
 
                 # Workaround:
                 # Maya can have instanced UVs in a single mesh, for example
@@ -75,10 +48,7 @@ class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
                 # Note: Maya can save instanced UVs to `mayaAscii` but cannot
                 #       load this as instanced. So saving, opening and saving
                 #       again will lose this information.
-                uv_to_vertex = cmds.polyListComponentConversion(node + ".map[*]",
-                                                                toVertex=True)
-                uv_vertex_count = len_flattened(uv_to_vertex)
-                if uv_vertex_count < vertex:
+                if stats.uv_vertices < stats.vertices:
                     invalid.append(node)
                 else:
                     cls.log.warning("Node has instanced UV points: {0}".format(node))
@@ -87,7 +57,7 @@ class ValidateMeshHasUVs(pyblish.api.InstancePlugin):
 
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.incremental.get_invalid(self, instance)
 
         if invalid:
             raise RuntimeError("Meshes found in instance without "
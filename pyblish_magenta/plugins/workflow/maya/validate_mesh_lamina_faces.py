@@ -1,7 +1,8 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
+import pyblish_magenta.incremental
 from pyblish_magenta.action import SelectInvalidAction
-from maya import cmds
 
 
 class ValidateMeshLaminaFaces(pyblish.api.InstancePlugin):
@@ -18,16 +19,19 @@ class ValidateMeshLaminaFaces(pyblish.api.InstancePlugin):
     version = (0, 1, 0)
     label = 'Mesh Lamina Faces'
     actions = [SelectInvalidAction]
+    incremental = True
 
     @staticmethod
     def get_invalid(instance):
-        meshes = cmds.ls(instance, type='mesh', long=True)
-        return [mesh for mesh in meshes if cmds.polyInfo(mesh, laminaFaces=True)]
+        index = pyblish_magenta.api.get_scene_index(instance)
+        mesh_stats = pyblish_magenta.mesh.get_mesh_stats(instance)
+        meshes = index.ls(type='mesh')
+        return [mesh for mesh in meshes if mesh_stats.get(mesh).lamina_faces]
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.incremental.get_invalid(self, instance)
 
         if invalid:
             raise ValueError("Meshes found with lamina faces: "
@@ -1,7 +1,7 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.transforms
 from pyblish_magenta.action import SelectInvalidAction
-from maya import cmds
 
 
 class ValidateMeshNoNegativeScale(pyblish.api.Validator):
@@ -24,20 +24,13 @@ class ValidateMeshNoNegativeScale(pyblish.api.Validator):
 
     @staticmethod
     def get_invalid(instance):
-        meshes = cmds.ls(instance,
-                         type='mesh',
-                         long=True,
-                         noIntermediate=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        meshes = index.ls(type='mesh', noIntermediate=True)
 
-        invalid = []
-        for mesh in meshes:
-            transform = cmds.listRelatives(mesh, parent=True, fullPath=True)[0]
-            scale = cmds.getAttr("{0}.scale".format(transform))[0]
+        table = pyblish_magenta.transforms.get_transform_table(instance)
+        negative = set(table.negative("scale"))
 
-            if any(x < 0 for x in scale):
-                invalid.append(mesh)
-
-        return invalid
+        return [mesh for mesh in meshes if index.transform(mesh) in negative]
 
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
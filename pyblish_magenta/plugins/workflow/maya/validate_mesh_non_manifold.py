@@ -1,5 +1,7 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
+import pyblish_magenta.incremental
 
 from pyblish_magenta.action import SelectInvalidAction
 
@@ -17,17 +19,18 @@ class ValidateMeshNonManifold(pyblish.api.Validator):
     hosts = ['maya']
     label = 'Mesh Non-Manifold Vertices/Edges'
     actions = [SelectInvalidAction]
+    incremental = True
 
     @staticmethod
     def get_invalid(instance):
-        from maya import cmds
-
-        meshes = cmds.ls(instance, type='mesh', long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        mesh_stats = pyblish_magenta.mesh.get_mesh_stats(instance)
+        meshes = index.ls(type='mesh')
 
         invalid = []
         for mesh in meshes:
-            if (cmds.polyInfo(mesh, nonManifoldVertices=True) or
-                    cmds.polyInfo(mesh, nonManifoldEdges=True)):
+            stats = mesh_stats.get(mesh)
+            if stats.non_manifold_vertices or stats.non_manifold_edges:
                 invalid.append(mesh)
 
         return invalid
@@ -35,7 +38,7 @@ class ValidateMeshNonManifold(pyblish.api.Validator):
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.incremental.get_invalid(self, instance)
 
         if invalid:
             raise ValueError("Meshes found with non-manifold "
@@ -1,5 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
 from maya import cmds
 
 from pyblish_magenta.action import (
@@ -28,6 +29,11 @@ class ValidateMeshNormalsUnlocked(pyblish.api.Validator):
     @staticmethod
     def has_locked_normals(mesh):
         """Return whether a mesh node has locked normals"""
+        if (pyblish_magenta.mesh.vertex_count(mesh) >=
+                pyblish_magenta.mesh.CMDS_THRESHOLD):
+            locked = pyblish_magenta.mesh.locked_normals(mesh)
+            return pyblish_magenta.mesh.any_nonzero(locked)
+
         return any(cmds.polyNormalPerVertex(mesh + ".vtxFace[*][*]",
                                             query=True,
                                             freezeNormal=True))
@@ -36,7 +42,8 @@ class ValidateMeshNormalsUnlocked(pyblish.api.Validator):
     def get_invalid(cls, instance):
         """Return the meshes with locked normals in instance"""
 
-        meshes = cmds.ls(instance, type='mesh', long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        meshes = index.ls(type='mesh')
         return [mesh for mesh in meshes if cls.has_locked_normals(mesh)]
 
     def process(self, instance):
@@ -1,5 +1,7 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
+import pyblish_magenta.incremental
 
 from pyblish_magenta.action import (
     SelectInvalidAction,
@@ -18,21 +20,18 @@ class ValidateMeshSingleUVSet(pyblish.api.InstancePlugin):
     version = (0, 1, 0)
     label = "Mesh Single UV Set"
     actions = [SelectInvalidAction, RepairAction]
+    incremental = True
 
     @staticmethod
     def get_invalid(instance):
-        from maya import cmds
-
-        meshes = cmds.ls(instance, type='mesh', long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        mesh_stats = pyblish_magenta.mesh.get_mesh_stats(instance)
+        meshes = index.ls(type='mesh')
 
         invalid = []
         for mesh in meshes:
-            uvSets = cmds.polyUVSet(mesh, 
-                                    query=True, 
-                                    allUVSets=True) or []
-
-            # ensure unique (sometimes maya will list 'map1' twice)
-            uvSets = set(uvSets)    
+            # Unique UV sets (sometimes maya will list 'map1' twice)
+            uvSets = mesh_stats.get(mesh).uv_sets
 
             if len(uvSets) != 1:
                 invalid.append(mesh)
@@ -42,7 +41,7 @@ class ValidateMeshSingleUVSet(pyblish.api.InstancePlugin):
     def process(self, instance):
         """Process all the nodes in the instance 'objectSet'"""
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.incremental.get_invalid(self, instance)
 
         if invalid:
             raise ValueError("Nodes found with multiple "
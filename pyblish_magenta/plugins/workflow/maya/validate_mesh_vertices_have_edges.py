@@ -1,40 +1,11 @@
-import re
-from maya import cmds
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.mesh
+import pyblish_magenta.incremental
 
 from pyblish_magenta.action import SelectInvalidAction
 
 
-def len_flattened(components):
-    """Return the length of the list as if it was flattened.
-
-    Maya will return consecutive components as a single entry
-    when requesting with `maya.cmds.ls` without the `flatten`
-    flag. Though enabling `flatten` on a large list (e.g. millions)
-    will result in a slow result. This command will return the amount
-    of entries in a non-flattened list by parsing the result with 
-    regex.
-
-    Args:
-        components (list): The non-flattened components.
-
-    Returns:
-        int: The amount of entries.
-
-    """
-    assert isinstance(components, (list, tuple))
-    n = 0
-    for c in components:
-        match = re.search("\[([0-9]+):([0-9]+)\]", c)
-        if match:
-            start, end = match.groups()
-            n += int(end) - int(start) + 1
-        else:
-            n += 1
-    return n
-
-
 class ValidateMeshVerticesHaveEdges(pyblish.api.InstancePlugin):
     """Validate meshes have only vertices that are connected by to edges.
     
@@ -60,28 +31,27 @@ class ValidateMeshVerticesHaveEdges(pyblish.api.InstancePlugin):
     category = 'geometry'
     label = 'Mesh Vertices Have Edges'
     actions = [SelectInvalidAction]
+    incremental = True
 
     @classmethod
     def get_invalid(cls, instance):
         invalid = []
 
-        meshes = cmds.ls(instance, type="mesh", long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        mesh_stats = pyblish_magenta.mesh.get_mesh_stats(instance)
+        meshes = index.ls(type="mesh")
         for mesh in meshes:
-            num_vertices = cmds.polyEvaluate(mesh, vertex=True)
+            stats = mesh_stats.get(mesh)
 
             # Vertices from all edges
-            edges = mesh + ".e[*]"
-            vertices = cmds.polyListComponentConversion(edges, toVertex=True)
-            num_vertices_from_edges = len_flattened(vertices)
-
-            if num_vertices != num_vertices_from_edges:
+            if stats.vertices != stats.edge_vertices:
                 invalid.append(mesh)
 
         return invalid
 
     def process(self, instance):
 
-        invalid = self.get_invalid(instance)
+        invalid = pyblish_magenta.incremental.get_invalid(self, instance)
 
         if invalid:
             raise RuntimeError("Meshes found in instance with vertices that "
@@ -1,67 +1,8 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.hierarchy
 
 from pyblish_magenta.action import SelectInvalidAction
-from maya import cmds
-
-
-def is_visible(node,
-               displayLayer=True,
-               intermediateObject=True,
-               parentHidden=True,
-               visibility=True):
-    """Is `node` visible?
-
-    Returns whether a node is hidden by one of the following methods:
-    - The node exists (always checked)
-    - The node must be a dagNode (always checked)
-    - The node's visibility is off.
-    - The node is set as intermediate Object.
-    - The node is in a disabled displayLayer.
-    - Whether any of its parent nodes is hidden.
-
-    Roughly based on: http://ewertb.soundlinker.com/mel/mel.098.php
-
-    Returns:
-        bool: Whether the node is visible in the scene
-
-    """
-
-    # Only existing objects can be visible
-    if not cmds.objExists(node):
-        return False
-
-    # Only dagNodes can be visible
-    if not cmds.objectType(node, isAType='dagNode'):
-        return False
-
-    if visibility:
-        if not cmds.getAttr('{0}.visibility'.format(node)):
-            return False
-
-    if intermediateObject and cmds.objectType(node, isAType='shape'):
-        if cmds.getAttr('{0}.intermediateObject'.format(node)):
-            return False
-
-    if displayLayer:
-        # Display layers set overrideEnabled and overrideVisibility on members
-        if cmds.attributeQuery('overrideEnabled', node=node, exists=True):
-            if cmds.getAttr('{0}.overrideEnabled'.format(node)) and \
-               cmds.getAttr('{0}.overrideVisibility'.format(node)):
-                return False
-
-    if parentHidden:
-        parents = cmds.listRelatives(node, parent=True, fullPath=True)
-        if parents:
-            parent = parents[0]
-            if not is_visible(parent,
-                              displayLayer=displayLayer,
-                              intermediateObject=False,
-                              parentHidden=parentHidden,
-                              visibility=visibility):
-                return False
-
-    return True
 
 
 class ValidateModelContent(pyblish.api.InstancePlugin):
@@ -80,12 +21,12 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
 
     @classmethod
     def get_invalid(cls, instance):
-        from maya import cmds
+        index = pyblish_magenta.api.get_scene_index(instance)
 
         # Ensure only valid node types
         allowed = ('mesh', 'transform', 'nurbsCurve')
-        nodes = cmds.ls(instance, long=True)
-        valid = cmds.ls(instance, long=True, type=allowed)
+        nodes = index.ls()
+        valid = index.ls(type=allowed)
         invalid = set(nodes) - set(valid)
 
         if invalid:
@@ -93,7 +34,7 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
             return list(invalid)
 
         # Top group
-        assemblies = cmds.ls(instance, assemblies=True, long=True)
+        assemblies = index.assemblies()
 
         if len(assemblies) != 1:
             cls.log.error("Must have exactly one top group")
@@ -106,24 +47,20 @@ class ValidateModelContent(pyblish.api.InstancePlugin):
             cls.log.error("No valid nodes in the instance")
             return True
 
-        def _is_visible(node):
-            """Return whether node is visible"""
-            return is_visible(node,
-                              displayLayer=False,
-                              intermediateObject=True,
-                              parentHidden=True,
-                              visibility=True)
+        # Visibility of the roots and shapes, regardless of display layers
+        shapes = [node for node in valid if index.is_a(node, "shape")]
+        visibility = pyblish_magenta.hierarchy.get_visibility(
+            assemblies + shapes)
 
         # The roots must be visible (the assemblies)
         for assembly in assemblies:
-            if not _is_visible(assembly):
+            if not visibility[assembly]:
                 cls.log.error("Invisible assembly (root node) is not "
                               "allowed: {0}".format(assembly))
                 invalid.add(assembly)
 
         # Ensure at least one shape is visible
-        shapes = cmds.ls(valid, long=True, shapes=True)
-        if not any(_is_visible(shape) for shape in shapes):
+        if not any(visibility[shape] for shape in shapes):
             cls.log.error("No visible shapes in the model instance")
             invalid.update(shapes)
 
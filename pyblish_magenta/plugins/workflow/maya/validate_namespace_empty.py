@@ -1,6 +1,6 @@
 import pyblish.api
 import pyblish_magenta.api
-from maya import cmds
+import pyblish_magenta.namespaces
 
 
 class ValidateNamespaceEmpty(pyblish.api.ContextPlugin):
@@ -9,6 +9,8 @@ class ValidateNamespaceEmpty(pyblish.api.ContextPlugin):
     This is a scene wide validation that filters out "UI" and "shared"
     namespaces that exist by default in Maya and are mostly hidden.
 
+    A namespace that only contains empty namespaces is empty too.
+
     """
 
     order = pyblish_magenta.api.ValidateSceneOrder
@@ -20,22 +22,8 @@ class ValidateNamespaceEmpty(pyblish.api.ContextPlugin):
 
     def process(self, context):
         """Process the Context"""
-        all_namespaces = cmds.namespaceInfo(":",
-                                            listOnlyNamespaces=True,
-                                            recurse=True)
-        non_internal_namespaces = [ns for ns in all_namespaces
-                                   if ns not in ["UI", "shared"]]
-
-        invalid = []
-        # TODO: Check whether currently a namespace with
-        # another namespace in it (both empty) is
-        # considered empty
-        for namespace in non_internal_namespaces:
-            namespace_content = cmds.namespaceInfo(namespace,
-                                                   listNamespace=True,
-                                                   recurse=True)
-            if not namespace_content:
-                invalid.append(namespace)
+        tree = pyblish_magenta.namespaces.get_namespace_tree(context)
+        invalid = tree.empty(exclude=["UI", "shared"])
 
         assert not invalid, (
             "Empty namespaces found: {0}".format(invalid))
@@ -1,6 +1,7 @@
 import pyblish
 import pyblish_magenta.api
 
+from pyblish_magenta import animation
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -24,16 +25,15 @@ class ValidateNoAnimation(pyblish.api.Validator):
     def get_invalid(instance):
         from maya import cmds
 
-        nodes = instance[:]
+        nodes = cmds.ls(list(pyblish_magenta.api.get_dag_paths(instance)),
+                        long=True)
 
         if not nodes:
             return []
 
-        curves = cmds.keyframe(nodes, q=1, name=True)
-        if curves:
-            return list(set(cmds.listConnections(curves)))
-
-        return []
+        # Driven keys and constraints are not keyframes
+        index = animation.get_animation_index(instance.context)
+        return index.keyed_nodes(nodes)
 
     def process(self, instance):
 
@@ -21,7 +21,8 @@ class ValidateNoDefaultCameras(pyblish.api.InstancePlugin):
 
     @staticmethod
     def get_invalid(instance):
-        cameras = cmds.ls(instance, type='camera', long=True)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        cameras = index.ls(type='camera')
         return [cam for cam in cameras if cmds.camera(cam, query=True, startupCamera=True)]
 
     def process(self, instance):
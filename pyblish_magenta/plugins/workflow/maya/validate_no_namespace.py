@@ -1,19 +1,12 @@
 import pyblish.api
 import pyblish_magenta.api
-import maya.cmds as cmds
+import pyblish_magenta.naming
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
 )
 
 
-def get_namespace(node_name):
-    # ensure only node's name (not parent path)
-    node_name = node_name.rsplit("|")[-1]
-    # ensure only namespace
-    return node_name.rpartition(":")[0]
-
-
 class ValidateNoNamespace(pyblish.api.InstancePlugin):
     """Ensure the nodes don't have a namespace"""
 
@@ -27,8 +20,7 @@ class ValidateNoNamespace(pyblish.api.InstancePlugin):
 
     @staticmethod
     def get_invalid(instance):
-        nodes = cmds.ls(instance, long=True)
-        return [node for node in nodes if get_namespace(node)]
+        return pyblish_magenta.naming.get_invalid(instance, "namespace")
 
     def process(self, instance):
         """Process all the nodes in the instance"""
@@ -1,30 +1,10 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.hierarchy
 from pyblish_magenta.action import RepairAction, SelectInvalidAction
 import maya.cmds as cmds
 
 
-def has_shape_children(node):
-    # Check if any descendants
-    allDescendents = cmds.listRelatives(node,
-                                        allDescendents=True,
-                                        fullPath=True)
-    if not allDescendents:
-        return False
-
-    # Check if there are any shapes at all
-    shapes = cmds.ls(allDescendents, shapes=True)
-    if not shapes:
-        return False
-
-    # Check if all descendent shapes are intermediateObjects;
-    # if so we consider this node a null node and return False.
-    if all(cmds.getAttr('{0}.intermediateObject'.format(x)) for x in shapes):
-        return False
-
-    return True
-
-
 class ValidateNoNullTransforms(pyblish.api.InstancePlugin):
     """Ensure no null transforms are in the scene.
 
@@ -48,14 +28,13 @@ class ValidateNoNullTransforms(pyblish.api.InstancePlugin):
     def get_invalid(instance):
         """Return invalid transforms in instance"""
 
-        transforms = cmds.ls(instance, type='transform', long=True)
-
-        invalid = []
-        for transform in transforms:
-            if not has_shape_children(transform):
-                invalid.append(transform)
+        index = pyblish_magenta.api.get_scene_index(instance)
+        transforms = index.ls(type='transform')
 
-        return invalid
+        # Transforms with only intermediate shapes are null transforms
+        has_shape = pyblish_magenta.hierarchy.get_shape_descendants(index)
+        return [transform for transform in transforms
+                if not has_shape.get(transform)]
 
     def process(self, instance):
         """Process all the transform nodes in the instance """
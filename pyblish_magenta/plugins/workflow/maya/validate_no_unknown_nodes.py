@@ -1,6 +1,5 @@
 import pyblish.api
 import pyblish_magenta.api
-from maya import cmds
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -24,7 +23,8 @@ class ValidateNoUnknownNodes(pyblish.api.InstancePlugin):
 
     @staticmethod
     def get_invalid(instance):
-        return cmds.ls(instance, type='unknown')
+        index = pyblish_magenta.api.get_scene_index(instance)
+        return index.ls(type='unknown')
 
     def process(self, instance):
         """Process all the nodes in the instance"""
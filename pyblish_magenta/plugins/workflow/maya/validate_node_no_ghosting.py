@@ -1,6 +1,5 @@
 import pyblish.api
 import pyblish_magenta.api
-from maya import cmds
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -28,17 +27,12 @@ class ValidateNodeNoGhosting(pyblish.api.InstancePlugin):
     def get_invalid(cls, instance):
 
         # Transforms and shapes seem to have ghosting
-        nodes = cmds.ls(instance, long=True, type=['transform', 'shape'])
-        invalid = []
-        for node in nodes:
-            for attr, required_value in cls._attributes.iteritems():
-                if cmds.attributeQuery(attr, node=node, exists=True):
+        index = pyblish_magenta.api.get_scene_index(instance)
+        nodes = index.ls(type=('transform', 'shape'))
 
-                    value = cmds.getAttr('{0}.{1}'.format(node, attr))
-                    if value != required_value:
-                        invalid.append(node)
-
-        return invalid
+        table = pyblish_magenta.api.read_attributes(nodes,
+                                                    list(cls._attributes))
+        return table.differs(cls._attributes)
 
     def process(self, instance):
 
@@ -2,6 +2,7 @@ import pyblish.api
 import pyblish_magenta.api
 from maya import cmds
 
+from pyblish_magenta import references
 from pyblish_magenta.action import SelectInvalidAction
 
 
@@ -43,6 +44,9 @@ class RepairFailedEditsAction(pyblish.api.Action):
                                successfulEdits=False)
         self.log.info("Removed failed edits")
 
+        # The edit status of the references changed, read them again
+        context.data.pop("referenceMap", None)
+
 
 class ValidateReferencesNoFailedEdits(pyblish.api.InstancePlugin):
     """Validate that all referenced nodes' reference nodes don't have failed
@@ -80,27 +84,16 @@ class ValidateReferencesNoFailedEdits(pyblish.api.InstancePlugin):
                 (type: any type of nodes)
 
         """
-        referenced_nodes = cmds.ls(instance, referencedNodes=True, long=True)
-        if not referenced_nodes:
-            return list()
+        refmap = references.get_reference_map(instance.context)
+        nodes = list(pyblish_magenta.api.get_dag_paths(instance))
 
         # Get reference nodes from referenced nodes
         # (note that reference_nodes != referenced_nodes)
-        reference_nodes = set()
-        for node in referenced_nodes:
-            reference_node = cmds.referenceQuery(node, referenceNode=True)
-            if reference_node:
-                reference_nodes.add(reference_node)
+        reference_nodes = refmap.references_of(nodes)
 
         # Check for failed edits on each reference node.
-        invalid = []
-        for reference_node in reference_nodes:
-            failed_edits = cmds.referenceQuery(reference_node,
-                                               editNodes=True,
-                                               failedEdits=True,
-                                               successfulEdits=False)
-            if failed_edits:
-                invalid.append(reference_node)
+        invalid = [reference_node for reference_node in reference_nodes
+                   if refmap.has_failed_edits(reference_node)]
 
         return invalid
 
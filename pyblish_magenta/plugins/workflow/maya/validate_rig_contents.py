@@ -21,9 +21,10 @@ class ValidateRigContents(pyblish.api.InstancePlugin):
 
         objsets = ("controls_SET", "pointcache_SET")
 
+        members = pyblish_magenta.api.get_dag_paths(instance)
         missing = list()
         for objset in objsets:
-            if objset not in instance:
+            if objset not in members:
                 missing.append(objset)
 
         assert not missing, ("%s is missing %s"
@@ -1,16 +1,12 @@
-import re
-
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.naming
 from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
 )
 from maya import cmds
-
-
-def short_name(node):
-    return node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+from pyblish_magenta.naming import short_name
 
 
 class ValidateShapeDefaultNames(pyblish.api.InstancePlugin):
@@ -44,34 +40,13 @@ class ValidateShapeDefaultNames(pyblish.api.InstancePlugin):
 
     @staticmethod
     def _define_default_name(shape):
-        transform = short_name(cmds.listRelatives(shape, parent=True, fullPath=True)[0])
+        transform = short_name(shape.rsplit("|", 1)[0])
         return '{0}Shape'.format(transform)
 
     @staticmethod
-    def _is_valid(shape):
-        """ Return whether the shape's name is similar to Maya's default. """
-        transform = cmds.listRelatives(shape, parent=True, fullPath=True)[0]
-
-        transform_name = short_name(transform)
-        shape_name = short_name(shape)
-
-        # A Shape's name can be either {transform}{numSuffix}
-        # Shape or {transform}Shape{numSuffix}
-        # Upon renaming nodes in Maya that is
-        # the pattern Maya will act towards.
-        transform_no_num = transform_name.rstrip("0123456789")
-        pattern = '^{transform}[0-9]*Shape[0-9]*$'.format(
-            transform=transform_no_num)
-
-        if re.match(pattern, shape_name):
-            return True
-        else:
-            return False
-
-    @classmethod
-    def get_invalid(cls, instance):
-        shapes = cmds.ls(instance, shapes=True, long=True)
-        return [shape for shape in shapes if not cls._is_valid(shape)]
+    def get_invalid(instance):
+        return pyblish_magenta.naming.get_invalid(instance,
+                                                  "defaultShapeName")
 
     def process(self, instance):
         """Process all the shape nodes in the instance"""
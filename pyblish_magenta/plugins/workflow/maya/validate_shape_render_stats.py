@@ -4,7 +4,6 @@ from pyblish_magenta.action import (
     SelectInvalidAction,
     RepairAction
 )
-from maya import cmds
 
 
 class ValidateShapeRenderStats(pyblish.api.Validator):
@@ -33,19 +32,12 @@ class ValidateShapeRenderStats(pyblish.api.Validator):
     def get_invalid(instance):
         # It seems the "surfaceShape" and those derived from it have
         # `renderStat` attributes.
-        shapes = cmds.ls(instance, long=True, type='surfaceShape')
-        invalid = []
-        for shape in shapes:
-            for attr, requiredValue in \
-                    ValidateShapeRenderStats.defaults.iteritems():
+        index = pyblish_magenta.api.get_scene_index(instance)
+        shapes = index.ls(type='surfaceShape')
 
-                if cmds.attributeQuery(attr, node=shape, exists=True):
-                    value = cmds.getAttr('{node}.{attr}'.format(node=shape,
-                                                                attr=attr))
-                    if value != requiredValue:
-                        invalid.append(shape)
-
-        return invalid
+        defaults = ValidateShapeRenderStats.defaults
+        table = pyblish_magenta.api.read_attributes(shapes, list(defaults))
+        return table.differs(defaults)
 
     def process(self, instance):
 
@@ -58,11 +50,9 @@ class ValidateShapeRenderStats(pyblish.api.Validator):
     @staticmethod
     def repair(instance):
 
-        for shape in ValidateShapeRenderStats.get_invalid(instance):
-            for attr, default_value in ValidateShapeRenderStats.defaults.iteritems():
+        defaults = ValidateShapeRenderStats.defaults
+        invalid = ValidateShapeRenderStats.get_invalid(instance)
 
-                if cmds.attributeQuery(attr, node=shape, exists=True):
-                    plug = '{0}.{1}'.format(shape, attr)
-                    value = cmds.getAttr(plug)
-                    if value != default_value:
-                        cmds.setAttr(plug, default_value)
+        # Only set the values that differ, all in one batch
+        table = pyblish_magenta.api.read_attributes(invalid, list(defaults))
+        pyblish_magenta.api.write_attributes(table.mismatches(defaults))
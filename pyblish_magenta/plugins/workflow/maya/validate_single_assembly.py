@@ -18,7 +18,8 @@ class ValidateSingleAssembly(pyblish.api.InstancePlugin):
     def process(self, instance):
         from maya import cmds
 
-        assemblies = cmds.ls(instance, assemblies=True)
+        nodes = list(pyblish_magenta.api.get_dag_paths(instance))
+        assemblies = cmds.ls(nodes, assemblies=True) if nodes else []
 
         # ensure unique (somehow `maya.cmds.ls` doesn't manage that)
         assemblies = set(assemblies)
@@ -1,10 +1,9 @@
 import pyblish.api
 import pyblish_magenta.api
+import pyblish_magenta.transforms
 
 from pyblish_magenta.action import SelectInvalidAction
 
-from maya import cmds
-
 
 class ValidateTransformZero(pyblish.api.Validator):
     """Transforms can't have any values
@@ -23,10 +22,7 @@ class ValidateTransformZero(pyblish.api.Validator):
     label = "Transform Zero (Freeze)"
     actions = [SelectInvalidAction]
 
-    _identity = [1.0, 0.0, 0.0, 0.0,
-                 0.0, 1.0, 0.0, 0.0,
-                 0.0, 0.0, 1.0, 0.0,
-                 0.0, 0.0, 0.0, 1.0]
+    _identity = pyblish_magenta.transforms.IDENTITY
     _tolerance = 1e-30
 
     @classmethod
@@ -46,16 +42,10 @@ class ValidateTransformZero(pyblish.api.Validator):
 
         """
 
-        transforms = cmds.ls(instance, type="transform")
-
-        invalid = []
-        for transform in transforms:
-            mat = cmds.xform(transform, q=1, matrix=True, objectSpace=True)
-            if not all(abs(x-y) < cls._tolerance
-                       for x, y in zip(cls._identity, mat)):
-                invalid.append(transform)
-
-        return invalid
+        table = pyblish_magenta.transforms.get_transform_table(instance)
+        return table.deviating("matrix",
+                               cls._identity,
+                               tolerance=cls._tolerance)
 
     def process(self, instance):
         """Process all the nodes in the instance "objectSet"""
@@ -0,0 +1,313 @@
+"""References of a scene, their files, namespaces and edits
+
+The reference nodes of a scene are listed once per context along with
+their namespace, file and parent reference. Referenced nodes are then
+mapped onto their reference through their namespace, as opposed to a
+`referenceQuery(node, referenceNode=True)` per node, and failed edits
+are queried once per reference rather than once per instance.
+
+The files of references are resolved, along with the metadata published
+alongside them, through an optional ReferenceFileCache on disk, such
+that repeated publishes of a scene only read the files that changed.
+
+Example:
+    >>> refmap = ReferenceMap(namespaces={"tableRN": "table",
+    ...                                   "cupRN": "table:cup"},
+    ...                       files={"tableRN": "/assets/table.ma",
+    ...                              "cupRN": "/assets/cup.ma"},
+    ...                       parents={"cupRN": "tableRN"},
+    ...                       referenced=["|table:top_GEO",
+    ...                                   "|table:top_GEO|table:cup:cup_GEO"])
+    >>> refmap.reference("|table:top_GEO|table:cup:cup_GEO")
+    'cupRN'
+    >>> refmap.references_of(["|table:top_GEO", "|persp"])
+    ['tableRN']
+    >>> refmap.top_level()
+    ['tableRN']
+
+"""
+
+import os
+import json
+
+from .namespaces import split_namespace, parent_namespace
+
+# Reference nodes that do not represent a referenced file
+INTERNAL = ("sharedReferenceNode", "_UNKNOWN_REF_NODE_")
+
+# Path to an on-disk ReferenceFileCache, disabled when not set
+CACHE_ENVIRONMENT = "PYBLISH_MAGENTA_REFERENCE_CACHE"
+
+# Metadata published alongside a file, as written by ExtractMetadata,
+# that identifies where the file came from
+SOURCE_KEYS = ("topic", "author", "date", "filename")
+
+# Metadata written alongside published files
+SIDECAR = "metadata.meta"
+
+
+class ReferenceMap(object):
+    """Reference nodes of a scene and the nodes they contain
+
+    Arguments:
+        namespaces (dict): Namespace per reference node
+        files (dict): Filename per reference node
+        parents (dict, optional): Parent reference node per nested
+            reference node
+        referenced (list, optional): Long names of all referenced nodes
+
+    """
+
+    def __init__(self, namespaces, files, parents=None, referenced=None):
+        self.namespaces = dict(namespaces)
+        self.files = dict(files)
+        self.parents = dict((ref, None) for ref in self.namespaces)
+        self.parents.update(parents or {})
+        self.referenced = frozenset(referenced or [])
+        self.references = sorted(self.namespaces)
+
+        self._by_namespace = dict((namespace.lstrip(":"), ref)
+                                  for ref, namespace in self.namespaces.items()
+                                  if namespace)
+        self._failed_edits = dict()
+
+    def __contains__(self, reference):
+        return reference in self.namespaces
+
+    def __iter__(self):
+        return iter(self.references)
+
+    def is_referenced(self, node):
+        """Return whether `node` is a referenced node"""
+        return node in self.referenced
+
+    def reference(self, node):
+        """Return the reference node of referenced `node`
+
+        Nodes are looked up by their namespace, or the closest parent
+        namespace of a reference. Nodes of references loaded without
+        a namespace are queried from the scene instead.
+
+        """
+
+        namespace = split_namespace(node)[0]
+        while namespace:
+            reference = self._by_namespace.get(namespace)
+            if reference is not None:
+                return reference
+            namespace = parent_namespace(namespace)
+
+        from maya import cmds
+        try:
+            return cmds.referenceQuery(node, referenceNode=True)
+        except RuntimeError:
+            return None
+
+    def references_of(self, nodes):
+        """Return the reference nodes of the referenced nodes of `nodes`"""
+        references = set()
+        for node in nodes:
+            if node in self.referenced:
+                reference = self.reference(node)
+                if reference is not None:
+                    references.add(reference)
+        return sorted(references)
+
+    def top_level(self):
+        """Return the reference nodes not nested in other references"""
+        return [ref for ref in self.references if self.parents[ref] is None]
+
+    def has_failed_edits(self, reference):
+        """Return whether `reference` has failed reference edits
+
+        Queried from the scene on first access per reference.
+
+        """
+
+        failed = self._failed_edits.get(reference)
+        if failed is None:
+            from maya import cmds
+            failed = bool(cmds.referenceQuery(reference,
+                                              editNodes=True,
+                                              failedEdits=True,
+                                              successfulEdits=False))
+            self._failed_edits[reference] = failed
+        return failed
+
+
+def read_reference_map():
+    """Return the ReferenceMap of the current scene"""
+    from maya import cmds
+
+    namespaces = dict()
+    files = dict()
+    parents = dict()
+    for reference in cmds.ls(type="reference") or []:
+        if any(name in reference for name in INTERNAL):
+            continue
+
+        try:
+            # Exclude suffix {1} of files referenced more than once
+            filename = cmds.referenceQuery(reference,
+                                           filename=True,
+                                           withoutCopyNumber=True)
+            namespace = cmds.referenceQuery(reference, namespace=True)
+            parent = cmds.referenceQuery(reference,
+                                         referenceNode=True,
+                                         parent=True)
+        except RuntimeError:
+            # Reference nodes without a file, e.g. left-overs of
+            # removed references
+            continue
+
+        namespaces[reference] = namespace.lstrip(":")
+        files[reference] = filename.replace("\\", "/")
+        parents[reference] = parent or None
+
+    referenced = cmds.ls(referencedNodes=True, long=True) or []
+    return ReferenceMap(namespaces, files, parents, referenced)
+
+
+def get_reference_map(context):
+    """Return the ReferenceMap of the scene
+
+    The map is stored in the "referenceMap" data of the context,
+    and read on first access.
+
+    """
+
+    refmap = context.data.get("referenceMap")
+    if refmap is None:
+        refmap = read_reference_map()
+        context.data["referenceMap"] = refmap
+    return refmap
+
+
+def _stat(path):
+    """Return (mtime, size) of `path`, None when missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime, stat.st_size]
+
+
+def read_file_metadata(filename):
+    """Return the resolved path and published source of `filename`
+
+    The source is read from the metadata published alongside the file,
+    limited to SOURCE_KEYS, and None for files that were not published.
+
+    """
+
+    path = os.path.realpath(os.path.expandvars(filename))
+    source = None
+
+    sidecar = os.path.join(os.path.dirname(path), SIDECAR)
+    if os.path.isfile(sidecar):
+        try:
+            with open(sidecar) as f:
+                metadata = json.load(f)
+        except ValueError:
+            metadata = None
+
+        if isinstance(metadata, dict):
+            source = dict((key, metadata[key]) for key in SOURCE_KEYS
+                          if key in metadata)
+
+    return {"path": path.replace("\\", "/"), "source": source}
+
+
+class ReferenceFileCache(object):
+    """Metadata of referenced files, stored on disk across sessions
+
+    Entries are keyed by filename and read again when the modification
+    time or size of the file, or of the metadata published alongside
+    it, changes.
+
+    Arguments:
+        path (str): Path to JSON file of cache
+
+    Example:
+        >> cache = ReferenceFileCache("/tmp/references.json")
+        >> cache.get("/assets/table/v001/table.ma")
+        {'path': '/assets/table/v001/table.ma', 'source': {..}}
+        >> cache.save()
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = dict()
+        self._changed = False
+
+        if os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    self._entries = json.load(f)
+            except ValueError:
+                # A corrupt cache is rebuilt
+                self._entries = dict()
+
+    def get(self, filename):
+        """Return the metadata of `filename`, read if not cached"""
+        path = os.path.expandvars(filename)
+        stat = _stat(path)
+        if stat is None:
+            # Missing files are not cached
+            return read_file_metadata(filename)
+
+        sidecar = _stat(os.path.join(os.path.dirname(path), SIDECAR))
+
+        entry = self._entries.get(filename)
+        if (entry is not None and
+                entry["stat"] == stat and
+                entry["sidecar"] == sidecar):
+            self.hits += 1
+            return entry["metadata"]
+
+        self.misses += 1
+        entry = {"stat": stat,
+                 "sidecar": sidecar,
+                 "metadata": read_file_metadata(filename)}
+        self._entries[filename] = entry
+        self._changed = True
+
+        return entry["metadata"]
+
+    def save(self):
+        """Write the cache to disk, if changed"""
+        if not self._changed:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        # Written under a temporary name, such that a concurrent publish
+        # never reads a partially written cache
+        temp = "{0}.{1}.tmp".format(self.path, os.getpid())
+        with open(temp, "w") as f:
+            json.dump(self._entries, f, indent=2, sort_keys=True)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rename(temp, self.path)
+
+        self._changed = False
+
+
+def get_file_cache(context):
+    """Return the ReferenceFileCache of the environment, if enabled
+
+    The cache is stored in the "referenceFileCache" data of the context.
+
+    """
+
+    if "referenceFileCache" not in context.data:
+        path = os.environ.get(CACHE_ENVIRONMENT)
+        cache = ReferenceFileCache(path) if path else None
+        context.data["referenceFileCache"] = cache
+    return context.data["referenceFileCache"]
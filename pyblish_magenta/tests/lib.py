@@ -3,6 +3,30 @@ import pyblish.api
 import pyblish_magenta
 
 
+def setup_maya():
+    """Set up Maya for the tests of a module"""
+    # Import pymel, as opposed to maya.standalone.initialise()
+    # due to pymel being imported after the fact causes the scene
+    # to erase itself and start fresh, in headless mode.
+    import pymel.core
+    pymel.core  # Avoid PEP08 warnings
+
+    import pyblish_maya
+    pyblish_maya.register_plugins()
+    pyblish_maya.register_host()
+
+
+def teardown_maya():
+    """Tear down Maya after the tests of a module"""
+    from maya import cmds
+
+    # Maya throws a segmentation fault unless
+    # we run the following little hack.
+    # https://goo.gl/4oTQ2d
+    cmds.file(new=True, force=True)
+    # os._exit(0)
+
+
 @contextlib.contextmanager
 def magenta_plugins():
     pyblish_magenta.register_plugins()
@@ -0,0 +1,76 @@
+import os
+
+from pyblish_magenta import alembic_export
+from pyblish_magenta.alembic_export import Job
+
+
+def _names(groups):
+    return [[job.name for job in group] for group in groups]
+
+
+def test_group_by_frame_range():
+    """Jobs of overlapping or adjacent frame ranges are grouped"""
+    jobs = [Job("late", "/late.abc", "", (101, 150)),
+            Job("hero", "/hero.abc", "", (1, 100)),
+            Job("still", "/still.abc", ""),
+            Job("inside", "/inside.abc", "", (10, 20)),
+            Job("insert", "/insert.abc", "", (152, 160))]
+
+    groups = alembic_export.group_by_frame_range(jobs)
+    assert _names(groups) == [["hero", "inside", "late"],
+                              ["insert"],
+                              ["still"]]
+
+
+def test_group_without_frame_range():
+    """Jobs without a frame range are grouped on their own"""
+    assert alembic_export.group_by_frame_range([]) == []
+
+    jobs = [Job("a", "/a.abc", ""), Job("b", "/b.abc", "")]
+    assert _names(alembic_export.group_by_frame_range(jobs)) == [["a", "b"]]
+
+
+def test_get_roots():
+    """Only the topmost nodes are roots, regardless of order"""
+    roots = alembic_export.get_roots(["|a|b|c", "|ab", "|a|b", "|d|e"])
+    assert sorted(roots) == sorted(["|a|b", "|ab", "|d|e"])
+
+
+def test_job_string():
+    """Callbacks of the monitor run before those of the job"""
+    job = Job("hero", "/hero.abc", "",
+              callbacks={"pythonPostJobCallback": "post()"})
+
+    assert job.job_string() == ('-pythonPostJobCallback post() '
+                                '-file "/hero.abc"')
+    assert job.job_string({"pythonPostJobCallback": "done()"}) == (
+        '-pythonPostJobCallback done();post() -file "/hero.abc"')
+
+
+def test_monitor():
+    """Frames are recorded per job, while monitored only"""
+    jobs = [Job("hero", os.devnull, "", (1, 2)),
+            Job("prop", os.devnull, "", (2, 2))]
+
+    with alembic_export.Monitor(jobs, stall_threshold=0) as monitor:
+        assert len(monitor.job_strings()) == 2
+        assert all(str(monitor.key) in string
+                   for string in monitor.job_strings())
+
+        alembic_export._frame(monitor.key, 0, 1.0)
+        alembic_export._frame(monitor.key, 0, 2.0)
+        alembic_export._frame(monitor.key, 1, 2.0)
+        alembic_export._done(monitor.key, 0)
+        alembic_export._done(monitor.key, 1)
+
+    # No longer monitored
+    alembic_export._frame(monitor.key, 0, 3.0)
+
+    hero, prop = monitor.stats
+    assert [frame for frame, _, _ in hero.frames] == [1.0, 2.0]
+    assert [frame for frame, _, _ in prop.frames] == [2.0]
+
+    # The first frame of the export is never stalled
+    assert hero.stall[0] == 2.0
+    assert prop.stall[0] == 2.0
+    assert hero.end is not None and prop.end is not None
@@ -0,0 +1,42 @@
+from nose.tools import assert_raises
+
+from pyblish_magenta import components
+
+
+def test_count():
+    """Counting components matches the flattened length"""
+    assert components.count([]) == 0
+    assert components.count(["mesh.vtx[0:1023]"]) == 1024
+    assert components.count(["mesh.map[5]", "mesh.map[7:9]"]) == 4
+
+
+def test_count_overlapping():
+    """Overlapping ranges are counted once"""
+    assert components.count(["mesh.vtx[0:9]", "mesh.vtx[5:14]"]) == 15
+
+
+def test_parse_per_node():
+    """Components are parsed per node and component type"""
+    parsed = components.parse(["a.vtx[0:3]", "b.vtx[1]", "a.e[2:3]"])
+
+    assert sorted(parsed) == [("a", "e"), ("a", "vtx"), ("b", "vtx")]
+    assert parsed[("a", "vtx")].intervals == [(0, 3)]
+
+
+def test_parse_invalid():
+    """Wildcards and multi-indexed components are not parsed"""
+    assert_raises(ValueError, components.parse_component, "mesh.vtx[*]")
+    assert_raises(ValueError, components.parse_component,
+                  "mesh.vtxFace[0][1]")
+
+
+def test_set_operations():
+    """Union, intersection and difference work without flattening"""
+    a = components.IntervalSet([(0, 9), (20, 29)])
+    b = components.IntervalSet([(5, 24)])
+
+    assert (a | b).intervals == [(0, 29)]
+    assert (a & b).intervals == [(5, 9), (20, 24)]
+    assert (a - b).intervals == [(0, 4), (25, 29)]
+    assert (b - a).intervals == [(10, 19)]
+    assert 25 in a and 15 not in a
@@ -0,0 +1,44 @@
+from pyblish_magenta import lib
+
+
+def test_membership():
+    """Members are found by path, their parents are not members"""
+    table = lib.DagPathTable()
+    paths = table.membership(["|a|b", "|c"])
+
+    assert "|a|b" in paths and "|c" in paths
+    assert "|a" not in paths
+    assert "|unknown" not in paths
+    assert len(paths) == 2
+
+
+def test_set_operations():
+    """Union, intersection and difference keep lookups and length"""
+    table = lib.DagPathTable()
+    a = table.membership(["|a|b", "|c"])
+    b = table.membership(["|c", "|d"])
+
+    assert sorted(a | b) == ["|a|b", "|c", "|d"]
+    assert len(a | b) == 3
+    assert sorted(a & b) == ["|c"]
+    assert "|c" not in a - b and "|a|b" in a - b
+    assert len(lib.DagPathSet(table)) == 0
+
+
+def test_subset():
+    """Sets built from indices match sets built from paths"""
+    table = lib.DagPathTable()
+    paths = table.membership(["|a|b", "|c"])
+    subset = table.subset([table.index("|c")])
+
+    assert subset == paths & subset
+    assert list(subset) == ["|c"]
+
+
+def test_unicode():
+    """Paths as returned by Maya, in unicode, are interned"""
+    table = lib.DagPathTable()
+    paths = table.membership([u"|a|b"])
+
+    assert "|a|b" in paths and u"|a|b" in paths
+    assert table.parent(u"|a|b") == "|a"
@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+
+from pyblish_magenta import extraction
+
+_root = None
+
+
+def setup():
+    global _root
+    _root = tempfile.mkdtemp()
+
+
+def teardown():
+    shutil.rmtree(_root)
+
+
+def _extracted(name, content):
+    """Write an extracted file `name` of `content`"""
+    path = os.path.join(_root, name)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_fetch_store():
+    """Stored files are fetched to any destination"""
+    cache = extraction.ExtractionCache(os.path.join(_root, "fetch"))
+    destination = os.path.join(_root, "fetched.abc")
+
+    assert not cache.fetch("a.abc", destination)
+    assert not os.path.exists(destination)
+
+    cache.store("a.abc", _extracted("a.abc", "first"))
+    assert cache.fetch("a.abc", destination)
+    assert _read(destination) == "first"
+
+    # Stored again, e.g. by a concurrent publish
+    cache.store("a.abc", _extracted("b.abc", "second"))
+    assert cache.fetch("a.abc", destination)
+    assert _read(destination) == "second"
+
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_evict():
+    """The least recently used files are evicted beyond the maximum size"""
+    cache = extraction.ExtractionCache(os.path.join(_root, "evict"),
+                                       max_size=6)
+
+    cache.store("a.abc", _extracted("a.abc", "aaa"))
+    os.utime(cache._path("a.abc"), (100, 100))
+    cache.store("b.abc", _extracted("b.abc", "bbb"))
+    os.utime(cache._path("b.abc"), (200, 200))
+
+    # Fetching "a" makes it the most recently used
+    assert cache.fetch("a.abc", os.path.join(_root, "fetched.abc"))
+    cache.store("c.abc", _extracted("c.abc", "ccc"))
+
+    assert cache.size() == 6
+    assert sorted(os.listdir(cache.path)) == ["a.abc", "c.abc"]
+
+
+def test_evict_ignores_temporary():
+    """Files being written by a concurrent publish are never evicted"""
+    cache = extraction.ExtractionCache(os.path.join(_root, "temporary"),
+                                       max_size=3)
+    cache.store("a.abc", _extracted("a.abc", "aaa"))
+
+    temp = cache._path("b.abc.1234.tmp")
+    with open(temp, "w") as f:
+        f.write("bbb")
+    cache.evict()
+
+    assert cache.size() == 3
+    assert os.path.exists(temp)
@@ -0,0 +1,80 @@
+import pyblish.api
+from nose.tools import with_setup
+from maya import cmds
+
+from pyblish_magenta import extraction
+
+from . import lib
+
+
+def setup():
+    lib.setup_maya()
+
+
+def teardown():
+    lib.teardown_maya()
+
+
+def initialise():
+    """For every test, clear the scene"""
+    cmds.file(new=True, force=True)
+
+
+class ExtractModel(pyblish.api.InstancePlugin):
+    def process(self, instance):
+        return "model"
+
+Original = ExtractModel
+
+
+class ExtractModel(pyblish.api.InstancePlugin):
+    def process(self, instance):
+        return "changed model"
+
+Changed = ExtractModel
+
+
+def _instance():
+    """Return an instance of a model, with its nodes"""
+    mesh = cmds.polyCube(name="ben_GEO")[0]
+    cmds.group(mesh, name="ben_GRP")
+
+    context = pyblish.api.Context()
+    instance = context.create_instance("ben")
+    instance[:] = cmds.ls("|ben_GRP", dag=True, long=True)
+    return instance
+
+
+@with_setup(initialise)
+def test_options():
+    """The fingerprint changes with the options of the exporter"""
+    instance = _instance()
+
+    fingerprint = extraction.fingerprint(
+        Original(), instance, "/ben.abc", "-frameRange 1 10")
+    assert fingerprint.endswith(".abc")
+    assert fingerprint == extraction.fingerprint(
+        Original(), instance, "/other/ben.abc", "-frameRange 1 10")
+    assert fingerprint != extraction.fingerprint(
+        Original(), instance, "/ben.abc", "-frameRange 1 20")
+
+
+@with_setup(initialise)
+def test_code():
+    """The fingerprint changes with the code of the extractor"""
+    instance = _instance()
+
+    assert (extraction.fingerprint(Original(), instance, "/ben.ma") !=
+            extraction.fingerprint(Changed(), instance, "/ben.ma"))
+
+
+@with_setup(initialise)
+def test_content():
+    """The fingerprint changes with the content of the instance"""
+    instance = _instance()
+    fingerprint = extraction.fingerprint(Original(), instance, "/ben.ma")
+
+    cmds.setAttr("|ben_GRP|ben_GEO.translateX", 1)
+    instance.context.data.pop("contentHashes", None)
+    assert fingerprint != extraction.fingerprint(
+        Original(), instance, "/ben.ma")
@@ -0,0 +1,81 @@
+import pyblish.api
+from nose.tools import with_setup
+from maya import cmds
+
+from pyblish_magenta import history
+
+from . import lib
+
+
+def setup():
+    lib.setup_maya()
+
+
+def teardown():
+    lib.teardown_maya()
+
+
+def initialise():
+    """For every test, clear the scene"""
+    cmds.file(new=True, force=True)
+
+
+def _list_history(nodes):
+    """Return the history of `nodes` as listed by Maya, with long names"""
+    nodes = cmds.ls(nodes, long=True)
+    listed = cmds.ls(cmds.listHistory(nodes) or [], long=True)
+    excluded = set(cmds.ls(listed, type=history.EXCLUDE_TYPES, long=True))
+    return sorted(set(nodes) | set(listed) - excluded)
+
+
+def _build_rig():
+    """Return the nodes of a skinned, constrained rig
+
+    The root joint is constrained to the control of another, animated,
+    rig, of which the parent is constrained in turn.
+
+    """
+
+    mesh = cmds.polyCube(name="ben_GEO")[0]
+    cmds.select(clear=True)
+    joint = cmds.joint(name="ben_JNT")
+    cmds.skinCluster(joint, mesh)
+    rig = cmds.group(mesh, joint, name="ben_GRP")
+
+    other = cmds.group(empty=True, name="other_GRP")
+    control = cmds.spaceLocator(name="other_CTL")[0]
+    control = cmds.parent(control, other)[0]
+    cmds.setKeyframe(control, attribute="translateX", time=1, value=0)
+    cmds.setKeyframe(control, attribute="translateX", time=10, value=5)
+    cmds.setKeyframe(control, attribute="scaleY", time=1, value=1)
+    driver = cmds.spaceLocator(name="driver_LOC")[0]
+    cmds.parentConstraint(driver, other)
+
+    cmds.parentConstraint(control, joint)
+
+    return cmds.ls(rig, dag=True, long=True)
+
+
+@with_setup(initialise)
+def test_constrained_rig():
+    """The history of a constrained rig matches that of listHistory"""
+    nodes = _build_rig()
+
+    graph = history.get_history_graph(pyblish.api.Context())
+    assert sorted(graph.history(nodes)) == _list_history(nodes)
+
+
+@with_setup(initialise)
+def test_shared_history():
+    """Histories sharing nodes read these once and match listHistory"""
+    nodes = _build_rig()
+    shapes = cmds.ls(nodes, type="mesh", long=True)
+    joints = cmds.ls(nodes, type="joint", long=True)
+
+    graph = history.get_history_graph(pyblish.api.Context())
+    assert sorted(graph.history(joints)) == _list_history(joints)
+
+    visited = graph.visited
+    assert sorted(graph.history(shapes)) == _list_history(shapes)
+    assert graph.reused > 0
+    assert graph.visited - visited < len(_list_history(shapes))
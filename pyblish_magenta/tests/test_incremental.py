@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+
+from pyblish_magenta import incremental
+
+_root = None
+
+
+def setup():
+    global _root
+    _root = tempfile.mkdtemp()
+
+
+def teardown():
+    shutil.rmtree(_root)
+
+
+class ValidateMesh(object):
+    version = (0, 1, 0)
+
+    @staticmethod
+    def get_invalid(instance):
+        return []
+
+Original = ValidateMesh
+
+
+class ValidateMesh(object):
+    version = (0, 1, 0)
+
+    @staticmethod
+    def get_invalid(instance):
+        return list(instance)
+
+Changed = ValidateMesh
+
+
+def test_least_recently_used():
+    """Results looked up are kept over results added before"""
+    cache = incremental.ValidationCache(os.devnull, max_entries=2)
+    cache.add("a")
+    cache.add("b")
+
+    assert "a" in cache
+    cache.add("c")
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_save():
+    """Results and their recency are read back in a new session"""
+    path = os.path.join(_root, "save", "validation.json")
+
+    cache = incremental.ValidationCache(path)
+    cache.add("a")
+    cache.add("b")
+    assert "a" in cache
+    cache.add("c")
+    cache.save()
+
+    cache = incremental.ValidationCache(path, max_entries=2)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+
+
+def test_lookup_not_saved():
+    """Looking up results alone does not write the cache"""
+    path = os.path.join(_root, "lookup.json")
+
+    cache = incremental.ValidationCache(path)
+    cache.add("a")
+    cache.save()
+    os.remove(path)
+
+    cache.add("a")
+    assert "a" in cache
+    cache.save()
+    assert not os.path.exists(path)
+
+    cache.add("b")
+    cache.save()
+    assert os.path.exists(path)
+
+
+def test_corrupt():
+    """A corrupt cache is rebuilt"""
+    path = os.path.join(_root, "corrupt.json")
+    with open(path, "w") as f:
+        f.write("{")
+
+    cache = incremental.ValidationCache(path)
+    assert len(cache) == 0
+
+
+def test_plugin_key():
+    """Results are keyed by the name, version and code of validators"""
+    original = incremental.plugin_key(Original())
+
+    assert original == incremental.plugin_key(Original())
+    assert original.startswith("ValidateMesh:0.1.0:")
+    assert original != incremental.plugin_key(Changed())
@@ -0,0 +1,71 @@
+import pyblish.api
+import pyblish.util
+from nose.tools import with_setup
+from maya import cmds
+
+from . import lib
+
+
+def setup():
+    lib.setup_maya()
+
+
+def teardown():
+    lib.teardown_maya()
+
+
+def initialise():
+    """For every test, clear the scene"""
+    cmds.file(new=True, force=True)
+
+
+def _create_instance(name, family, members):
+    """Create an _INST object set of `family` holding `members`"""
+    objset = cmds.sets(members, name=name + "_INST")
+    cmds.addAttr(objset, longName="family", dataType="string")
+    cmds.setAttr(objset + ".family", family, type="string")
+    return objset
+
+
+def _collect(name):
+    """Collect lazily, returning the instance called `name`"""
+    with lib.registered("CollectInstances"):
+        context = pyblish.util.select()
+
+    instance = next(i for i in context if i.data["name"] == name)
+    assert instance.data.get("dagPaths") is None
+    return instance
+
+
+def _plugin(name):
+    with lib.magenta_plugins():
+        return next(p for p in pyblish.api.discover() if p.__name__ == name)
+
+
+@with_setup(initialise)
+def test_no_animation_expands():
+    """Keyframes below the members of an unexpanded instance are found"""
+    mesh = cmds.polyCube(name="ben_GEO")[0]
+    cmds.group(mesh, name="ben_GRP")
+    cmds.setKeyframe(mesh, attribute="translateX", time=1, value=0)
+    _create_instance("ben", "model", ["|ben_GRP"])
+
+    instance = _collect("ben")
+    assert "|ben_GRP|ben_GEO" not in instance
+
+    plugin = _plugin("ValidateNoAnimation")
+    assert plugin.get_invalid(instance) == ["|ben_GRP|ben_GEO"]
+    assert "|ben_GRP|ben_GEO" in instance
+
+
+@with_setup(initialise)
+def test_default_camera_expands():
+    """Startup cameras below the members of an unexpanded instance are found"""
+    _create_instance("shot", "animation", ["|persp"])
+
+    instance = _collect("shot")
+    assert "|persp|perspShape" not in instance
+
+    plugin = _plugin("ValidateNoDefaultCameras")
+    assert plugin.get_invalid(instance) == ["|persp|perspShape"]
+    assert "|persp|perspShape" in instance
@@ -0,0 +1,73 @@
+import json
+import StringIO
+
+from nose.tools import assert_raises
+
+from pyblish_magenta import metadata
+
+
+def _shared():
+    return {"author": "marcus", "tags": ["model"], "source": {"topic": "ben"}}
+
+
+def test_layer():
+    """Writes go to the layer, the shared metadata is never altered"""
+    shared = _shared()
+    layered = metadata.LayeredMetadata(shared, {"subset": "default"})
+
+    layered["author"] = "roy"
+    layered["tags"].append("ben")
+    layered["source"]["topic"] = "table"
+
+    assert layered["author"] == "roy"
+    assert layered["tags"] == ["model", "ben"]
+    assert layered["source"] == {"topic": "table"}
+    assert layered["subset"] == "default"
+    assert shared == _shared()
+
+
+def test_copy_on_access():
+    """Mutable values are copied on first access only"""
+    shared = _shared()
+    layered = metadata.LayeredMetadata(shared)
+
+    assert layered.layer == {}
+    assert layered["tags"] is layered["tags"]
+    assert layered["tags"] is not shared["tags"]
+    assert "author" not in layered.layer
+
+
+def test_delete():
+    """Shared keys deleted in a layer are only missing from that layer"""
+    shared = _shared()
+    a = metadata.LayeredMetadata(shared, {"subset": "default"})
+    b = metadata.LayeredMetadata(shared)
+
+    del a["author"]
+    del a["subset"]
+
+    assert "author" not in a and "subset" not in a
+    assert_raises(KeyError, lambda: a["author"])
+    assert_raises(KeyError, a.__delitem__, "author")
+    assert sorted(a) == ["source", "tags"]
+    assert len(a) == 2
+
+    assert b["author"] == "marcus"
+    assert len(b) == 3
+
+    a["author"] = "roy"
+    assert a["author"] == "roy"
+
+
+def test_dump():
+    """Nested layers are written as their view"""
+    shared = _shared()
+    layered = metadata.LayeredMetadata(shared)
+    layered["author"] = "roy"
+    del layered["tags"]
+
+    f = StringIO.StringIO()
+    metadata.dump({"ben": layered}, f)
+
+    assert json.loads(f.getvalue()) == {
+        "ben": {"author": "roy", "source": {"topic": "ben"}}}
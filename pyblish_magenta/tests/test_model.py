@@ -14,10 +14,15 @@ log = logging.getLogger()
 
 def setup():
     """All these tests relate to 'ben' of family 'model'"""
+    lib.setup_maya()
     os.environ["TASK"] = "modeling"
     os.environ["ITEM"] = "ben"
 
 
+def teardown():
+    lib.teardown_maya()
+
+
 def initialise():
     """For every test, clear the scene"""
     cmds.file(new=True, force=True)
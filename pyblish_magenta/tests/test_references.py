@@ -0,0 +1,83 @@
+import os
+import json
+import shutil
+import tempfile
+
+from pyblish_magenta import references
+
+_root = None
+
+
+def setup():
+    global _root
+    _root = tempfile.mkdtemp()
+
+
+def teardown():
+    shutil.rmtree(_root)
+
+
+def _publish(name, source):
+    """Write a published file `name` with `source` metadata alongside"""
+    directory = os.path.join(_root, name)
+    os.makedirs(directory)
+
+    path = os.path.join(directory, name + ".ma")
+    with open(path, "w") as f:
+        f.write("//Maya ASCII scene")
+
+    with open(os.path.join(directory, references.SIDECAR), "w") as f:
+        json.dump(source, f)
+
+    return path.replace("\\", "/")
+
+
+def test_reference_of_nested_namespace():
+    """Nodes map onto the reference of their closest namespace"""
+    refmap = references.ReferenceMap(
+        namespaces={"tableRN": "table", "cupRN": "table:cup"},
+        files={"tableRN": "/table.ma", "cupRN": "/cup.ma"},
+        parents={"cupRN": "tableRN"},
+        referenced=["|table:top_GEO", "|table:top_GEO|table:cup:cup_GEO"])
+
+    assert refmap.reference("|table:top_GEO|table:cup:cup_GEO") == "cupRN"
+    assert refmap.references_of(["|table:top_GEO", "|persp"]) == ["tableRN"]
+    assert refmap.top_level() == ["tableRN"]
+
+
+def test_read_file_metadata():
+    """The source is read from the published metadata"""
+    path = _publish("table", {"author": "marcus", "topic": "table model",
+                              "references": []})
+
+    metadata = references.read_file_metadata(path)
+    assert metadata["source"] == {"author": "marcus",
+                                  "topic": "table model"}
+
+    unpublished = os.path.join(_root, "scratch.ma")
+    assert references.read_file_metadata(unpublished)["source"] is None
+
+
+def test_file_cache():
+    """Files are read once, until they change"""
+    path = _publish("chair", {"author": "marcus"})
+    cache_path = os.path.join(_root, "cache", "references.json")
+
+    cache = references.ReferenceFileCache(cache_path)
+    assert cache.get(path)["source"] == {"author": "marcus"}
+    cache.save()
+
+    # Read back in a new session
+    cache = references.ReferenceFileCache(cache_path)
+    assert cache.get(path)["source"] == {"author": "marcus"}
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    # Published again, the sidecar changes
+    sidecar = os.path.join(os.path.dirname(path), references.SIDECAR)
+    with open(sidecar, "w") as f:
+        json.dump({"author": "roy", "topic": "chair model"}, f)
+    os.utime(sidecar, (0, 0))
+
+    assert cache.get(path)["source"] == {"author": "roy",
+                                         "topic": "chair model"}
+    assert (cache.hits, cache.misses) == (1, 1)
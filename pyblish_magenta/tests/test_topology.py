@@ -0,0 +1,88 @@
+from pyblish_magenta import topology
+
+# Closed cube, with consistent winding
+CUBE = {
+    "counts": [4] * 6,
+    "indices": [0, 1, 2, 3,
+                4, 7, 6, 5,
+                0, 4, 5, 1,
+                1, 5, 6, 2,
+                2, 6, 7, 3,
+                3, 7, 4, 0]
+}
+
+
+def test_closed_mesh():
+    """A closed cube has no topology problems"""
+    result = topology.analyze(**CUBE)
+
+    assert len(result.edges) == 12
+    assert result.edge_faces.tolist() == [2] * 12
+    assert len(result.non_manifold_edges) == 0
+    assert len(result.non_manifold_vertices) == 0
+    assert len(result.lamina_faces) == 0
+    assert len(result.isolated_vertices) == 0
+
+
+def test_open_mesh():
+    """Border edges and vertices are manifold"""
+    result = topology.analyze([4, 4], [0, 1, 2, 3, 1, 4, 5, 2])
+
+    assert len(result.non_manifold_edges) == 0
+    assert len(result.non_manifold_vertices) == 0
+
+
+def test_non_manifold_edge():
+    """Edges shared by more than two faces are non-manifold"""
+    result = topology.analyze([3, 3, 3], [0, 1, 2, 1, 0, 3, 0, 1, 4])
+
+    edges = result.edges[result.non_manifold_edges].tolist()
+    assert edges == [[0, 1]]
+
+
+def test_non_manifold_vertex():
+    """Vertices shared by otherwise disconnected fans are non-manifold"""
+    result = topology.analyze([3, 3], [0, 1, 2, 0, 3, 4])
+
+    assert result.non_manifold_vertices.tolist() == [0]
+    assert len(result.non_manifold_edges) == 0
+
+
+def test_lamina_faces():
+    """Faces sharing all of their edges are lamina"""
+    result = topology.analyze([3, 3, 3], [0, 1, 2, 2, 1, 0, 2, 1, 3])
+
+    assert result.lamina_faces.tolist() == [0, 1]
+
+
+def test_isolated_vertices():
+    """Vertices without faces are isolated"""
+    result = topology.analyze(vertex_count=10, **CUBE)
+
+    assert result.isolated_vertices.tolist() == [8, 9]
+
+
+def test_uvs():
+    """Faces and vertices without UVs are reported"""
+    result = topology.analyze(uv_counts=[4, 0, 4, 4, 4, 0], **CUBE)
+    assert result.faces_without_uvs.tolist() == [1, 5]
+    assert len(result.vertices_without_uvs) == 0
+
+    result = topology.analyze(uv_counts=[4, 0, 0, 0, 0, 0], **CUBE)
+    assert result.vertices_without_uvs.tolist() == [4, 5, 6, 7]
+
+    result = topology.analyze(**CUBE)
+    assert result.faces_without_uvs is None
+
+
+def test_analyze_many():
+    """Meshes analyzed in a process pool match those analyzed in-process"""
+    meshes = [CUBE, {"counts": [3, 3], "indices": [0, 1, 2, 0, 3, 4]}]
+
+    serial = topology.analyze_many(meshes)
+    parallel = topology.analyze_many(meshes, processes=2)
+
+    for a, b in zip(serial, parallel):
+        assert a.edges.tolist() == b.edges.tolist()
+        assert (a.non_manifold_vertices.tolist() ==
+                b.non_manifold_vertices.tolist())
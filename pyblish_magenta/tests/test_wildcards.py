@@ -10,10 +10,15 @@ from . import lib
 
 def setup():
     """All these tests relate to 'ben' of family 'model'"""
+    lib.setup_maya()
     os.environ["TASK"] = "modeling"
     os.environ["ITEM"] = "ben"
 
 
+def teardown():
+    lib.teardown_maya()
+
+
 def initialise():
     """For every test, clear the scene"""
     cmds.file(new=True, force=True)
@@ -0,0 +1,269 @@
+"""Vectorised topology checks on raw mesh arrays
+
+Works from the face-vertex counts and face-vertex indices of a mesh, as
+returned by `MFnMesh.getVertices()`, and reports problems as arrays of
+indices instead of the (potentially huge) component lists returned by
+`polyInfo` and `polyListComponentConversion`.
+
+Edges are found by sorting the half-edges of all faces on a single key
+per edge, such that edges shared between faces end up next to each
+other, which makes every check a handful of NumPy operations regardless
+of the size of the mesh.
+
+This module requires NumPy, but not Maya.
+
+Example:
+    >>> # Two quads sharing a single edge
+    >>> result = analyze([4, 4], [0, 1, 2, 3, 1, 4, 5, 2])
+    >>> result.edges.tolist()
+    [[0, 1], [0, 3], [1, 2], [1, 4], [2, 3], [2, 5], [4, 5]]
+    >>> result.edge_faces.tolist()
+    [1, 1, 2, 1, 1, 1, 1]
+    >>> len(result.non_manifold_edges)
+    0
+
+"""
+
+import multiprocessing
+
+import numpy
+
+
+class Topology(object):
+    """Topology report of a single mesh
+
+    All problems are stored as sorted arrays of indices.
+
+    Attributes:
+        edges (numpy.ndarray): Unique edges as (N, 2) vertex indices,
+            with the lowest vertex index first.
+        edge_faces (numpy.ndarray): Amount of faces per edge
+        non_manifold_edges (numpy.ndarray): Indices into `edges` of edges
+            shared by more than two faces
+        non_manifold_vertices (numpy.ndarray): Vertices whose faces do not
+            form a single fan connected through manifold edges, such as the
+            vertex shared by two cones touching at their tip
+        lamina_faces (numpy.ndarray): Faces sharing all of their edges
+            with another face
+        isolated_vertices (numpy.ndarray): Vertices not used by any face
+        faces_without_uvs (numpy.ndarray): Faces without UVs, None when
+            no UV counts were given
+        vertices_without_uvs (numpy.ndarray): Vertices not part of any
+            face with UVs, None when no UV counts were given
+
+    """
+
+    def __init__(self, **kwargs):
+        self.edges = None
+        self.edge_faces = None
+        self.non_manifold_edges = None
+        self.non_manifold_vertices = None
+        self.lamina_faces = None
+        self.isolated_vertices = None
+        self.faces_without_uvs = None
+        self.vertices_without_uvs = None
+        self.__dict__.update(kwargs)
+
+
+def analyze(counts, indices, vertex_count=None, uv_counts=None):
+    """Return the Topology of a mesh
+
+    Arguments:
+        counts (sequence): Amount of vertices of each face
+        indices (sequence): Vertex indices of all faces, concatenated
+        vertex_count (int, optional): Amount of vertices in the mesh,
+            defaults to the highest index in use. Required to find
+            vertices not used by any face at the end of the vertex list.
+        uv_counts (sequence, optional): Amount of UVs of each face, as
+            returned by `MFnMesh.getAssignedUVs()`
+
+    """
+
+    counts = numpy.asarray(counts, dtype=numpy.int64)
+    indices = numpy.asarray(indices, dtype=numpy.int64)
+    assert counts.sum() == len(indices), (
+        "Face vertex counts do not match the amount of indices")
+
+    if vertex_count is None:
+        vertex_count = int(indices.max()) + 1 if len(indices) else 0
+
+    faces = numpy.repeat(numpy.arange(len(counts)), counts)
+    following = _following_corners(counts)
+
+    # Half-edges go from each face-vertex (corner) to the next one in
+    # its face. Degenerate edges, between a vertex and itself, are ignored.
+    corners = numpy.flatnonzero(indices != indices[following])
+    start = indices[corners]
+    end = indices[following[corners]]
+    low = numpy.minimum(start, end)
+    high = numpy.maximum(start, end)
+
+    # Sort half-edges such that those of the same edge are adjacent
+    keys = low * max(vertex_count, 1) + high
+    order = numpy.argsort(keys, kind="mergesort")
+    keys = keys[order]
+    corners = corners[order]
+    low = low[order]
+
+    first = numpy.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    groups = numpy.cumsum(first) - 1
+    group_starts = numpy.flatnonzero(first)
+    edge_faces = numpy.diff(numpy.append(group_starts, len(keys)))
+
+    edges = numpy.empty((len(group_starts), 2), dtype=numpy.int64)
+    edges[:, 0] = keys[group_starts] // max(vertex_count, 1)
+    edges[:, 1] = keys[group_starts] % max(vertex_count, 1)
+
+    result = Topology(
+        edges=edges,
+        edge_faces=edge_faces,
+        non_manifold_edges=numpy.flatnonzero(edge_faces > 2),
+        non_manifold_vertices=_non_manifold_vertices(
+            indices, following, corners, low, group_starts, edge_faces,
+            vertex_count),
+        lamina_faces=_lamina_faces(
+            counts, faces[corners], groups, edge_faces),
+        isolated_vertices=numpy.flatnonzero(
+            numpy.bincount(indices, minlength=vertex_count) == 0)
+    )
+
+    if uv_counts is not None:
+        has_uvs = numpy.asarray(uv_counts) > 0
+        with_uvs = numpy.zeros(vertex_count, dtype=bool)
+        with_uvs[indices[numpy.repeat(has_uvs, counts)]] = True
+
+        result.faces_without_uvs = numpy.flatnonzero(~has_uvs)
+        result.vertices_without_uvs = numpy.flatnonzero(~with_uvs)
+
+    return result
+
+
+def analyze_many(meshes, processes=None):
+    """Return the Topology of many meshes, optionally in parallel
+
+    Arguments:
+        meshes (list): Keyword arguments of `analyze()` per mesh
+        processes (int, optional): Amount of processes to spread the
+            meshes across, defaults to analyzing them in this process.
+
+    Example:
+        >>> triangle = {"counts": [3], "indices": [0, 1, 2]}
+        >>> [len(topology.edges) for topology in analyze_many([triangle])]
+        [3]
+
+    """
+
+    meshes = list(meshes)
+    if not processes or processes < 2 or len(meshes) < 2:
+        return [_analyze(kwargs) for kwargs in meshes]
+
+    pool = multiprocessing.Pool(min(processes, len(meshes)))
+    try:
+        return pool.map(_analyze, meshes)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _analyze(kwargs):
+    """Picklable wrapper of `analyze()` for multiprocessing"""
+    return analyze(**kwargs)
+
+
+def _following_corners(counts):
+    """Return the index of the next corner within the face of each corner"""
+    ends = numpy.cumsum(counts)
+    following = numpy.arange(1, ends[-1] + 1) if len(ends) else ends
+
+    # The last corner of each face wraps around to the first
+    used = counts > 0
+    following[ends[used] - 1] = (ends - counts)[used]
+    return following
+
+
+def _non_manifold_vertices(indices, following, half_edges, low,
+                           group_starts, edge_faces, vertex_count):
+    """Return vertices whose corners do not form a single connected fan
+
+    Corners (face-vertices) of the same vertex are connected through the
+    edges connecting exactly two faces. Connected corners are labeled by
+    propagating the lowest corner index, and any vertex with more than a
+    single label is non-manifold.
+
+    """
+
+    # Corners on either end of each manifold edge
+    manifold = group_starts[edge_faces == 2]
+    a, b = half_edges[manifold], half_edges[manifold + 1]
+
+    def corner_at(half_edge, vertex):
+        return numpy.where(indices[half_edge] == vertex,
+                           half_edge,
+                           following[half_edge])
+
+    vertex = low[manifold]
+    low_a, low_b = corner_at(a, vertex), corner_at(b, vertex)
+
+    # The corners at the high vertex are whichever are not at the low one
+    high_a = numpy.where(low_a == a, following[a], a)
+    high_b = numpy.where(low_b == b, following[b], b)
+
+    pairs_a = numpy.concatenate([low_a, high_a])
+    pairs_b = numpy.concatenate([low_b, high_b])
+
+    labels = numpy.arange(len(indices))
+    while True:
+        lowest = numpy.minimum(labels[pairs_a], labels[pairs_b])
+        propagated = labels.copy()
+        numpy.minimum.at(propagated, pairs_a, lowest)
+        numpy.minimum.at(propagated, pairs_b, lowest)
+        propagated = propagated[propagated]
+
+        if numpy.array_equal(propagated, labels):
+            break
+        labels = propagated
+
+    fans, _ = _group(indices * max(len(indices), 1) + labels)
+    fans = numpy.bincount(fans // max(len(indices), 1),
+                          minlength=vertex_count)
+    return numpy.flatnonzero(fans > 1)
+
+
+def _lamina_faces(counts, faces, groups, edge_faces):
+    """Return faces sharing all of their edges with a single other face
+
+    `faces` and `groups` are the face and edge of each sorted half-edge.
+
+    """
+
+    # Pair each half-edge with the others of the same edge
+    pairs = list()
+    for distance in range(1, int(edge_faces.max()) if len(edge_faces) else 1):
+        same = numpy.flatnonzero(groups[distance:] == groups[:-distance])
+        pairs.append((faces[same], faces[same + distance]))
+
+    if not pairs:
+        return numpy.empty(0, dtype=numpy.int64)
+
+    face = numpy.concatenate([a for a, b in pairs] + [b for a, b in pairs])
+    other = numpy.concatenate([b for a, b in pairs] + [a for a, b in pairs])
+    different = face != other
+    face, other = face[different], other[different]
+
+    # Amount of edges shared between each pair of faces
+    face_count = len(counts)
+    shared, amount = _group(face * face_count + other)
+    face, other = shared // face_count, shared % face_count
+
+    lamina = (amount == counts[face]) & (counts[face] == counts[other])
+    return numpy.unique(face[lamina])
+
+
+def _group(keys):
+    """Return the unique `keys` and the amount of each, by sorting"""
+    keys = numpy.sort(keys, kind="mergesort")
+    first = numpy.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    starts = numpy.flatnonzero(first)
+    return keys[starts], numpy.diff(numpy.append(starts, len(keys)))
@@ -0,0 +1,143 @@
+"""Bulk access to the local transformations of many nodes
+
+Reads the local matrix and the translate, rotate and scale channels of
+all transforms of an instance in a single pass through the API into
+(N, 16) and (N, 3) arrays, such that checks like "is this an identity
+matrix?" run as a single comparison over all transforms.
+
+NumPy is used when available, otherwise the same checks run over
+lists of tuples.
+
+Example:
+    >> table = TransformTable(["|ben_GRP", "|ben_GRP|ben_GEO"])
+    >> table.deviating("matrix", IDENTITY, tolerance=1e-6)
+    ['|ben_GRP|ben_GEO']
+    >> table.negative("scale")
+    []
+
+"""
+
+from . import lib
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+IDENTITY = (1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0)
+
+CHANNELS = {
+    "matrix": 16,
+    "translate": 3,
+    "rotate": 3,
+    "scale": 3
+}
+
+
+class TransformTable(object):
+    """Local transformations of `nodes`
+
+    Values are in Maya's internal units, e.g. rotations are in radians.
+
+    Arguments:
+        nodes (list): Long names of transforms
+
+    Attributes:
+        nodes (list): Long names of transforms, one per row
+        matrix (array): (N, 16) local matrices, as `xform(matrix=True)`
+        translate (array): (N, 3) translate channels
+        rotate (array): (N, 3) rotate channels
+        scale (array): (N, 3) scale channels
+
+    """
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+
+        values = dict((channel, list()) for channel in CHANNELS)
+        if self.nodes:
+            _read(self.nodes, values)
+
+        for channel, width in CHANNELS.items():
+            setattr(self, channel, _rows(values[channel], width))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def deviating(self, channel, values, tolerance=0.0):
+        """Return nodes with any value of `channel` not within `tolerance`
+
+        Arguments:
+            channel (str): Name of channel, e.g. "matrix" or "scale"
+            values (sequence): Expected values of the channel
+            tolerance (float): Allowed absolute difference
+
+        """
+
+        rows = getattr(self, channel)
+        if numpy is not None:
+            invalid = numpy.any(
+                numpy.abs(rows - numpy.asarray(values)) > tolerance, axis=1)
+            return [self.nodes[i] for i in numpy.flatnonzero(invalid)]
+
+        return [node for node, row in zip(self.nodes, rows)
+                if any(abs(a - b) > tolerance for a, b in zip(row, values))]
+
+    def negative(self, channel):
+        """Return nodes with any negative value in `channel`"""
+        rows = getattr(self, channel)
+        if numpy is not None:
+            invalid = numpy.any(rows < 0, axis=1)
+            return [self.nodes[i] for i in numpy.flatnonzero(invalid)]
+
+        return [node for node, row in zip(self.nodes, rows)
+                if any(value < 0 for value in row)]
+
+
+def _rows(values, width):
+    """Return flat `values` as rows of `width` values"""
+    if numpy is not None:
+        return numpy.array(values, dtype="float64").reshape(-1, width)
+    return [tuple(values[i:i + width]) for i in range(0, len(values), width)]
+
+
+def _read(nodes, values):
+    """Append the channels of all `nodes` to the lists in `values`"""
+    from maya.api import OpenMaya as om
+
+    selection = om.MSelectionList()
+    for node in nodes:
+        selection.add(node)
+
+    fn_transform = om.MFnTransform()
+    for i in range(len(nodes)):
+        fn_transform.setObject(selection.getDagPath(i))
+
+        plug = fn_transform.findPlug("matrix", False)
+        matrix = om.MFnMatrixData(plug.asMObject()).matrix()
+        values["matrix"].extend(matrix)
+
+        translate = fn_transform.translation(om.MSpace.kTransform)
+        rotate = fn_transform.rotation()
+        values["translate"].extend((translate.x, translate.y, translate.z))
+        values["rotate"].extend((rotate.x, rotate.y, rotate.z))
+        values["scale"].extend(fn_transform.scale())
+
+
+def get_transform_table(instance):
+    """Return the TransformTable of the transforms of `instance`
+
+    The table is stored in the "transformTable" data of the instance,
+    and read on first access.
+
+    """
+
+    table = instance.data.get("transformTable")
+    if table is None:
+        index = lib.get_scene_index(instance)
+        table = TransformTable(index.ls(type="transform"))
+        instance.data["transformTable"] = table
+    return table
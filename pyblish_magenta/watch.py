@@ -0,0 +1,417 @@
+"""Validate meshes in the background while the artist works
+
+Watch mode collects the instances of the scene once and registers
+callbacks on their meshes. Meshes whose topology, UV sets or attributes
+change are marked dirty. Meshes are known by their long names, so the
+membership of an instance is read again whenever DAG nodes are added,
+removed, renamed or reparented within its assemblies, or the members
+of its object set change. Instances of which the object set is deleted
+are no longer watched, and watching stops altogether when a new scene
+is created or opened.
+
+Memberships are read again, and dirty meshes are validated by the
+validators that support incremental validation, during idle time in
+slices that stay within a time budget, such that the results are cached
+and publishing mostly looks up passing results.
+See `pyblish_magenta.incremental`.
+
+Example:
+    >> from pyblish_magenta import watch
+    >> watch.start()
+    >> # Work, validating in the background
+    >> watch.stop()
+
+"""
+
+import time
+import logging
+import collections
+
+import pyblish.api
+import pyblish.util
+
+from . import lib, mesh, incremental
+
+log = logging.getLogger(__name__)
+
+# Seconds of validation per idle event, keeping interaction smooth
+BUDGET = 0.02
+
+# Attributes of meshes that do not affect incremental validators,
+# i.e. the positions of vertices
+IGNORED_ATTRIBUTES = ("pnts", "pntx", "pnty", "pntz",
+                      "vrts", "vrtx", "vrty", "vrtz")
+
+# Data of an instance that changes with the nodes in the scene
+_HIERARCHY_DATA = ("dagPaths", "sceneIndex",
+                   "transformTable", "bounds", "naming")
+
+_watcher = None
+
+
+class Watcher(object):
+    """Validate the dirty meshes of the instances of `context`
+
+    Arguments:
+        context (pyblish.api.Context): Collected context
+        plugins (list): Validators supporting incremental validation
+        budget (float, optional): Seconds of validation per idle event
+
+    """
+
+    def __init__(self, context, plugins, budget=BUDGET):
+        self.context = context
+        self.plugins = [plugin() for plugin in plugins]
+        self.budget = budget
+        self.cache = incremental.get_validation_cache(context)
+
+        if self.cache is None:
+            raise RuntimeError("Watch mode requires incremental validation, "
+                               "set %s" % incremental.CACHE_ENVIRONMENT)
+
+        # Dirty (instance, mesh), in the order they changed
+        self.queue = collections.OrderedDict()
+
+        # Instances of which the membership is read again
+        self.refreshing = collections.OrderedDict()
+
+        self._callbacks = list()
+        self._mesh_callbacks = dict()
+        self._set_callbacks = dict()
+
+        # Watched instances, their meshes and their assemblies
+        self._watched = collections.OrderedDict()
+        self._meshes = dict()
+        self._assemblies = dict()
+
+        # Instances of each watched mesh
+        self._instances = dict()
+
+        # Assemblies in which DAG nodes changed since the last idle event
+        self._changed = set()
+        self._idle = None
+
+    def start(self):
+        """Register callbacks and validate all meshes in the background"""
+        from maya.api import OpenMaya as om
+
+        for message in (om.MSceneMessage.kBeforeNew,
+                        om.MSceneMessage.kBeforeOpen):
+            self._callbacks.append(om.MSceneMessage.addCallback(
+                message, self._on_scene_changed))
+
+        self._callbacks.append(om.MDGMessage.addNodeAddedCallback(
+            self._on_node_changed, "dagNode"))
+        self._callbacks.append(om.MDGMessage.addNodeRemovedCallback(
+            self._on_node_changed, "dagNode"))
+        self._callbacks.append(om.MDGMessage.addNodeRemovedCallback(
+            self._on_set_removed, "objectSet"))
+        self._callbacks.append(om.MDagMessage.addAllDagChangesCallback(
+            self._on_dag_changed))
+        self._callbacks.append(om.MNodeMessage.addNameChangedCallback(
+            om.MObject.kNullObj, self._on_name_changed))
+
+        for instance in self.context:
+            self._watched[id(instance)] = instance
+            self._watch_set(instance)
+            self._watch(instance)
+
+    def stop(self):
+        """Remove all callbacks and store the results"""
+        from maya.api import OpenMaya as om
+
+        callbacks = list(self._callbacks)
+        callbacks.extend(self._set_callbacks.values())
+        for ids in self._mesh_callbacks.values():
+            callbacks.extend(ids)
+        if self._idle is not None:
+            callbacks.append(self._idle)
+
+        for callback in callbacks:
+            om.MMessage.removeCallback(callback)
+
+        self._callbacks = list()
+        self._mesh_callbacks = dict()
+        self._set_callbacks = dict()
+        self._idle = None
+
+        self.cache.save()
+
+    def _watch(self, instance):
+        """Watch the meshes of `instance`, marking unvalidated ones dirty"""
+        from maya.api import OpenMaya as om
+
+        meshes = lib.get_scene_index(instance).ls(type="mesh")
+        fingerprints = instance.data.get("fingerprints", {})
+
+        self._meshes[id(instance)] = meshes
+        self._assemblies[id(instance)] = lib.get_assembly_roots(
+            list(lib.get_dag_paths(instance)) +
+            instance.data.get("setMembers", []))
+
+        for node in meshes:
+            instances = self._instances.setdefault(node, list())
+            if instance not in instances:
+                instances.append(instance)
+
+            if node not in fingerprints:
+                self._mark(instance, node)
+
+            if node in self._mesh_callbacks:
+                continue
+
+            selection = om.MSelectionList()
+            selection.add(node)
+            self._mesh_callbacks[node] = self._register(
+                node, selection.getDependNode(0))
+
+    def _unwatch(self, instance):
+        """Stop watching the meshes of `instance`"""
+        for node in self._meshes.pop(id(instance), []):
+            instances = self._instances.get(node, [])
+            if instance in instances:
+                instances.remove(instance)
+            if not instances:
+                self._instances.pop(node, None)
+        self._assemblies.pop(id(instance), None)
+
+    def _watch_set(self, instance):
+        """Read the membership of `instance` again when its set changes"""
+        from maya.api import OpenMaya as om
+
+        objset = instance.data.get("objSetName")
+        if objset is None:
+            return
+
+        def on_changed(*args):
+            self.refreshing[id(instance)] = instance
+            self._schedule()
+
+        selection = om.MSelectionList()
+        selection.add(objset)
+        self._set_callbacks[id(instance)] = (
+            om.MObjectSetMessage.addSetMembersModifiedCallback(
+                selection.getDependNode(0), on_changed))
+
+    def _drop(self, instance):
+        """Stop watching `instance`, of which the object set is deleted"""
+        from maya.api import OpenMaya as om
+
+        log.info("%s no longer exists, stopped watching" % instance)
+
+        self._watched.pop(id(instance), None)
+        self.refreshing.pop(id(instance), None)
+        for key in [key for key in self.queue if key[0] == id(instance)]:
+            del self.queue[key]
+
+        callback = self._set_callbacks.pop(id(instance), None)
+        if callback is not None:
+            om.MMessage.removeCallback(callback)
+
+        self._unwatch(instance)
+        self._prune()
+
+    def _prune(self):
+        """Stop watching meshes no longer in any instance"""
+        from maya.api import OpenMaya as om
+
+        for node in list(self._mesh_callbacks):
+            if node not in self._instances:
+                for callback in self._mesh_callbacks.pop(node):
+                    om.MMessage.removeCallback(callback)
+
+    def _register(self, node, obj):
+        """Register the callbacks of mesh `node`, returning their ids"""
+        from maya.api import OpenMaya as om
+
+        def on_changed(*args):
+            self._on_mesh_changed(node)
+
+        def on_attribute_changed(message, plug, *args):
+            name = om.MFnAttribute(plug.attribute()).name
+            if name not in IGNORED_ATTRIBUTES:
+                self._on_mesh_changed(node)
+
+        return [
+            om.MPolyMessage.addPolyTopologyChangedCallback(obj, on_changed),
+            om.MPolyMessage.addUVSetChangedCallback(obj, on_changed),
+            om.MNodeMessage.addAttributeChangedCallback(
+                obj, on_attribute_changed)
+        ]
+
+    def _mark(self, instance, node):
+        """Queue `node` of `instance` for validation"""
+        self.queue[(id(instance), node)] = instance
+        self._schedule()
+
+    def _schedule(self):
+        """Register the idle callback, if not registered"""
+        from maya.api import OpenMaya as om
+
+        if self._idle is None:
+            self._idle = om.MEventMessage.addEventCallback("idle",
+                                                           self._on_idle)
+
+    def _on_scene_changed(self, *args):
+        # The instances are of the scene that is replaced
+        if _watcher is self:
+            stop()
+        else:
+            self.stop()
+
+    def _on_set_removed(self, node, *args):
+        from maya.api import OpenMaya as om
+
+        name = om.MFnDependencyNode(node).name()
+        for instance in list(self._watched.values()):
+            if instance.data.get("objSetName") == name:
+                self._drop(instance)
+
+    def _on_mesh_changed(self, node):
+        for instance in self._instances.get(node, []):
+            instance.data.get("fingerprints", {}).pop(node, None)
+            mesh.get_mesh_stats(instance).dirty([node])
+            self._mark(instance, node)
+
+    def _on_changed(self, *paths):
+        """Mark the assemblies of DAG `paths` as changed"""
+        self._changed.update(lib.get_assembly_roots(
+            path.fullPathName() for path in paths))
+        self._schedule()
+
+    def _on_node_changed(self, node, *args):
+        from maya.api import OpenMaya as om
+
+        self._on_changed(om.MDagPath.getAPathTo(node))
+
+    def _on_dag_changed(self, message, child, parent, *args):
+        # The parent is the former parent of a removed child, or the
+        # world, of which the child is an assembly
+        self._on_changed(child, parent)
+
+    def _on_name_changed(self, node, previous, *args):
+        from maya.api import OpenMaya as om
+
+        # Renaming a DAG node changes the long names of its descendants
+        if not node.hasFn(om.MFn.kDagNode):
+            return
+
+        path = om.MDagPath.getAPathTo(node)
+        if path.length() == 1:
+            # A renamed assembly is known by its previous name
+            self._changed.add("|" + previous)
+        self._on_changed(path)
+
+    def _collect_changes(self):
+        """Queue the instances within changed assemblies for refresh"""
+        if not self._changed:
+            return
+
+        # Descendants of changed assemblies are listed again
+        assemblies = self.context.data.get("assemblies", {})
+        for root in self._changed:
+            assemblies.pop(root, None)
+        self.context.data.pop("historyGraph", None)
+
+        for key, instance in self._watched.items():
+            if self._assemblies.get(key, set()) & self._changed:
+                self.refreshing[key] = instance
+
+        self._changed = set()
+
+    def _refresh(self, instance):
+        """Read the membership of `instance` again"""
+        from maya import cmds
+
+        objset = instance.data.get("objSetName")
+        if objset is not None and not cmds.objExists(objset):
+            self._drop(instance)
+            return
+
+        for key in _HIERARCHY_DATA:
+            instance.data.pop(key, None)
+
+        # Members may have been renamed or reparented
+        if objset is not None:
+            instance.data["setMembersChanged"] = True
+
+        self._unwatch(instance)
+        self._watch(instance)
+
+    def _on_idle(self, *args):
+        from maya.api import OpenMaya as om
+
+        start = time.time()
+
+        self._collect_changes()
+
+        # Memberships are read again first, a slice of instances at a
+        # time, as the queued meshes may have been renamed
+        refreshed = False
+        while self.refreshing and time.time() - start < self.budget:
+            _, instance = self.refreshing.popitem(last=False)
+            self._refresh(instance)
+            refreshed = True
+
+        if self.refreshing:
+            return
+
+        if refreshed:
+            self._prune()
+
+        while self.queue and time.time() - start < self.budget:
+            (_, node), instance = self.queue.popitem(last=False)
+            if node not in self._instances:
+                continue  # Removed from the scene
+
+            for plugin in self.plugins:
+                if not pyblish.api.instances_by_plugin([instance], plugin):
+                    continue
+
+                invalid, _ = incremental.validate(
+                    plugin, instance, [node], self.cache)
+                if invalid:
+                    log.warning("%s: %s is invalid" % (
+                        type(plugin).__name__, node))
+
+        if not self.queue and not self._changed:
+            om.MMessage.removeCallback(self._idle)
+            self._idle = None
+            self.cache.save()
+
+
+def _incremental_plugins():
+    """Return the registered validators supporting incremental validation"""
+    return [plugin for plugin in pyblish.api.discover()
+            if getattr(plugin, "incremental", False)]
+
+
+def start(context=None, budget=BUDGET):
+    """Start validating in the background
+
+    Arguments:
+        context (pyblish.api.Context, optional): Collected context,
+            defaults to collecting the current scene
+        budget (float, optional): Seconds of validation per idle event
+
+    """
+
+    global _watcher
+
+    stop()
+
+    if context is None:
+        context = pyblish.util.select()
+
+    _watcher = Watcher(context, _incremental_plugins(), budget)
+    _watcher.start()
+    return _watcher
+
+
+def stop():
+    """Stop validating in the background, if started"""
+    global _watcher
+
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
@@ -24,6 +24,6 @@ elif "nuke" in sys.executable.lower():
 
 if __name__ == "__main__":
     argv = sys.argv[:]
-    argv.extend(['--exclude=vendor', '--verbose'])
+    argv.extend(['--exclude=vendor', '--verbose', '--with-doctest'])
     nose.main(argv=argv)
     os._exit(0)